@@ -0,0 +1,24 @@
+# alloc_stats.py
+"""
+Surface 할당 카운터.
+Surface를 새로 만드는 곳(텍스트 렌더링, 패널 / 맵 타일 / 스프라이트 캐시, 아틀라스 등)이
+만들 때마다 count("종류")를 부름 → profiler가 프레임마다 늘어난 수를 할당 수로 보여줌.
+아무 모듈도 import하지 않음 (어디서 불러도 순환 import 없음). 끄고 켜는 것 없이 항상 셈
+(캐시 miss 때만 불리므로 비용은 무시할 만함)
+"""
+
+# 종류 -> 지금까지 만든 Surface 수
+_counts = {}
+
+
+def count(site: str, n: int = 1):
+    _counts[site] = _counts.get(site, 0) + n
+
+
+def total() -> int:
+    return sum(_counts.values())
+
+
+def snapshot() -> dict:
+    """종류별 누적 수 (복사본)"""
+    return dict(_counts)
@@ -0,0 +1,89 @@
+# animation.py
+
+
+class Clip:
+    """
+    프레임 이름(아틀라스 이름) 목록 + 초당 프레임 수.
+    loop=False면 끝 프레임에서 멈추고, 끝날 때까지 Animation.move()가 덮어쓰지 않음
+    """
+
+    __slots__ = ("frames", "fps", "loop")
+
+    def __init__(self, frames, fps: float = 8.0, loop: bool = True):
+        self.frames = list(frames)
+        self.fps = fps
+        self.loop = loop
+
+    @property
+    def duration(self) -> float:
+        return len(self.frames) / self.fps
+
+    def frame_at(self, t: float) -> str:
+        i = int(t * self.fps)
+        if self.loop:
+            return self.frames[i % len(self.frames)]
+        return self.frames[min(i, len(self.frames) - 1)]
+
+
+def player_clips(prefix: str, hit_time: float = 0.3):
+    """플레이어 동작들 (prefix: 아틀라스 크기 접두사, 예: "player48", hit_time: 피격 포즈 시간)"""
+    return {
+        "stand": Clip([f"{prefix}/stand"], 1),
+        "run_right": Clip([f"{prefix}/run_right", f"{prefix}/run_right2"], 6),
+        "run_left": Clip([f"{prefix}/run_left", f"{prefix}/run_left2"], 6),
+        "hit": Clip([f"{prefix}/hit"], 1 / hit_time, loop=False),
+    }
+
+
+def zombie_clips(prefix: str):
+    return {"walk": Clip([f"{prefix}/walk", f"{prefix}/walk2"], 3)}
+
+
+class Animation:
+    """
+    엔티티 하나의 애니메이션 상태: 지금 동작(clip) + 그 동작을 시작한 뒤 지난 시간.
+    그리는 건 아틀라스 한 장에서 frame 영역만 blit → 엔티티마다 Surface가 없음
+    move(dx, dy)로 이동 방향에 맞는 동작을 고름 (위/아래만 움직이면 마지막 좌우 방향 유지)
+    """
+
+    __slots__ = ("clips", "clip_name", "clip", "time", "facing")
+
+    def __init__(self, clips: dict, start: str = "stand", facing: str = "right"):
+        self.clips = clips
+        self.facing = facing
+        self.clip_name = None
+        self.play(start)
+
+    def play(self, name: str, restart: bool = False):
+        """name 동작으로 바꿈 (이미 그 동작이면 restart=True일 때만 처음부터)"""
+        if name == self.clip_name and not restart:
+            return
+        self.clip_name = name
+        self.clip = self.clips[name]
+        self.time = 0.0
+
+    @property
+    def busy(self) -> bool:
+        """한 번만 도는 동작(피격 등)이 아직 안 끝났는지"""
+        return not self.clip.loop and self.time < self.clip.duration
+
+    def move(self, dx: float, dy: float):
+        """이동 방향 → 서 있기 / 좌우 달리기"""
+        if dx > 0:
+            self.facing = "right"
+        elif dx < 0:
+            self.facing = "left"
+        if self.busy:
+            return
+        self.play("stand" if dx == 0 and dy == 0 else "run_" + self.facing)
+
+    def update(self, dt: float):
+        self.time += dt
+
+    @property
+    def frame(self) -> str:
+        """지금 그릴 아틀라스 프레임 이름"""
+        return self.clip.frame_at(self.time)
+
+    def draw(self, screen, atlas, pos):
+        return atlas.draw(screen, self.frame, pos)
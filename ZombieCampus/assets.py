@@ -0,0 +1,101 @@
+# assets.py
+import pygame
+import os
+import time
+
+import alloc_stats
+
+# 이미지 파일은 이 파일(assets.py)과 같은 폴더 기준
+ASSET_DIR = os.path.dirname(__file__)
+
+# (path, size, alpha) -> convert(_alpha) + scale 까지 끝난 Surface
+_images = {}
+# 캐시 키 -> 로드(디코딩/convert/scale)에 걸린 시간(초)
+_load_times = {}
+# path -> decode()에 걸린 시간(초). convert할 때 그 캐시 키의 로드 시간에 더해짐
+# (아틀라스 원본처럼 convert 없이 디코딩만 하는 것은 여기 남아 있음)
+_decode_times = {}
+
+
+def _resolve(path: str) -> str:
+    return os.path.join(ASSET_DIR, path)
+
+
+def load_image(path: str, size=None, alpha: bool = True) -> pygame.Surface:
+    """
+    이미지를 한 번만 읽어서 convert / scale 한 Surface를 돌려줌.
+    같은 (path, size, alpha)로 다시 부르면 캐시된 Surface를 그대로 리턴.
+    size=None 이면 원본 크기. display.set_mode() 이후에 호출해야 함.
+    리턴된 Surface는 공유되므로 직접 수정하지 말 것.
+    """
+    size = tuple(size) if size is not None else None
+    key = (path, size, alpha)
+    surf = _images.get(key)
+    if surf is not None:
+        return surf
+
+    alloc_stats.count("image")
+    if size is None:
+        surf = _convert(key, decode(path))
+    else:
+        # 원본(디코딩된 것)도 캐시에 남겨서 다른 크기 요청 때 재사용
+        base = load_image(path, None, alpha)
+        start = time.perf_counter()
+        surf = pygame.transform.scale(base, size)
+        _load_times[key] = time.perf_counter() - start
+
+    _images[key] = surf
+    return surf
+
+
+def _convert(key, raw: pygame.Surface) -> pygame.Surface:
+    """raw를 convert(_alpha)하고 디코딩 + convert 시간을 key의 로드 시간으로 기록"""
+    path, _, alpha = key
+    start = time.perf_counter()
+    surf = raw.convert_alpha() if alpha else raw.convert()
+    _load_times[key] = _decode_times.pop(path, 0.0) + time.perf_counter() - start
+    return surf
+
+
+def decode(path: str) -> pygame.Surface:
+    """
+    파일 읽기 + PNG 디코딩만 (convert 안 함).
+    display와 상관없어서 백그라운드 스레드에서 불러도 됨 (preloader.py, atlas.py)
+    """
+    start = time.perf_counter()
+    raw = pygame.image.load(_resolve(path))
+    _decode_times[path] = time.perf_counter() - start
+    return raw
+
+
+def install(path: str, raw: pygame.Surface, size=None, alpha: bool = True) -> pygame.Surface:
+    """
+    다른 스레드에서 decode()해 둔 raw를 convert해서 캐시에 넣음 (메인 스레드에서 호출).
+    이후 load_image(path, size, alpha)는 파일을 다시 읽지 않음
+    """
+    key = (path, None, alpha)
+    if key not in _images:
+        alloc_stats.count("image")
+        _images[key] = _convert(key, raw)
+    return load_image(path, size, alpha)
+
+
+def load_times() -> dict:
+    """
+    에셋별 로드 시간(초). 키는 (path, size, alpha).
+    convert 없이 디코딩만 한 파일(아틀라스 원본 등)은 alpha가 None
+    """
+    times = {(path, None, None): sec for path, sec in list(_decode_times.items())}
+    times.update(_load_times)
+    return times
+
+
+def report_load_times():
+    """로드 시간을 오래 걸린 순으로 출력"""
+    total = 0.0
+    kinds = {True: "alpha", False: "opaque", None: "raw"}
+    for (path, size, alpha), sec in sorted(load_times().items(), key=lambda kv: -kv[1]):
+        total += sec
+        size_str = "원본" if size is None else f"{size[0]}x{size[1]}"
+        print(f"{path:<24} {size_str:>10} {kinds[alpha]:>6}  {sec * 1000:7.2f} ms")
+    print(f"{'합계':<24} {total * 1000:25.2f} ms")
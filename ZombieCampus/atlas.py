@@ -0,0 +1,206 @@
+# atlas.py
+import json
+import os
+
+import pygame
+
+import alloc_stats
+import assets
+
+# 이미지 / 캐시 파일은 이 파일(atlas.py)과 같은 폴더 기준 (assets.ASSET_DIR과 같음)
+ATLAS_DIR = os.path.dirname(__file__)
+ATLAS_IMAGE = "sprite_atlas.png"
+ATLAS_MANIFEST = "sprite_atlas.json"
+_FORMAT_VERSION = 1
+ATLAS_WIDTH = 1024
+PADDING = 1   # 프레임 사이 여백 (확대할 때 옆 프레임 픽셀이 번지지 않게)
+
+# 캐릭터 프레임: 프레임 이름 -> (원본 파일, 좌우 반전)
+# 반대 방향 달리기 이미지를 뒤집으면 다리가 반대인 프레임 → 두 장짜리 걷기 동작
+PLAYER_FRAMES = {
+    "stand": ("player_stand.png", False),
+    "run_right": ("player_run_right.png", False),
+    "run_right2": ("player_run_left.png", True),
+    "run_left": ("player_run_left.png", False),
+    "run_left2": ("player_run_right.png", True),
+    "hit": ("player_attack.png", False),   # 맞고 움찔하는 포즈
+}
+ZOMBIE_FRAMES = {
+    "walk": ("zombie.png", False),
+    "walk2": ("zombie.png", True),        # 정면 그림이라 뒤집으면 뒤뚱거리는 걸음
+}
+
+# 아틀라스에 넣을 것: (이름 접두사, 프레임 표, 크기)
+# 월드 플레이어 48px / 건물 안 플레이어 100px / 건물 안 좀비 120px
+ATLAS_SHEETS = [
+    ("player48", PLAYER_FRAMES, (48, 48)),
+    ("player100", PLAYER_FRAMES, (100, 100)),
+    ("zombie120", ZOMBIE_FRAMES, (120, 120)),
+]
+
+
+def atlas_entries(sheets=ATLAS_SHEETS):
+    """[(아틀라스 이름 "접두사/프레임", 원본 파일, 크기, 좌우 반전), ...]"""
+    return [(f"{prefix}/{frame}", path, tuple(size), flip)
+            for prefix, frames, size in sheets
+            for frame, (path, flip) in frames.items()]
+
+
+class TextureAtlas:
+    """
+    여러 스프라이트 프레임을 한 장에 모은 텍스처.
+    - rects[이름] = 아틀라스 안의 영역 → screen.blit(atlas.surface, pos, rect)로 그림
+    - 프레임마다 Surface를 따로 만들지 않음 (필요하면 subsurface(이름), 메모리 공유)
+    - 같은 프레임을 수백 번 찍을 때(좀비 떼)는 rle_frame(이름): RLE 압축한 복사본이라
+      투명한 부분을 건너뛰어서 알파 blit이 빠름
+    """
+
+    def __init__(self, surface: pygame.Surface, rects: dict):
+        self.surface = surface
+        self.rects = {name: pygame.Rect(r) for name, r in rects.items()}
+        self._subsurfaces = {}
+        self._rle_frames = {}
+
+    def rect(self, name: str) -> pygame.Rect:
+        return self.rects[name]
+
+    def names(self, prefix: str = ""):
+        return [name for name in self.rects if name.startswith(prefix)]
+
+    def subsurface(self, name: str) -> pygame.Surface:
+        """name 프레임을 가리키는 Surface (픽셀은 아틀라스와 공유, 캐시됨)"""
+        surf = self._subsurfaces.get(name)
+        if surf is None:
+            alloc_stats.count("atlas")
+            surf = self.surface.subsurface(self.rects[name])
+            self._subsurfaces[name] = surf
+        return surf
+
+    def rle_frame(self, name: str) -> pygame.Surface:
+        """
+        name 프레임의 RLE 가속 복사본 (캐시됨).
+        아틀라스 자체는 RLE로 만들지 않음 (SDL이 원본 픽셀을 버려서 subsurface가 깨짐)
+        """
+        surf = self._rle_frames.get(name)
+        if surf is None:
+            alloc_stats.count("atlas")
+            surf = self.surface.subsurface(self.rects[name]).copy()
+            surf.set_alpha(255, pygame.RLEACCEL)
+            self._rle_frames[name] = surf
+        return surf
+
+    def convert(self):
+        """
+        display가 있으면 convert_alpha (메인 스레드에서).
+        assets.install로 해서 로드 시간 보고(--asset-times)에 아틀라스도 나옴
+        """
+        if pygame.display.get_surface():
+            self.surface = assets.install(ATLAS_IMAGE, self.surface)
+            self._subsurfaces.clear()
+            self._rle_frames.clear()
+        return self
+
+    def draw(self, screen, name: str, pos):
+        return screen.blit(self.surface, pos, self.rects[name])
+
+
+# ─────────────────────────────
+# 만들기 (선반 방식 패킹)
+# ─────────────────────────────
+def _pack(sizes, width: int):
+    """
+    sizes: {이름: (w, h)} → ({이름: (x, y, w, h)}, 전체 높이)
+    높은 것부터 한 줄(선반)씩 왼쪽에서 오른쪽으로 채움
+    """
+    rects = {}
+    x = y = shelf_h = 0
+    for name, (w, h) in sorted(sizes.items(), key=lambda kv: (-kv[1][1], kv[0])):
+        if x + w > width:
+            x, y = 0, y + shelf_h + PADDING
+            shelf_h = 0
+        rects[name] = (x, y, w, h)
+        x += w + PADDING
+        shelf_h = max(shelf_h, h)
+    return rects, y + shelf_h
+
+
+def build_atlas(entries, width: int = ATLAS_WIDTH) -> TextureAtlas:
+    """원본 이미지들을 읽어 크기 맞추고(뒤집고) 한 장으로 패킹. display 없이 동작"""
+    sources = {}
+    for _, path, _, _ in entries:
+        if path not in sources:
+            sources[path] = assets.decode(path)
+
+    alloc_stats.count("atlas", len(sources) + len(entries) + 1)
+    rects, height = _pack({name: size for name, _, size, _ in entries}, width)
+    surface = pygame.Surface((width, max(1, height)), pygame.SRCALPHA)
+    for name, path, size, flip in entries:
+        frame = pygame.transform.scale(sources[path], size)
+        if flip:
+            frame = pygame.transform.flip(frame, True, False)
+        # 빈(투명) 바탕에 MAX로 찍으면 반투명 픽셀도 알파 섞임 없이 그대로 복사됨
+        surface.blit(frame, rects[name][:2], special_flags=pygame.BLEND_RGBA_MAX)
+    return TextureAtlas(surface, rects)
+
+
+def _source_stamps(entries):
+    stamps = {}
+    for _, path, _, _ in entries:
+        st = os.stat(os.path.join(ATLAS_DIR, path))
+        stamps[path] = [st.st_mtime_ns, st.st_size]
+    return stamps
+
+
+def prepare_atlas(entries=None, use_cache: bool = True) -> TextureAtlas:
+    """
+    캐시(sprite_atlas.png + .json)가 프레임 목록 / 원본 파일과 맞으면 그걸 읽고,
+    아니면 새로 만들어서 캐시에 저장. convert는 안 함 → 백그라운드 스레드에서 불러도 됨
+    (큰 원본 zombie.png 디코딩 대신 작은 아틀라스 한 장만 읽음)
+    """
+    entries = atlas_entries() if entries is None else entries
+    image_path = os.path.join(ATLAS_DIR, ATLAS_IMAGE)
+    manifest_path = os.path.join(ATLAS_DIR, ATLAS_MANIFEST)
+    key = {
+        "version": _FORMAT_VERSION,
+        "entries": [[name, path, list(size), flip] for name, path, size, flip in entries],
+        "sources": _source_stamps(entries),
+    }
+
+    if use_cache:
+        try:
+            with open(manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+            if {k: manifest.get(k) for k in key} == key:
+                return TextureAtlas(assets.decode(ATLAS_IMAGE), manifest["rects"])
+        except (OSError, ValueError, pygame.error):
+            pass
+
+    atlas = build_atlas(entries)
+    if use_cache:
+        # 캐시는 있으면 좋은 것이라 못 쓰면(읽기 전용 폴더 등) 그냥 넘어감
+        try:
+            pygame.image.save(atlas.surface, image_path)
+            with open(manifest_path, "w", encoding="utf-8") as f:
+                json.dump({**key, "rects": {n: list(r) for n, r in atlas.rects.items()}},
+                          f, ensure_ascii=False)
+        except (OSError, pygame.error):
+            pass
+    return atlas
+
+
+# 게임 전체가 같이 쓰는 아틀라스 (install_atlas / get_atlas)
+_atlas = None
+
+
+def install_atlas(atlas: TextureAtlas) -> TextureAtlas:
+    """prepare_atlas() 결과를 convert해서 공용 아틀라스로 (메인 스레드에서)"""
+    global _atlas
+    _atlas = atlas.convert()
+    return _atlas
+
+
+def get_atlas() -> TextureAtlas:
+    """공용 아틀라스. 아직 없으면 지금 바로 만듦 (preloader 없이 쓸 때)"""
+    if _atlas is None:
+        install_atlas(prepare_atlas())
+    return _atlas
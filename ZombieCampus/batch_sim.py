@@ -0,0 +1,246 @@
+# batch_sim.py
+"""
+건물 밸런스용 헤드리스 배치 시뮬레이터 (창 / pygame 없음).
+시드마다 한 판씩 BuildingSim을 봇 정책으로 돌리고, 여러 프로세스에 나눠서
+생존 시간 / HP 손실 통계를 모음.
+
+    python batch_sim.py --runs 2000                          # 모든 건물 x 모든 정책
+    python batch_sim.py --building 미래관 --policy flee --zombie-speed 150 --hit-damage 15
+    python batch_sim.py --runs 500 --workers 1               # 한 프로세스 (비교 / 프로파일링용)
+    python batch_sim.py --out balance.json                   # 결과 JSON 저장
+
+같은 시드 + 같은 설정이면 몇 개 프로세스로 돌리든 판마다 결과가 같음.
+"""
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from building_sim import (BuildingSim, PLAYER_SIZE, ZOMBIE_SIZE, PLAYER_SPEED, ZOMBIE_SPEED,
+                          HIT_DAMAGE)
+
+STEP_DT = 1.0 / 60
+START_HP = 100
+# 워커 프로세스의 건물별 흐름장 캐시 크기 (게임은 64). 판이 계속 이어지니 크게 잡아서
+# 봇이 돌아다닌 칸의 흐름장을 다음 판에서도 재사용 (흐름장 하나 ≈ 50KB)
+FLOW_FIELD_CACHE = 1024
+# 건물 목록은 캠퍼스 맵 데이터에서 (pygame 없이 JSON만 읽음)
+CAMPUS_MAP = os.path.join(os.path.dirname(os.path.abspath(__file__)), "campus_map.json")
+
+
+# ─────────────────────────────
+# 봇 정책: make(rng) → policy(sim) → (dx, dy)
+# ─────────────────────────────
+def _idle(rng):
+    """가만히 있기 (기준선)"""
+    return lambda sim: (0, 0)
+
+
+def _walk(rng):
+    """벤치마크와 같은 오른쪽 → 아래 → 왼쪽 → 위 반복 (초 단위)"""
+    script = ((1.5, (1, 0)), (1.0, (0, 1)), (1.5, (-1, 0)), (1.0, (0, -1)))
+    period = sum(t for t, _ in script)
+
+    def policy(sim):
+        t = sim.elapsed % period
+        for duration, move in script:
+            if t < duration:
+                return move
+            t -= duration
+        return 0, 0
+    return policy
+
+
+def _random(rng):
+    """0.5초마다 8방향 + 정지 중 하나를 무작위로"""
+    state = {"until": 0.0, "move": (0, 0)}
+
+    def policy(sim):
+        if sim.elapsed >= state["until"]:
+            state["until"] = sim.elapsed + 0.5
+            state["move"] = (int(rng.integers(-1, 2)), int(rng.integers(-1, 2)))
+        return state["move"]
+    return policy
+
+
+def _flee(rng, radius: float = 450.0):
+    """
+    가까운 좀비들(거리 제곱에 반비례)에서 멀어지는 쪽으로.
+    화면 가장자리에 몰리면 가운데 쪽으로 당김 (구석에 갇히지 않게)
+    """
+    half_p, half_z = PLAYER_SIZE / 2, ZOMBIE_SIZE / 2
+
+    def policy(sim):
+        center = np.array((sim.player_x + half_p, sim.player_y + half_p))
+        away = center - (sim.horde.pos + half_z)
+        d2 = np.einsum("ij,ij->i", away, away)
+        near = d2 < radius * radius
+        push = (away[near] / np.maximum(d2[near], 1.0)[:, None]).sum(axis=0) * radius
+
+        to_mid = np.array((sim.width / 2, sim.height / 2)) - center
+        push += to_mid / max(sim.width, sim.height)
+
+        length = np.hypot(*push)
+        if length < 1e-3:
+            return 0, 0
+        # 8방향으로 양자화 (게임 입력처럼 -1 / 0 / 1)
+        return tuple(int(v) for v in np.round(push / length * 1.2).clip(-1, 1))
+    return policy
+
+
+POLICIES = {
+    "idle": _idle,
+    "walk": _walk,
+    "random": _random,
+    "flee": _flee,
+}
+
+
+# ─────────────────────────────
+# 한 판 / 여러 판 (워커 프로세스 안에서 돎)
+# ─────────────────────────────
+def run_episode(building: str, policy_name: str, seed: int, max_time: float = 60.0, **params):
+    """
+    한 판 진행. 죽거나 max_time초가 지나면 끝.
+    params: BuildingSim 밸런스 인자 (player_speed, zombie_speed, hit_damage, zombie_count)
+    """
+    horde_seed, policy_seed = np.random.SeedSequence(seed).spawn(2)
+    sim = BuildingSim(building, START_HP, rng=np.random.default_rng(horde_seed), **params)
+    sim.nav.max_fields = max(sim.nav.max_fields, FLOW_FIELD_CACHE)
+    policy = POLICIES[policy_name](np.random.default_rng(policy_seed))
+
+    steps = int(round(max_time / STEP_DT))
+    for _ in range(steps):
+        dx, dy = policy(sim)
+        sim.step(STEP_DT, dx, dy)
+        if sim.dead:
+            break
+
+    return {
+        "building": building,
+        "policy": policy_name,
+        "seed": seed,
+        "survival_time": sim.elapsed,
+        "hp_lost": START_HP - sim.hp,
+        "hits": sim.hits_taken,
+        "died": sim.dead,
+    }
+
+
+def _run_chunk(jobs, max_time, params):
+    """워커 하나가 여러 판을 한 번에 (프로세스 간 왕복 횟수 줄이기)"""
+    return [run_episode(building, policy, seed, max_time, **params)
+            for building, policy, seed in jobs]
+
+
+def run_batch(jobs, workers: int = None, max_time: float = 60.0, **params):
+    """
+    jobs: [(건물, 정책, 시드), ...] → 판별 결과 리스트 (jobs 순서 그대로)
+    workers=1이면 풀 없이 이 프로세스에서 바로 돎
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return _run_chunk(jobs, max_time, params)
+
+    # 워커마다 몇 덩어리씩 (판 길이가 제각각이라 너무 크게 자르면 끝에 한 워커만 남음)
+    size = max(1, len(jobs) // (workers * 4))
+    chunks = [jobs[i:i + size] for i in range(0, len(jobs), size)]
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk in pool.map(_run_chunk, chunks, [max_time] * len(chunks),
+                              [params] * len(chunks)):
+            results.extend(chunk)
+    return results
+
+
+# ─────────────────────────────
+# 통계
+# ─────────────────────────────
+def summarize(results):
+    """(건물, 정책)별 생존 시간 / HP 손실 통계"""
+    groups = {}
+    for r in results:
+        groups.setdefault((r["building"], r["policy"]), []).append(r)
+
+    summary = {}
+    for (building, policy), runs in groups.items():
+        survival = np.array([r["survival_time"] for r in runs])
+        hp_lost = np.array([r["hp_lost"] for r in runs])
+        summary[f"{building}/{policy}"] = {
+            "runs": len(runs),
+            "death_rate": float(np.mean([r["died"] for r in runs])),
+            "survival_mean": float(survival.mean()),
+            "survival_p10": float(np.percentile(survival, 10)),
+            "survival_p50": float(np.percentile(survival, 50)),
+            "survival_p90": float(np.percentile(survival, 90)),
+            "hp_lost_mean": float(hp_lost.mean()),
+            "hits_mean": float(np.mean([r["hits"] for r in runs])),
+        }
+    return summary
+
+
+def print_summary(summary, max_time: float):
+    print(f"{'건물/정책':<16} {'판':>5} {'사망률':>7} {'생존 p10':>9} {'p50':>7} {'p90':>7}"
+          f" {'HP 손실':>8}")
+    for name, s in summary.items():
+        print(f"{name:<16} {s['runs']:5d} {s['death_rate']:7.1%} {s['survival_p10']:9.1f}"
+              f" {s['survival_p50']:7.1f} {s['survival_p90']:7.1f} {s['hp_lost_mean']:8.1f}")
+    print(f"(생존 시간은 초, 최대 {max_time:g}초)")
+
+
+def campus_buildings(path: str = CAMPUS_MAP):
+    """맵 파일의 건물 이름 (등록 순서)"""
+    with open(path, encoding="utf-8") as f:
+        return list(json.load(f)["buildings"])
+
+
+def main(argv=None):
+    buildings = campus_buildings()
+    parser = argparse.ArgumentParser(description="Zombie Campus 건물 밸런스 배치 시뮬레이터")
+    parser.add_argument("--runs", type=int, default=200, help="(건물, 정책) 조합마다 판 수")
+    parser.add_argument("--building", action="append", help="건물 (여러 번 지정 가능, 기본은 전부)")
+    parser.add_argument("--policy", choices=sorted(POLICIES), action="append",
+                        help="봇 정책 (여러 번 지정 가능, 기본은 전부)")
+    parser.add_argument("--seed", type=int, default=0, help="첫 시드 (판마다 1씩 증가)")
+    parser.add_argument("--max-time", type=float, default=60.0, help="한 판 최대 시간(초)")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본은 코어 수)")
+    parser.add_argument("--player-speed", type=float, default=PLAYER_SPEED)
+    parser.add_argument("--zombie-speed", type=float, default=ZOMBIE_SPEED)
+    parser.add_argument("--hit-damage", type=int, default=HIT_DAMAGE)
+    parser.add_argument("--zombie-count", type=int, default=None, help="기본은 건물별 값")
+    parser.add_argument("--out", help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    jobs = [(building, policy, args.seed + i)
+            for building in (args.building or buildings)
+            for policy in (args.policy or sorted(POLICIES))
+            for i in range(args.runs)]
+    params = {
+        "player_speed": args.player_speed,
+        "zombie_speed": args.zombie_speed,
+        "hit_damage": args.hit_damage,
+        "zombie_count": args.zombie_count,
+    }
+
+    start = time.perf_counter()
+    results = run_batch(jobs, args.workers, args.max_time, **params)
+    elapsed = time.perf_counter() - start
+
+    summary = summarize(results)
+    print_summary(summary, args.max_time)
+    sim_time = sum(r["survival_time"] for r in results)
+    print(f"\n{len(results)}판, {elapsed:.1f}초 ({len(results) / elapsed:.1f}판/s,"
+          f" 시뮬레이션 {sim_time / elapsed:.0f}배속)")
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump({"params": params, "max_time": args.max_time, "summary": summary,
+                       "runs": results}, f, indent=2, ensure_ascii=False)
+        print(f"결과 저장: {os.path.abspath(args.out)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+# bench_spatial.py
+"""
+공간 인덱스(GridIndex) 벤치마크: 에이전트 수에 따른 프레임당 비용 측정.
+밀도를 일정하게 유지하도록 N에 따라 영역 크기를 키움 (화면 1200x800에 DENSITY 마리 기준)
+게임(Horde)이 쓰는 질의 두 가지를 인덱스 없는 방법과 비교
+
+1) 밀어내기: 한 프레임 = 모든 에이전트 이동 + 에이전트마다 주변 3x3 칸 안 에이전트 수 / 좌표 합
+   - grid:   GridIndex (update + neighbor_sums, NumPy 배열 연산)
+   - numpy:  인덱스 없이 NumPy 전수 비교 (칸 좌표 차를 BLOCK 줄씩) → N²
+   - python: 인덱스 없이 파이썬 전수 비교 → N² (작은 N만)
+2) 플레이어 충돌: 한 프레임 = 플레이어 사각형 질의 한 번 (Horde.hits와 같은 판정)
+   - grid:   GridIndex.query_rect (플레이어 주변 칸만. update는 밀어내기에서 이미 했으므로 뺌)
+   - numpy:  전체 배열에 abs 비교
+
+    python bench_spatial.py
+"""
+import math
+import random
+import time
+
+import numpy as np
+
+from spatial import GridIndex
+
+WIDTH, HEIGHT = 1200, 800
+DENSITY = 500
+CELL = 90          # Horde 밀어내기 칸 크기 (좀비 120px * 0.75)
+PLAYER_SIZE = 100
+FRAMES = 10
+BLOCK = 1024   # numpy 전수 비교에서 한 번에 계산할 줄 수 (메모리 제한)
+
+
+def _area(n: int):
+    scale = math.sqrt(max(n, DENSITY) / DENSITY)
+    return WIDTH * scale, HEIGHT * scale
+
+
+def _random_coords(n: int, rng):
+    w, h = _area(n)
+    return [(rng.uniform(0, w), rng.uniform(0, h)) for _ in range(n)]
+
+
+def _random_walk(coords, rng):
+    w, h = _area(len(coords))
+    out = []
+    for x, y in coords:
+        x = min(max(x + rng.uniform(-3, 3), 0), w)
+        y = min(max(y + rng.uniform(-3, 3), 0), h)
+        out.append((x, y))
+    return out
+
+
+def _frames(n: int, rng):
+    """FRAMES개 프레임의 좌표 (파이썬 리스트, NumPy 배열) — 구현마다 같은 입력"""
+    coords = _random_coords(n, rng)
+    frames = []
+    for _ in range(FRAMES):
+        coords = _random_walk(coords, rng)
+        frames.append((coords, np.array(coords, dtype=np.float64).reshape(-1, 2)))
+    return frames
+
+
+# ─────────────────────────────
+# 1) 밀어내기 (주변 3x3 칸 합계)
+# ─────────────────────────────
+def bench_grid(frames):
+    index = GridIndex(CELL, _area(len(frames[0][0])))
+    total = 0.0
+    found = 0
+    for _, pos in frames:
+        start = time.perf_counter()
+        index.update(pos)
+        sums = index.neighbor_sums(np.column_stack((np.ones(len(pos)), pos)))
+        total += time.perf_counter() - start
+        found = int(sums[:, 0].sum())
+    return total / len(frames), found
+
+
+def bench_numpy(frames):
+    total = 0.0
+    found = 0
+    for _, pos in frames:
+        start = time.perf_counter()
+        cells = (pos // CELL).astype(np.int64)
+        counts = []
+        sums = []
+        for b in range(0, len(pos), BLOCK):
+            d = np.abs(cells[b:b + BLOCK, None, :] - cells[None, :, :])
+            near = (d[:, :, 0] <= 1) & (d[:, :, 1] <= 1)
+            counts.append(near.sum(axis=1))
+            sums.append(near @ pos)
+        counts = np.concatenate(counts)
+        sums = np.concatenate(sums)
+        total += time.perf_counter() - start
+        found = int(counts.sum())
+    return total / len(frames), found
+
+
+def bench_python(frames):
+    coords = frames[0][0]
+    start = time.perf_counter()
+    cells = [(int(x // CELL), int(y // CELL)) for x, y in coords]
+    found = 0
+    for cx, cy in cells:
+        sx = sy = 0.0
+        for (ox, oy), (x, y) in zip(cells, coords):
+            if abs(ox - cx) <= 1 and abs(oy - cy) <= 1:
+                found += 1
+                sx += x
+                sy += y
+    return time.perf_counter() - start, found
+
+
+# ─────────────────────────────
+# 2) 플레이어 충돌 (Horde.hits와 같은 판정)
+# ─────────────────────────────
+def _player(n: int):
+    w, h = _area(n)
+    return w / 2, h / 2
+
+
+def bench_hits_grid(frames):
+    px, py, size = *_player(len(frames[0][0])), PLAYER_SIZE
+    index = GridIndex(CELL, _area(len(frames[0][0])))
+
+    total = 0.0
+    for _, pos in frames:
+        index.update(pos)
+        start = time.perf_counter()
+        hit = index.query_rect(px - size, py - size, px + size, py + size)
+        total += time.perf_counter() - start
+    return total / len(frames), len(hit)
+
+
+def bench_hits_numpy(frames):
+    px, py, size = *_player(len(frames[0][0])), PLAYER_SIZE
+
+    total = 0.0
+    for _, pos in frames:
+        start = time.perf_counter()
+        hit = np.flatnonzero((np.abs(pos[:, 0] - px) < size) & (np.abs(pos[:, 1] - py) < size))
+        total += time.perf_counter() - start
+    return total / len(frames), len(hit)
+
+
+def _ms(sec):
+    return f"{sec * 1000:9.3f}"
+
+
+def main():
+    rng = random.Random(1234)
+    sizes = (100, 500, 1000, 2000, 5000, 10000, 50000)
+    data = {n: _frames(n, rng) for n in sizes}
+
+    print(f"1) 밀어내기 (주변 3x3 칸, 칸 {CELL}px, 모든 에이전트) — ms/frame")
+    print(f"{'N':>6} {'grid':>9} {'numpy':>9} {'python':>9} {'neighbors':>10}")
+    for n in sizes:
+        frames = data[n]
+        grid_sec, found = bench_grid(frames)
+        numpy_ms = _ms(bench_numpy(frames)[0]) if n <= 10000 else f"{'-':>9}"
+        python_ms = _ms(bench_python(frames)[0]) if n <= 2000 else f"{'-':>9}"
+        print(f"{n:>6} {_ms(grid_sec)} {numpy_ms} {python_ms} {found:>10}")
+
+    print(f"\n2) 플레이어 충돌 ({PLAYER_SIZE}px 사각형 질의 한 번) — ms/frame")
+    print(f"{'N':>6} {'grid':>9} {'numpy':>9} {'hits':>6}")
+    for n in sizes:
+        frames = data[n]
+        grid_sec, hits = bench_hits_grid(frames)
+        numpy_sec, _ = bench_hits_numpy(frames)
+        print(f"{n:>6} {_ms(grid_sec)} {_ms(numpy_sec)} {hits:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+# benchmark.py
+"""
+헤드리스 프레임 타임 벤치마크.
+각 씬을 N 프레임 돌리면서 프레임 시간(p50/p95/p99)과 프레임당 할당량을 재고
+결과를 JSON으로 저장 → 커밋 간 비교 가능.
+
+    python benchmark.py                        # 모든 씬, 결과는 bench_results.json
+    python benchmark.py --frames 600 --scene world --out before.json
+    python benchmark.py --compare before.json  # 이전 결과와 비교 출력
+    python benchmark.py --scene building --zombies 2000   # 좀비 떼 (기본은 건물별 좀비 수)
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import pygame
+
+import assets
+import fonts
+import panels
+from headless import init_headless, ScriptedInput
+from world import World
+from dialogue import DialogueManager
+from intro_typing import IntroTypingManager
+from building import BuildingScene
+
+SCREEN_SIZE = (1200, 800)
+STEP_DT = 1.0 / 60
+
+# 오른쪽 → 아래 → 왼쪽 → 위 로 계속 도는 입력
+WALK_SCRIPT = [
+    (0, 90, {pygame.K_RIGHT}),
+    (90, 150, {pygame.K_DOWN}),
+    (150, 240, {pygame.K_LEFT}),
+    (240, 300, {pygame.K_UP}),
+    (300, 330, set()),
+]
+
+# building 씬 방 배치 (길찾기가 벽을 돌아가게). 게임 건물은 빈 방이라 벤치마크에서만 씀
+BENCH_OBSTACLES = [
+    (250, 220, 300, 30), (700, 220, 300, 30),
+    (250, 580, 300, 30), (700, 580, 300, 30),
+]
+
+INTRO_LINES = [
+    "좀비에 감염된 연세대학교에 입장하시겠습니까?",
+    "주의: 신중히 생각하세요.\n한 번 입장하시면 탈출키를 찾아 탈출구로 나가기 전까지 게임을 종료하실 수 없습니다.",
+    "행운을 빕니다. GOOD LUCK",
+]
+
+
+# ─────────────────────────────
+# 씬별 한 프레임 함수 만들기
+# ─────────────────────────────
+def make_world_frame():
+    keys = ScriptedInput(WALK_SCRIPT)
+    world = World(screen, "map.png", key_source=keys.get_pressed)
+
+    def frame():
+        keys.advance()
+        world.update(STEP_DT)
+        world.draw()
+    return frame
+
+
+def make_dialogue_frame():
+    world = World(screen, "map.png")
+    dialogue = DialogueManager(screen)
+
+    def frame():
+        if not dialogue.typing:
+            dialogue.open_for_building("컨버전스홀")
+        dialogue.update(STEP_DT)
+        world.draw()
+        dialogue.draw()
+    return frame
+
+
+def make_intro_frame():
+    bg = panels.get_composited(assets.load_image("intro.png", SCREEN_SIZE, alpha=False), (0, 0, 0), 90)
+    state = {"intro": IntroTypingManager(screen, INTRO_LINES)}
+
+    def frame():
+        intro = state["intro"]
+        if intro.finished:
+            intro = state["intro"] = IntroTypingManager(screen, INTRO_LINES)
+        intro.update(STEP_DT * 4)  # 빨리 돌려서 모든 줄 길이를 거치게
+        screen.blit(bg, (0, 0))
+        intro.draw()
+    return frame
+
+
+def make_building_frame():
+    keys = ScriptedInput(WALK_SCRIPT)
+    clock = pygame.time.Clock()
+    scene = BuildingScene(screen, clock, "미래관", 10 ** 9, key_source=keys.get_pressed,
+                          zombie_count=zombie_count, obstacles=BENCH_OBSTACLES)
+
+    def frame():
+        keys.advance()
+        scene.update(STEP_DT)
+        scene.draw()
+    return frame
+
+
+# main()에서 init_headless() / --zombies로 채움
+screen = None
+zombie_count = None
+
+SCENES = {
+    "world": make_world_frame,
+    "dialogue": make_dialogue_frame,
+    "intro": make_intro_frame,
+    "building": make_building_frame,
+}
+
+
+# ─────────────────────────────
+# 측정
+# ─────────────────────────────
+def _percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * p / 100
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+def run_scene(name: str, frames: int, warmup: int = 30):
+    # 1) 프레임 시간 (tracemalloc 없이). 텍스트 캐시 hit/miss는 이 씬 것만 세도록 비우고 시작
+    fonts.clear_text_cache()
+    frame = SCENES[name]()
+    for _ in range(warmup):
+        frame()
+        pygame.display.flip()
+
+    times = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        frame()
+        pygame.display.flip()
+        times.append((time.perf_counter() - start) * 1000)
+    text_cache = fonts.text_cache_stats()
+
+    # 2) 프레임당 파이썬 할당량 (tracemalloc은 느리니 따로 측정)
+    frame = SCENES[name]()
+    for _ in range(warmup):
+        frame()
+
+    alloc_frames = min(frames, 200)
+    tracemalloc.start()
+    allocated = []
+    blocks = []
+    for _ in range(alloc_frames):
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        blocks_before = sys.getallocatedblocks()
+        frame()
+        _, peak = tracemalloc.get_traced_memory()
+        allocated.append(max(0, peak - before))
+        blocks.append(sys.getallocatedblocks() - blocks_before)
+    tracemalloc.stop()
+
+    times.sort()
+    return {
+        "frames": frames,
+        "mean_ms": sum(times) / len(times),
+        "p50_ms": _percentile(times, 50),
+        "p95_ms": _percentile(times, 95),
+        "p99_ms": _percentile(times, 99),
+        "max_ms": times[-1],
+        "alloc_kb_per_frame": sum(allocated) / len(allocated) / 1024,
+        "net_blocks_per_frame": sum(blocks) / len(blocks),
+        "text_cache_hits": text_cache["hits"],
+        "text_cache_misses": text_cache["misses"],
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(results, baseline=None):
+    print(f"{'scene':<10} {'p50':>8} {'p95':>8} {'p99':>8} {'alloc KB':>9} {'text miss':>10}")
+    for name, r in results["scenes"].items():
+        line = (f"{name:<10} {r['p50_ms']:8.2f} {r['p95_ms']:8.2f} {r['p99_ms']:8.2f}"
+                f" {r['alloc_kb_per_frame']:9.1f} {r['text_cache_misses']:10d}")
+        old = (baseline or {}).get("scenes", {}).get(name)
+        if old:
+            delta = (r["p95_ms"] - old["p95_ms"]) / old["p95_ms"] * 100 if old["p95_ms"] else 0.0
+            line += f"   p95 {delta:+.1f}% vs {baseline.get('commit')}"
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Zombie Campus 헤드리스 벤치마크")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--scene", choices=sorted(SCENES), action="append",
+                        help="측정할 씬 (여러 번 지정 가능, 기본은 전부)")
+    parser.add_argument("--out", default="bench_results.json")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    parser.add_argument("--zombies", type=int, help="building 씬 좀비 수 (기본은 건물별 좀비 수)")
+    args = parser.parse_args(argv)
+    out_path = os.path.abspath(args.out)
+    compare_path = os.path.abspath(args.compare) if args.compare else None
+
+    # 에셋 상대 경로 때문에 이 파일이 있는 폴더에서 실행
+    global screen, zombie_count
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    screen = init_headless(SCREEN_SIZE)
+    zombie_count = args.zombies
+
+    scenes = args.scene or list(SCENES)
+    results = {
+        "commit": _git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "pygame": pygame.version.ver,
+        "zombies": zombie_count,
+        "scenes": {name: run_scene(name, args.frames) for name in scenes},
+    }
+
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+
+    baseline = None
+    if compare_path:
+        with open(compare_path, encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_results(results, baseline)
+    print(f"\n결과 저장: {out_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,83 +1,161 @@
 # building.py
-import pygame
-import random
-import sys
-
-from fonts import get_font
+import math
 
+import numpy as np
+import pygame
 
-def run_building_scene(screen, clock, building_name: str, current_hp: int):
+from animation import Animation, player_clips, zombie_clips
+from atlas import get_atlas
+from building_sim import BuildingSim, PLAYER_SIZE, ZOMBIE_SIZE, HIT_COOLDOWN
+from entities import EntityStore, KEY, PICKUP_SIZE
+from game_loop import lerp
+from fonts import render_text
+from scene_manager import Scene
+from sprites import pickup_sprite
+from dirty_rects import DirtyRectCompositor
+from effects import EffectManager, FloatingText, Fade, DeathScreen
+
+# 시뮬레이션 값(크기, 속도, 좀비 수, 장애물 등)은 building_sim.py에 있음
+OBSTACLE_COLOR = (150, 150, 150)
+
+# 건물 안 스프라이트 (아틀라스 접두사)
+PLAYER_SHEET = "player100"
+ZOMBIE_SHEET = "zombie120"
+# 좀비마다 걷기 프레임을 어긋나게 (다 같이 발맞춰 걷지 않도록, 초)
+ZOMBIE_PHASE = 0.37
+# 한 프레임에 그릴 좀비 스프라이트 상한 (좀비 떼 LOD).
+# 이보다 많으면 화면을 이 수만큼의 칸으로 나눠 칸마다 맨 위(나중에 그리는) 좀비만 그림
+# (120px 스프라이트가 칸 크기 이내로 겹치면 아래 것은 거의 가려짐)
+CROWD_MAX_SPRITES = 500
+
+
+class BuildingScene(Scene):
     """
-    건물 내부 씬.
-    좀비에게 닿으면 HP -20
+    건물 내부 씬 (상태 + update/draw).
+    좀비에게 닿으면 HP -20 (building_sim.HIT_DAMAGE)
     HP가 0 이하이면 사망 → 월드로 복귀
     ESC를 누르면 그냥 나가기
-    HP를 리턴해서 main.py로 돌려보냄
+    아이템 / 탈출키는 entities(EntityStore, 월드 씬과 공용)에서 zone=건물 이름인 것들.
+    주운 종류는 self.picked에 모아 두고 월드 씬이 나올 때 가져감
+    끝나면 done=True, 남은 HP는 self.hp (SceneManager 위에 있으면 스스로 pop)
+    update()는 고정 타임스텝 dt로, draw()는 보간 alpha로 호출
+    한 번 만든 씬은 건물마다 재사용: 다시 들어올 때 reset(hp)만 부름 (애니메이션/좀비 배열 유지)
+    zombie_count / obstacles를 주면 건물별 기본값 대신 그걸로 (벤치마크용)
     """
 
-    WIDTH, HEIGHT = screen.get_size()
+    name = "building"
+
+    def __init__(self, screen, clock, building_name: str, current_hp: int, compositor=None,
+                 key_source=None, rng=None, entities=None, zombie_count=None, obstacles=None):
+        super().__init__()
+        self.screen = screen
+        self.clock = clock
+        # 키 상태 공급자 (기본은 실제 키보드, 헤드리스/리플레이 때는 스크립트)
+        self.key_source = key_source or pygame.key.get_pressed
+        self.building_name = building_name
+        self.WIDTH, self.HEIGHT = screen.get_size()
+
+        if compositor is None:
+            compositor = DirtyRectCompositor(screen)
+        self.compositor = compositor
+
+        # ─────────────────────────────
+        # 플레이어 / 좀비 애니메이션 (프레임은 공용 텍스처 아틀라스 한 장에서)
+        # ─────────────────────────────
+        self.player_size = PLAYER_SIZE
+        self.zombie_size = ZOMBIE_SIZE
+        self.atlas = get_atlas()
+        self.player_anim = Animation(player_clips(PLAYER_SHEET, HIT_COOLDOWN))
+        self.zombie_walk = zombie_clips(ZOMBIE_SHEET)["walk"]
+        # 좀비는 같은 프레임을 여러 번 찍으니 RLE 복사본으로 (투명 부분을 건너뜀)
+        self.zombie_frames = {name: self.atlas.rle_frame(name) for name in self.zombie_walk.frames}
+        self.crowd_cell = math.sqrt(self.WIDTH * self.HEIGHT / CROWD_MAX_SPRITES)
+
+        # 시뮬레이션 (플레이어 이동 / 좀비 길찾기 / 피격은 전부 BuildingSim이 맡음)
+        # rng: 녹화/재생 때는 시드로 만든 난수 (같은 판이면 같은 스폰 위치)
+        self.sim = BuildingSim(building_name, current_hp, (self.WIDTH, self.HEIGHT), rng=rng,
+                               zombie_count=zombie_count, obstacles=obstacles)
+        self.obstacles = [pygame.Rect(r) for r in self.sim.obstacles]
+
+        # 이 건물의 아이템 / 탈출키 (없으면 이 씬 혼자 쓰는 빈 저장소)
+        self.entities = entities if entities is not None else EntityStore()
+        self.picked = []
+
+        # 피격 숫자 / 플래시 / 사망 화면 (루프를 멈추지 않고 시간으로 진행)
+        self.effects = EffectManager()
+
+        self._reset_view()
+
+    # 그리기 / 월드 씬에서 읽는 값은 시뮬레이션 것을 그대로
+    @property
+    def horde(self):
+        return self.sim.horde
+
+    @property
+    def hp(self) -> int:
+        return self.sim.hp
+
+    @property
+    def elapsed(self) -> float:
+        return self.sim.elapsed
+
+    @property
+    def player_x(self) -> float:
+        return self.sim.player_x
+
+    @property
+    def player_y(self) -> float:
+        return self.sim.player_y
+
+    def reset(self, current_hp: int):
+        """
+        입장할 때마다 부르는 상태 초기화.
+        이미지 / 좀비 배열 / 공간 해시는 그대로 두고 위치와 수치만 되돌림
+        """
+        self.sim.reset(current_hp)
+        self._reset_view()
+
+    def _reset_view(self):
+        """시뮬레이션 밖의 상태 (스프라이트 방향, 보간용 이전 위치, 효과) 초기화"""
+        # 기본은 오른쪽 보고 서 있는 상태
+        self.player_anim.facing = "right"
+        self.player_anim.play("stand", restart=True)
+
+        self.prev_player_pos = (self.player_x, self.player_y)
+        self.prev_zombie_pos = self.horde.pos.copy()
+
+        self.picked = []
+        self.effects.clear()
+        self.dying = False
+        self.done = False
+
+    # ─────────────────────────────
+    # 입력
+    # ─────────────────────────────
+    def handle_event(self, event):
+        # ESC로 나가기 (HP 유지한 채 그냥 나가기)
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE and not self.dying:
+            self._finish()
 
     # ─────────────────────────────
-    # 플레이어 / 좀비 이미지 로드
+    # 시뮬레이션 (고정 dt)
     # ─────────────────────────────
-    player_size = 100
-    zombie_size = 120
-
-    # 방향별 플레이어 이미지 (월드와 맞추기)
-    player_img_stand = pygame.transform.scale(
-        pygame.image.load("player_stand.png").convert_alpha(),
-        (player_size, player_size)
-    )
-    player_img_right = pygame.transform.scale(
-        pygame.image.load("player_run_right.png").convert_alpha(),
-        (player_size, player_size)
-    )
-    player_img_left = pygame.transform.scale(
-        pygame.image.load("player_run_left.png").convert_alpha(),
-        (player_size, player_size)
-    )
-
-    # 기본은 서 있는 상태
-    player_img = player_img_stand
-    last_dir = "right"  # 위/아래 이동 시 방향 유지용
-
-    zombie_img = pygame.transform.scale(
-        pygame.image.load("zombie.png").convert_alpha(),
-        (zombie_size, zombie_size)
-    )
-
-    # 초기 위치
-    player_x = WIDTH // 2
-    player_y = HEIGHT // 2
-    player_speed = 5
-
-    zombie_x = random.randint(0, WIDTH - zombie_size)
-    zombie_y = random.randint(0, HEIGHT - zombie_size)
-    zombie_speed = 2
-
-    start_ticks = pygame.time.get_ticks()
-
-    font = get_font(32)
-    big_font = get_font(60)
-
-    # 내부 HP 값
-    hp = current_hp
-
-    while True:
-        dt = clock.tick(60) / 1000
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            # ESC로 나가기
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                return hp  # HP 유지한 채 그냥 나가기
+    def update(self, dt: float):
+        if self.done:
+            return
+
+        self.effects.update(dt)
+        self.prev_player_pos = (self.player_x, self.player_y)
+        self.prev_zombie_pos[:] = self.horde.pos
+
+        # 사망 화면이 떠 있는 동안은 시뮬레이션 정지 (입력/렌더링은 계속)
+        if self.dying:
+            return
 
         # ─────────────────────────────
-        # 이동 & 방향에 따른 이미지 변경
+        # 이동 방향 & 방향에 맞는 동작
         # ─────────────────────────────
-        keys = pygame.key.get_pressed()
+        keys = self.key_source()
         dx = dy = 0
 
         if keys[pygame.K_LEFT]:
@@ -89,98 +167,115 @@ def run_building_scene(screen, clock, building_name: str, current_hp: int):
         if keys[pygame.K_DOWN]:
             dy = 1
 
-        # 이미지 선택
-        if dx == 0 and dy == 0:
-            # 멈추면 서 있는 이미지
-            player_img = player_img_stand
+        self.player_anim.move(dx, dy)
+        self.player_anim.update(dt)
+
+        # 🔥 이동 / 좀비 추적 / 충돌 (맞으면 HP -hit_damage, 닿은 좀비는 리스폰됨)
+        hit_ids = self.sim.step(dt, dx, dy)
+        if not self.sim.dead:
+            self._pick_up()
+        if len(hit_ids) == 0:
+            return
+
+        # 리스폰된 좀비는 보간 없이 바로 이동
+        self.prev_zombie_pos[hit_ids] = self.horde.pos[hit_ids]
+
+        if not self.sim.dead:
+            # HP가 떨어졌으면 떠오르는 '-20' + 빨간 플래시 + 움찔하는 포즈 (무적 시간 동안)
+            self.player_anim.play("hit", restart=True)
+            self.effects.add(FloatingText(f"-{self.sim.hit_damage}",
+                                          (self.player_x, self.player_y - 40)))
+            self.effects.add(Fade(0.3, (255, 0, 0), start_alpha=90, end_alpha=0))
         else:
-            if dx > 0:
-                player_img = player_img_right
-                last_dir = "right"
-            elif dx < 0:
-                player_img = player_img_left
-                last_dir = "left"
-            else:
-                # 위/아래만 눌렀을 때는 이전 방향 유지
-                if last_dir == "right":
-                    player_img = player_img_right
-                else:
-                    player_img = player_img_left
-
-        # 실제 이동
-        player_x += dx * player_speed
-        player_y += dy * player_speed
-
-        # 화면 경계
-        player_x = max(0, min(player_x, WIDTH - player_size))
-        player_y = max(0, min(player_y, HEIGHT - player_size))
+            # 🔥 체력 0 → 사망 화면 보여준 뒤 월드로 복귀
+            self.dying = True
+            self.effects.clear()
+            self.effects.add(DeathScreen(on_done=self._finish))
+
+    def _pick_up(self):
+        """플레이어가 닿은 아이템 / 탈출키 줍기"""
+        size = self.player_size
+        for kind in self.entities.pick_up(self.player_x, self.player_y, size, size,
+                                          zone=self.building_name):
+            self.picked.append(kind)
+            label = "+탈출키" if kind == KEY else "+아이템"
+            self.effects.add(FloatingText(label, (self.player_x, self.player_y - 40),
+                                          color=(255, 200, 40)))
+
+    def _finish(self):
+        if self.done:
+            return
+        self.done = True
+        # 씬 매니저 위에서 돌고 있으면 스스로 빠짐 → 아래 월드 씬이 on_resume에서 HP를 가져감
+        if self.manager is not None and self.manager.top is self:
+            self.manager.pop()
 
-        # ─────────────────────────────
-        # 좀비 추적
-        # ─────────────────────────────
-        if zombie_x < player_x:
-            zombie_x += zombie_speed
-        else:
-            zombie_x -= zombie_speed
-
-        if zombie_y < player_y:
-            zombie_y += zombie_speed
-        else:
-            zombie_y -= zombie_speed
-
-        # 🔥 충돌 체크 (HP 20 감소)
-        if abs(player_x - zombie_x) < player_size and abs(player_y - zombie_y) < player_size:
-            hp -= 20
-
-            # HP가 떨어졌으면 텍스트 표시
-            if hp > 0:
-                screen.fill((255, 255, 255))
-                hit_text = big_font.render("-20", True, (255, 50, 50))
-                screen.blit(hit_text, (player_x, player_y - 40))
-                pygame.display.update()
-                pygame.time.delay(300)
-
-                # 좀비를 랜덤한 위치로 리스폰
-                zombie_x = random.randint(0, WIDTH - zombie_size)
-                zombie_y = random.randint(0, HEIGHT - zombie_size)
-            else:
-                # 🔥 체력 0 → 사망
-                screen.fill((255, 255, 255))
-                dead_text = big_font.render("당신은 좀비에게 잡혀 사망했습니다!", True, (200, 0, 0))
-                screen.blit(dead_text, (WIDTH // 2 - 300, HEIGHT // 2 - 30))
-                pygame.display.update()
-                pygame.time.delay(1500)
-                return 0
-
-        # ─────────────────────────────
-        # 그리기
-        # ─────────────────────────────
+    # ─────────────────────────────
+    # 그리기 (alpha로 직전 step과 현재 step 사이 보간)
+    # ─────────────────────────────
+    def draw(self, alpha: float = 1.0):
+        screen = self.screen
+        compositor = self.compositor
         screen.fill((255, 255, 255))
 
+        # 장애물
+        for rect in self.obstacles:
+            compositor.mark(pygame.draw.rect(screen, OBSTACLE_COLOR, rect))
+
         # 생존 시간 표시
-        elapsed_time = (pygame.time.get_ticks() - start_ticks) // 1000
-        title_text = font.render(
-            f"{building_name} - 생존 {elapsed_time}s", True, (0, 0, 0)
-        )
-        screen.blit(title_text, (10, 10))
+        elapsed_time = int(self.elapsed)
+        title_text = render_text(f"{self.building_name} - 생존 {elapsed_time}s", 32, (0, 0, 0))
+        compositor.mark(screen.blit(title_text, (10, 10)))
 
         # 🔥 HP UI 표시
         hp_bar_width = 200
-        hp_ratio = hp / 100
+        hp_ratio = self.hp / 100
         hp_fill = int(hp_bar_width * hp_ratio)
 
-        pygame.draw.rect(screen, (180, 0, 0), (10, 50, hp_bar_width, 20))  # 바탕
+        compositor.mark(pygame.draw.rect(screen, (180, 0, 0), (10, 50, hp_bar_width, 20)))  # 바탕
         pygame.draw.rect(screen, (255, 80, 80), (10, 50, hp_fill, 20))    # 남은 HP
 
-        hp_text = font.render(f"HP: {hp}", True, (0, 0, 0))
-        screen.blit(hp_text, (220, 45))
+        hp_text = render_text(f"HP: {self.hp}", 32, (0, 0, 0))
+        compositor.mark(screen.blit(hp_text, (220, 45)))
+
+        # 아이템 / 탈출키 (플레이어 / 좀비 아래)
+        entities = self.entities
+        ids = entities.select(zone=self.building_name)
+        if len(ids):
+            compositor.mark(screen.blits([
+                (pickup_sprite(kind, PICKUP_SIZE), pos)
+                for kind, pos in zip(entities.kinds_of(ids), entities.pos[ids].astype(int).tolist())
+            ]))
 
         # 플레이어/좀비 이미지
-        screen.blit(player_img, (player_x, player_y))
-        screen.blit(zombie_img, (zombie_x, zombie_y))
+        player_x = lerp(self.prev_player_pos[0], self.player_x, alpha)
+        player_y = lerp(self.prev_player_pos[1], self.player_y, alpha)
+        atlas = self.atlas
+        compositor.mark(self.player_anim.draw(screen, atlas, (player_x, player_y)))
+
+        # 좀비는 Animation 없이 공용 걷기 동작 + 좀비마다 다른 시작 시점
+        zombie_pos = self.prev_zombie_pos + (self.horde.pos - self.prev_zombie_pos) * alpha
+        ids = range(len(zombie_pos))
+        if len(zombie_pos) > CROWD_MAX_SPRITES:
+            ids = _topmost(zombie_pos, self.crowd_cell)
+            zombie_pos = zombie_pos[ids]
+        walk, t, frames = self.zombie_walk, self.elapsed, self.zombie_frames
+        compositor.mark(screen.blits([
+            (frames[walk.frame_at(t + i * ZOMBIE_PHASE)], p)
+            for i, p in zip(ids, zombie_pos.astype(int).tolist())
+        ]))
 
         # ESC 안내 텍스트
-        esc_text = font.render("ESC: 건물에서 나가기", True, (50, 50, 50))
-        screen.blit(esc_text, (10, HEIGHT - 40))
+        esc_text = render_text("ESC: 건물에서 나가기", 32, (50, 50, 50))
+        compositor.mark(screen.blit(esc_text, (10, self.HEIGHT - 40)))
+
+        # 피격/사망 효과는 맨 위에
+        compositor.mark(self.effects.draw(screen))
+
 
-        pygame.display.update()
+def _topmost(pos, cell: float):
+    """cell px 칸마다 맨 위에 그려지는(번호가 가장 큰) 좀비 하나씩, 번호 오름차순"""
+    cells = (pos // cell).astype(np.int64)
+    keys = cells[:, 1] * 65536 + cells[:, 0]
+    _, first = np.unique(keys[::-1], return_index=True)
+    return np.sort(len(keys) - 1 - first).tolist()
@@ -0,0 +1,171 @@
+# building_sim.py
+"""
+건물 내부 시뮬레이션 (렌더링 / pygame 없음).
+BuildingScene은 이걸 한 step씩 돌리고 그리기 / 효과만 맡음.
+batch_sim.py는 창 없이 여러 프로세스에서 수천 판을 돌려 밸런스를 봄.
+"""
+import numpy as np
+
+from horde import Horde
+from navigation import navigator_for
+
+# 건물 화면 크기 (BuildingScene은 실제 화면 크기를 넘김)
+SCREEN_SIZE = (1200, 800)
+
+# 건물 내부 스프라이트 크기
+PLAYER_SIZE = 100
+ZOMBIE_SIZE = 120
+
+# 건물별 좀비 수 (없는 건물은 DEFAULT_ZOMBIE_COUNT, 예: "미래관": 3)
+# 큰 무리는 BuildingSim(zombie_count=...)로 (benchmark.py --zombies, batch_sim.py --zombie-count)
+DEFAULT_ZOMBIE_COUNT = 1
+ZOMBIE_COUNTS = {}
+
+# 이동 속도 (px/s, 예전 프레임당 5px / 2px @ 60FPS)
+PLAYER_SPEED = 300
+ZOMBIE_SPEED = 120
+
+# 좀비에게 닿았을 때 깎이는 HP
+HIT_DAMAGE = 20
+
+# 건물 안 장애물 (책장, 벽 등, 화면 좌표 x, y, w, h). 지금은 빈 방뿐
+# 예: "도서관": [(150, 200, 40, 400), ...]. 플레이어 시작 위치(화면 가운데)는 비워 둘 것
+# 한 판만 다르게 하려면 BuildingSim(obstacles=...) (benchmark.py의 BENCH_OBSTACLES)
+BUILDING_OBSTACLES = {}
+
+# 좀비 길찾기 격자 칸 크기 / 장애물을 얼마나 부풀려서 피할지 (좀비 크기 대비)
+NAV_CELL_SIZE = 20
+NAV_AGENT_RADIUS = ZOMBIE_SIZE * 0.4
+
+# 피격 후 무적 시간 (예전에 300ms 화면을 멈추던 것 대신)
+HIT_COOLDOWN = 0.3
+
+
+def prepare_navigation(size=SCREEN_SIZE):
+    """
+    장애물 있는 건물들의 길찾기 격자 + 시작 위치 흐름장을 미리 만듦.
+    pygame 없는 계산이라 백그라운드 스레드에서 불러도 됨 (첫 입장 때 안 끊기게)
+    """
+    for name, obstacles in BUILDING_OBSTACLES.items():
+        nav = navigator_for(name, size, obstacles, NAV_CELL_SIZE, NAV_AGENT_RADIUS)
+        nav.flow_to(size[0] // 2 + PLAYER_SIZE / 2, size[1] // 2 + PLAYER_SIZE / 2)
+
+
+def _overlaps(x, y, w, h, rect) -> bool:
+    """pygame.Rect.colliderect와 같은 판정 (변이 닿기만 하면 겹침 아님)"""
+    rx, ry, rw, rh = rect
+    return x < rx + rw and rx < x + w and y < ry + rh and ry < y + h
+
+
+class BuildingSim:
+    """
+    건물 한 판의 상태 + 고정 dt step.
+    - 입력은 step(dt, dx, dy)의 이동 방향(-1 / 0 / 1)뿐
+    - 좀비는 플레이어 칸으로 향하는 흐름장을 따라감 (흐름장은 건물마다 캐시)
+    - 닿으면 hit_damage만큼 HP 감소 + 닿은 좀비 리스폰 + hit_cooldown초 무적
+    - HP가 0이 되면 dead=True, 그 뒤로 step은 아무것도 안 함
+    밸런스 조절용 값(속도, 피해량, 좀비 수, 장애물)은 인자로 바꿀 수 있음 (기본은 게임 값)
+    """
+
+    def __init__(self, building_name: str, hp: int = 100, size=SCREEN_SIZE, rng=None,
+                 player_speed: float = PLAYER_SPEED, zombie_speed: float = ZOMBIE_SPEED,
+                 hit_damage: int = HIT_DAMAGE, zombie_count: int = None, obstacles=None):
+        self.building_name = building_name
+        self.width, self.height = size
+        self.player_size = PLAYER_SIZE
+        self.player_speed = player_speed
+        self.hit_damage = hit_damage
+
+        if obstacles is None:
+            obstacles = BUILDING_OBSTACLES.get(building_name, [])
+        self.obstacles = [tuple(r) for r in obstacles]
+        self.nav = navigator_for(building_name, size, self.obstacles,
+                                 NAV_CELL_SIZE, NAV_AGENT_RADIUS)
+
+        if zombie_count is None:
+            zombie_count = ZOMBIE_COUNTS.get(building_name, DEFAULT_ZOMBIE_COUNT)
+        self.horde = Horde(zombie_count, size, ZOMBIE_SIZE, zombie_speed,
+                           rng=rng, grid=self.nav.grid)
+        self.reset(hp)
+
+    def reset(self, hp: int):
+        """플레이어를 가운데로, 좀비는 새로 스폰, 수치 초기화"""
+        self.player_x = self.width // 2
+        self.player_y = self.height // 2
+        self.horde.respawn(np.arange(self.horde.count))
+
+        self.hp = hp
+        self.dead = False
+        self.elapsed = 0.0         # 생존 시간 (시뮬레이션 시간)
+        self.hit_cooldown = 0.0
+        self.hits_taken = 0
+
+    def random_spot(self, rng, size: int, keep_away: float = 250.0):
+        """
+        장애물 칸이 아니고 플레이어 시작 위치에서 keep_away 이상 떨어진 랜덤 위치 (왼쪽 위 기준).
+        아이템 / 탈출키 배치용 (좀비 난수와 섞이지 않게 rng는 따로 받음)
+        """
+        start = np.array((self.width // 2, self.height // 2)) + self.player_size / 2
+        for _ in range(50):
+            x = int(rng.integers(0, self.width - size + 1))
+            y = int(rng.integers(0, self.height - size + 1))
+            center = np.array(((x + size / 2, y + size / 2),))
+            if self.nav.grid.blocked_at(center)[0]:
+                continue
+            if np.hypot(*(center[0] - start)) >= keep_away:
+                return x, y
+        return x, y
+
+    def player_blocked(self) -> bool:
+        x, y, size = int(self.player_x), int(self.player_y), self.player_size
+        return any(_overlaps(x, y, size, size, r) for r in self.obstacles)
+
+    def step(self, dt: float, dx: int, dy: int):
+        """
+        dt초 진행. 이번 step에 닿은 좀비 인덱스 배열을 리턴 (안 맞았으면 빈 배열).
+        닿은 좀비는 이미 리스폰된 상태
+        """
+        if self.dead:
+            return _NO_HITS
+
+        self.elapsed += dt
+        self.hit_cooldown = max(0.0, self.hit_cooldown - dt)
+
+        # 이동 (축마다 따로 → 장애물에 막히면 그 축만 취소, 벽을 따라 미끄러짐)
+        old_x, old_y = self.player_x, self.player_y
+        self.player_x += dx * self.player_speed * dt
+        if self.player_blocked():
+            self.player_x = old_x
+        self.player_y += dy * self.player_speed * dt
+        if self.player_blocked():
+            self.player_y = old_y
+
+        # 화면 경계
+        self.player_x = max(0, min(self.player_x, self.width - self.player_size))
+        self.player_y = max(0, min(self.player_y, self.height - self.player_size))
+
+        # 좀비 추적 (플레이어가 있는 칸으로 향하는 흐름장을 모든 좀비가 같이 씀)
+        half = self.player_size / 2
+        flow = self.nav.flow_to(self.player_x + half, self.player_y + half)
+        self.horde.update(dt, self.player_x, self.player_y, flow)
+
+        # 충돌 (여러 마리가 동시에 닿아도 한 번, 맞은 뒤 잠깐 무적)
+        if self.hit_cooldown > 0:
+            return _NO_HITS
+        hit_ids = self.horde.hits(self.player_x, self.player_y, self.player_size)
+        if len(hit_ids) == 0:
+            return hit_ids
+
+        self.hp -= self.hit_damage
+        self.hits_taken += 1
+        # 닿은 좀비들은 랜덤한 위치로 리스폰
+        self.horde.respawn(hit_ids)
+        if self.hp > 0:
+            self.hit_cooldown = HIT_COOLDOWN
+        else:
+            self.hp = 0
+            self.dead = True
+        return hit_ids
+
+
+_NO_HITS = np.zeros(0, dtype=np.int64)
@@ -0,0 +1,247 @@
+# campus_map.py
+import json
+import os
+import struct
+
+import pygame
+
+from zones import ZoneIndex
+
+# 맵 파일은 이 파일(campus_map.py)과 같은 폴더 기준
+MAP_DIR = os.path.dirname(__file__)
+DEFAULT_MAP = "campus_map.json"
+
+# 바이너리 캐시: campus_map.json → campus_map.mapcache
+CACHE_EXT = ".mapcache"
+_MAGIC = b"ZCMP"
+_CACHE_VERSION = 1
+# magic, 캐시 버전, 원본 mtime_ns, 원본 크기, 격자 칸 크기
+_HEADER = struct.Struct("<4sHqqH")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_POINT = struct.Struct("<ii")
+_RECT = struct.Struct("<iiii")
+_CELL = struct.Struct("<iiH")
+_ENTRY = struct.Struct("<HH")
+_ITEM = struct.Struct("<Hii")
+
+
+class CampusMap:
+    """
+    캠퍼스 맵 데이터: 건물 구역 / 스폰 지점 / 아이템 위치.
+    - 원본은 사람이 고칠 수 있는 JSON (campus_map.json)
+    - 로드할 때 바이너리 캐시(.mapcache)로 컴파일해 둠 → 다음 실행부터는 JSON 파싱과
+      격자 인덱스 계산 없이 바로 복원 (원본 mtime/크기가 바뀌면 다시 컴파일)
+    - 건물 구역은 ZoneIndex가 들고 있음 (buildings는 그걸 그대로 보여주는 dict)
+    """
+
+    def __init__(self, buildings: dict = None, spawns: dict = None, items=None,
+                 image: str = "map.png", cell_size: int = 64, zone_index: ZoneIndex = None):
+        self.image = image
+        self.cell_size = cell_size
+        self.zone_index = zone_index or ZoneIndex(buildings or {}, cell_size)
+        self.spawns = {name: tuple(pos) for name, pos in (spawns or {}).items()}
+        self.items = [(kind, x, y) for kind, x, y in (items or [])]
+
+        self.path = None          # save()할 JSON 경로
+        self.from_cache = False   # 바이너리 캐시에서 읽었는지
+
+    @property
+    def buildings(self):
+        """건물 이름 -> [Rect, ...] (등록 순서)"""
+        return {name: self.zone_index.rects(name) for name in self.zone_index.names()}
+
+    def spawn(self, name: str, default=None):
+        return self.spawns.get(name, default)
+
+    # ─────────────────────────────
+    # 편집 (측정 모드에서 바로 씀)
+    # ─────────────────────────────
+    def add_building(self, name: str, rect):
+        """name 구역에 rect 추가 (없는 이름이면 새 건물). 인덱스도 바로 갱신"""
+        self.zone_index.add(name, pygame.Rect(rect))
+
+    def set_spawn(self, name: str, x: int, y: int):
+        self.spawns[name] = (int(x), int(y))
+
+    def add_item(self, kind: str, x: int, y: int):
+        self.items.append((kind, int(x), int(y)))
+
+    # ─────────────────────────────
+    # JSON
+    # ─────────────────────────────
+    def to_dict(self):
+        return {
+            "version": 1,
+            "image": self.image,
+            "cell_size": self.cell_size,
+            "buildings": {
+                name: [[r.x, r.y, r.w, r.h] for r in rects]
+                for name, rects in self.buildings.items()
+            },
+            "spawns": {name: list(pos) for name, pos in self.spawns.items()},
+            "items": [{"kind": kind, "pos": [x, y]} for kind, x, y in self.items],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(
+            buildings={name: [tuple(r) for r in rects]
+                       for name, rects in data.get("buildings", {}).items()},
+            spawns=data.get("spawns", {}),
+            items=[(item["kind"], *item["pos"]) for item in data.get("items", [])],
+            image=data.get("image", "map.png"),
+            cell_size=data.get("cell_size", 64),
+        )
+
+    def save(self, path: str = None):
+        """JSON으로 저장하고 바이너리 캐시도 새로 씀"""
+        path = _resolve(path or self.path or DEFAULT_MAP)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        os.replace(tmp, path)
+        self.path = path
+        _write_cache(self, path)
+        return path
+
+
+def _resolve(path: str) -> str:
+    return os.path.join(MAP_DIR, path)
+
+
+def cache_path(path: str) -> str:
+    return os.path.splitext(_resolve(path))[0] + CACHE_EXT
+
+
+def load_map(path: str = DEFAULT_MAP, use_cache: bool = True) -> CampusMap:
+    """
+    맵 로드. 캐시가 원본과 맞으면 캐시에서, 아니면 JSON을 읽고 캐시를 새로 만듦.
+    """
+    src = _resolve(path)
+    if use_cache:
+        campus = _read_cache(src)
+        if campus is not None:
+            campus.path = src
+            return campus
+
+    with open(src, encoding="utf-8") as f:
+        campus = CampusMap.from_dict(json.load(f))
+    campus.path = src
+    if use_cache:
+        _write_cache(campus, src)
+    return campus
+
+
+# ─────────────────────────────
+# 바이너리 캐시
+# ─────────────────────────────
+def _pack_block(out: bytearray, st: struct.Struct, rows):
+    """개수(u32) + 같은 형식 레코드들을 한 덩어리로 (읽을 때 iter_unpack 한 번)"""
+    out += _U32.pack(len(rows))
+    for row in rows:
+        out += st.pack(*row)
+
+
+def _unpack_block(buf, offset: int, st: struct.Struct):
+    (n,) = _U32.unpack_from(buf, offset)
+    offset += _U32.size
+    end = offset + n * st.size
+    return list(st.iter_unpack(buf[offset:end])), end
+
+
+def _write_cache(campus: CampusMap, src: str):
+    """
+    레이아웃 (리틀 엔디언, 덩어리마다 개수 u32 + 고정 크기 레코드들):
+      헤더 | 문자열 표('\0'로 이은 UTF-8: 이미지, 구역 이름들, 스폰 이름들, 아이템 종류들)
+      | 구역별 rect 개수 | rect들 | 스폰 좌표들 | 아이템(종류 번호, x, y)들
+      | 격자 칸(cx, cy, 항목 수)들 | 칸 항목(구역 순서, rect 번호)들
+    캐시는 있으면 좋은 것이라 못 쓰면(읽기 전용 폴더 등) 그냥 넘어감
+    """
+    try:
+        st = os.stat(src)
+    except OSError:
+        return
+
+    buildings = campus.buildings
+    kinds = list(dict.fromkeys(kind for kind, _, _ in campus.items))
+    kind_ids = {kind: i for i, kind in enumerate(kinds)}
+    strings = [campus.image, *buildings, *campus.spawns, *kinds]
+
+    out = bytearray(_HEADER.pack(_MAGIC, _CACHE_VERSION, st.st_mtime_ns, st.st_size,
+                                 campus.cell_size))
+    table = "\0".join(strings).encode("utf-8")
+    out += _U32.pack(len(strings)) + _U32.pack(len(table)) + table
+
+    _pack_block(out, _U16, [(len(rects),) for rects in buildings.values()])
+    _pack_block(out, _RECT, [tuple(r) for rects in buildings.values() for r in rects])
+    _pack_block(out, _POINT, list(campus.spawns.values()))
+    _pack_block(out, _ITEM, [(kind_ids[kind], x, y) for kind, x, y in campus.items])
+
+    cells = campus.zone_index.export_cells()
+    _pack_block(out, _CELL, [(cx, cy, len(entries)) for (cx, cy), entries in cells.items()])
+    _pack_block(out, _ENTRY, [entry for entries in cells.values() for entry in entries])
+
+    try:
+        tmp = cache_path(src) + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(out)
+        os.replace(tmp, cache_path(src))
+    except OSError:
+        pass
+
+
+def _read_cache(src: str):
+    """원본과 맞는 캐시가 있으면 CampusMap, 없거나 오래됐거나 깨졌으면 None"""
+    try:
+        st = os.stat(src)
+        with open(cache_path(src), "rb") as f:
+            buf = memoryview(f.read())
+    except OSError:
+        return None
+
+    try:
+        magic, version, mtime_ns, size, cell_size = _HEADER.unpack_from(buf, 0)
+        if (magic, version, mtime_ns, size) != (_MAGIC, _CACHE_VERSION, st.st_mtime_ns, st.st_size):
+            return None
+        offset = _HEADER.size
+        n_strings, n_bytes = struct.unpack_from("<II", buf, offset)
+        offset += 8
+        strings = bytes(buf[offset:offset + n_bytes]).decode("utf-8").split("\0")
+        offset += n_bytes
+        if len(strings) != n_strings:
+            return None
+
+        rect_counts, offset = _unpack_block(buf, offset, _U16)
+        rects, offset = _unpack_block(buf, offset, _RECT)
+        spawn_points, offset = _unpack_block(buf, offset, _POINT)
+        item_rows, offset = _unpack_block(buf, offset, _ITEM)
+        cell_rows, offset = _unpack_block(buf, offset, _CELL)
+        entries, offset = _unpack_block(buf, offset, _ENTRY)
+    except (struct.error, UnicodeDecodeError):
+        return None
+
+    image = strings[0]
+    zone_names = strings[1:1 + len(rect_counts)]
+    spawn_names = strings[1 + len(rect_counts):1 + len(rect_counts) + len(spawn_points)]
+    kinds = strings[1 + len(rect_counts) + len(spawn_points):]
+
+    zones = {}
+    start = 0
+    for name, (n,) in zip(zone_names, rect_counts):
+        zones[name] = [pygame.Rect(r) for r in rects[start:start + n]]
+        start += n
+
+    cells = {}
+    start = 0
+    for cx, cy, n in cell_rows:
+        cells[(cx, cy)] = entries[start:start + n]
+        start += n
+
+    campus = CampusMap(spawns=dict(zip(spawn_names, spawn_points)),
+                       items=[(kinds[k], x, y) for k, x, y in item_rows],
+                       image=image, cell_size=cell_size,
+                       zone_index=ZoneIndex.from_cells(zones, cells, cell_size))
+    campus.from_cache = True
+    return campus
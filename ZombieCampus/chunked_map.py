@@ -0,0 +1,288 @@
+# chunked_map.py
+import json
+import os
+import queue
+import threading
+from collections import OrderedDict
+
+import pygame
+
+import alloc_stats
+
+# 맵 이미지/청크 폴더는 이 파일(chunked_map.py)과 같은 폴더 기준
+MAP_DIR = os.path.dirname(__file__)
+
+CHUNK_SIZE = 256
+MANIFEST = "manifest.json"
+_FORMAT_VERSION = 1
+
+
+def chunk_dir_for(image_path: str) -> str:
+    """map.png → map_chunks/"""
+    stem = os.path.splitext(os.path.basename(image_path))[0]
+    return os.path.join(MAP_DIR, stem + "_chunks")
+
+
+# ─────────────────────────────
+# 청크 만들기 (오프라인 / 처음 실행 때 한 번)
+# ─────────────────────────────
+def build_chunks(image_path: str, chunk_dir: str = None, chunk_size: int = CHUNK_SIZE):
+    """
+    큰 맵 이미지를 chunk_size 정사각 청크 PNG들로 자르고,
+    가로세로 절반씩 줄인 저해상도 단계(피라미드)도 같은 방식으로 저장.
+    마지막 단계는 청크 하나에 들어가는 크기.
+      chunk_dir/manifest.json
+      chunk_dir/L{단계}/{cx}_{cy}.png
+    """
+    src = os.path.join(MAP_DIR, image_path)
+    chunk_dir = chunk_dir or chunk_dir_for(image_path)
+    st = os.stat(src)
+
+    image = pygame.image.load(src)
+    levels = []
+    level = 0
+    while True:
+        w, h = image.get_size()
+        level_dir = os.path.join(chunk_dir, f"L{level}")
+        os.makedirs(level_dir, exist_ok=True)
+        for cy in range(0, h, chunk_size):
+            for cx in range(0, w, chunk_size):
+                rect = pygame.Rect(cx, cy, chunk_size, chunk_size).clip(image.get_rect())
+                pygame.image.save(image.subsurface(rect),
+                                  os.path.join(level_dir, f"{cx // chunk_size}_{cy // chunk_size}.png"))
+        levels.append([w, h])
+
+        if w <= chunk_size and h <= chunk_size:
+            break
+        image = pygame.transform.smoothscale(image, (max(1, w // 2), max(1, h // 2)))
+        level += 1
+
+    manifest = {
+        "version": _FORMAT_VERSION,
+        "source": os.path.basename(src),
+        "source_mtime_ns": st.st_mtime_ns,
+        "source_size": st.st_size,
+        "chunk_size": chunk_size,
+        "levels": levels,
+    }
+    with open(os.path.join(chunk_dir, MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def _read_manifest(chunk_dir: str):
+    try:
+        with open(os.path.join(chunk_dir, MANIFEST), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def open_map(image_path: str, chunk_size: int = CHUNK_SIZE, **kwargs) -> "ChunkedMap":
+    """
+    image_path의 청크 맵을 엶. 청크가 없거나 원본 이미지가 바뀌었으면 먼저 다시 만듦.
+    원본 이미지 없이 청크 폴더만 배포해도 됨 (그때는 검사 없이 청크를 그대로 씀)
+    """
+    chunk_dir = chunk_dir_for(image_path)
+    manifest = _read_manifest(chunk_dir)
+    src = os.path.join(MAP_DIR, image_path)
+    if os.path.exists(src):
+        st = os.stat(src)
+        if (manifest is None
+                or manifest.get("version") != _FORMAT_VERSION
+                or manifest.get("chunk_size") != chunk_size
+                or manifest.get("source_mtime_ns") != st.st_mtime_ns
+                or manifest.get("source_size") != st.st_size):
+            manifest = build_chunks(image_path, chunk_dir, chunk_size)
+    return ChunkedMap(chunk_dir, manifest, **kwargs)
+
+
+# ─────────────────────────────
+# 청크 스트리밍
+# ─────────────────────────────
+class ChunkedMap:
+    """
+    청크로 나뉜 맵 + 저해상도 단계들.
+    - get(level, cx, cy): 청크 Surface (없으면 그 자리에서 로드 = 동기 miss)
+    - 로드된 청크는 LRU로 max_chunks 개까지만 유지
+    - request() / prefetch_rect(): 백그라운드 스레드가 PNG 디코딩만 해 둠
+      → pump()가 메인 스레드에서 convert() 해서 캐시에 넣음 (display 관련은 메인 스레드에서만)
+    """
+
+    def __init__(self, chunk_dir: str, manifest: dict, max_chunks: int = 64,
+                 prefetch: bool = True):
+        self.chunk_dir = chunk_dir
+        self.chunk_size = manifest["chunk_size"]
+        self.levels = [tuple(size) for size in manifest["levels"]]
+        self.width, self.height = self.levels[0]
+        self.max_chunks = max_chunks
+
+        self._chunks = OrderedDict()   # (level, cx, cy) -> convert된 Surface
+        self._pending = set()          # 스레드에 요청했지만 아직 pump 안 된 키
+        self._lock = threading.Lock()
+        self._requests = queue.Queue()
+        self._ready = queue.Queue()
+
+        # 통계 (프로파일링/디버그용)
+        self.stats = {"hits": 0, "sync_loads": 0, "prefetched": 0, "evicted": 0}
+
+        self._thread = None
+        if prefetch:
+            self._thread = threading.Thread(target=self._worker, name="chunk-prefetch", daemon=True)
+            self._thread.start()
+
+    @property
+    def size(self):
+        return self.width, self.height
+
+    def grid(self, level: int = 0):
+        """level 단계의 (열 수, 행 수)"""
+        w, h = self.levels[level]
+        cs = self.chunk_size
+        return (w + cs - 1) // cs, (h + cs - 1) // cs
+
+    def _path(self, key):
+        level, cx, cy = key
+        return os.path.join(self.chunk_dir, f"L{level}", f"{cx}_{cy}.png")
+
+    # ─────────────────────────────
+    # 캐시
+    # ─────────────────────────────
+    def _store(self, key, surf):
+        self._chunks[key] = surf
+        self._chunks.move_to_end(key)
+        while len(self._chunks) > self.max_chunks:
+            self._chunks.popitem(last=False)   # 가장 오래 안 쓴 청크 제거
+            self.stats["evicted"] += 1
+
+    def _convert(self, raw):
+        alloc_stats.count("map_chunk")
+        return raw.convert() if pygame.display.get_surface() else raw
+
+    def get(self, level: int, cx: int, cy: int) -> pygame.Surface:
+        key = (level, cx, cy)
+        surf = self._chunks.get(key)
+        if surf is not None:
+            self._chunks.move_to_end(key)
+            self.stats["hits"] += 1
+            return surf
+
+        # 프리페치가 못 따라온 경우: 지금 바로 로드
+        self.stats["sync_loads"] += 1
+        surf = self._convert(pygame.image.load(self._path(key)))
+        self._store(key, surf)
+        return surf
+
+    def region(self, level: int, rect) -> pygame.Surface:
+        """level 단계의 rect 영역을 한 장으로 (여러 청크에 걸쳐도 됨, rect는 단계 범위 안)"""
+        rect = pygame.Rect(rect)
+        cs = self.chunk_size
+        alloc_stats.count("map_chunk")
+        image = pygame.Surface(rect.size, 0, self.get(level, rect.x // cs, rect.y // cs))
+        for cy in range(rect.top // cs, (rect.bottom - 1) // cs + 1):
+            for cx in range(rect.left // cs, (rect.right - 1) // cs + 1):
+                image.blit(self.get(level, cx, cy), (cx * cs - rect.x, cy * cs - rect.y))
+        return image
+
+    def __len__(self):
+        return len(self._chunks)
+
+    # ─────────────────────────────
+    # 백그라운드 프리페치
+    # ─────────────────────────────
+    def request(self, keys):
+        """(level, cx, cy)들을 백그라운드로 미리 읽어 두도록 요청 (이미 있거나 요청 중이면 무시)"""
+        if self._thread is None:
+            return
+        with self._lock:
+            for key in keys:
+                if key in self._chunks or key in self._pending:
+                    continue
+                self._pending.add(key)
+                self._requests.put(key)
+
+    def prefetch_rect(self, level: int, rect):
+        """level 단계 픽셀 좌표 rect에 걸친 청크들을 요청"""
+        cs = self.chunk_size
+        cols, rows = self.grid(level)
+        cx0, cy0 = max(0, rect.left // cs), max(0, rect.top // cs)
+        cx1, cy1 = min(cols - 1, (rect.right - 1) // cs), min(rows - 1, (rect.bottom - 1) // cs)
+        self.request((level, cx, cy)
+                     for cy in range(cy0, cy1 + 1)
+                     for cx in range(cx0, cx1 + 1))
+
+    def _worker(self):
+        while True:
+            key = self._requests.get()
+            if key is None:
+                return
+            try:
+                raw = pygame.image.load(self._path(key))   # 디코딩만 (convert는 메인 스레드)
+            except (pygame.error, OSError):
+                raw = None
+            self._ready.put((key, raw))
+
+    def pump(self, limit: int = 4):
+        """스레드가 디코딩해 둔 청크를 최대 limit개 convert해서 캐시에 넣음 (매 프레임 호출)"""
+        for _ in range(limit):
+            try:
+                key, raw = self._ready.get_nowait()
+            except queue.Empty:
+                return
+            with self._lock:
+                self._pending.discard(key)
+            if raw is not None and key not in self._chunks:
+                self._store(key, self._convert(raw))
+                self.stats["prefetched"] += 1
+
+    def close(self):
+        """프리페치 스레드 종료 (프로그램이 끝날 때). 아직 시작 안 한 요청은 버림"""
+        if self._thread is not None:
+            while True:
+                try:
+                    self._requests.get_nowait()
+                except queue.Empty:
+                    break
+            self._requests.put(None)
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    # ─────────────────────────────
+    # 저해상도 단계 통째로
+    # ─────────────────────────────
+    def level_for_zoom(self, zoom: float) -> int:
+        """
+        zoom 배율로 그릴 때 쓸 단계: 원본의 1/2^k가 zoom 이상인 가장 작은 단계
+        (그 단계에서 확대 비율이 1~2배 → 축소할 때도 큰 원본을 줄이지 않음)
+        """
+        level = 0
+        while level + 1 < len(self.levels) and zoom * (2 << level) <= 1.0:
+            level += 1
+        return level
+
+    def level_for_size(self, width: int, height: int) -> int:
+        """width x height 이상인 가장 작은 단계 (미니맵 등 축소 표시용)"""
+        best = 0
+        for level, (w, h) in enumerate(self.levels):
+            if w >= width and h >= height:
+                best = level
+        return best
+
+    def level_image(self, level: int) -> pygame.Surface:
+        """level 단계 전체를 한 장으로 합침 (작은 단계에서만 쓸 것)"""
+        w, h = self.levels[level]
+        cs = self.chunk_size
+        cols, rows = self.grid(level)
+        image = pygame.Surface((w, h))
+        for cy in range(rows):
+            for cx in range(cols):
+                image.blit(self.get(level, cx, cy), (cx * cs, cy * cs))
+        return image
+
+
+if __name__ == "__main__":
+    # python chunked_map.py [map.png] → 청크 다시 만들기
+    import sys
+    path = sys.argv[1] if len(sys.argv) > 1 else "map.png"
+    info = build_chunks(path)
+    print(f"{path}: 청크 {info['chunk_size']}px, 단계 {info['levels']} → {chunk_dir_for(path)}")
@@ -1,6 +1,8 @@
 # dialogue.py
 import pygame
-from fonts import get_font
+import panels
+from fonts import get_font, render_text
+from text_layout import IncrementalWrapper
 
 
 class DialogueManager:
@@ -9,8 +11,10 @@ class DialogueManager:
         self.SCREEN_W, self.SCREEN_H = screen.get_size()
 
         # 폰트
-        self.font = get_font(32)       # 질문 폰트
-        self.small_font = get_font(26) # 선택지 폰트
+        self.font_size = 32
+        self.small_font_size = 26
+        self.font = get_font(self.font_size)             # 질문 폰트
+        self.small_font = get_font(self.small_font_size) # 선택지 폰트
 
         # 상태
         self.active = False
@@ -28,6 +32,16 @@ class DialogueManager:
         self.bg_color = (20, 20, 20)  # 알파는 draw에서 입힘
         self.text_color = (240, 240, 240)
         self.box_h = 210              # 대화창 높이
+        self.margin_x = 40
+        self.margin_y = 26
+
+        # 질문 줄바꿈 (한글 대응, 글자 단위 / 타이핑된 글자만큼만 이어서 계산)
+        self.layout = IncrementalWrapper(self.font, self.SCREEN_W - self.margin_x * 2)
+
+        # dirty rect 계산용: 마지막으로 그린 텍스트 (None이면 아직 안 그림)
+        self._drawn_text = None
+        self._box_rect = None      # 마지막으로 그린 대화창 영역
+        self._erase_rect = None    # 닫힌 뒤 한 번 다시 올려야 할 영역 (화면에 남은 대화창 지우기)
 
     # ─────────────────────────────
     # 외부에서 쓰는 인터페이스
@@ -38,11 +52,13 @@ class DialogueManager:
         self.building_name = building_name
         self.full_text = f"{building_name}에 입장하시겠습니까?"
         self.text = ""
+        self.layout.reset()
 
         # 타이핑 초기화
         self.typing = True
         self.char_index = 0
         self.time_accum = 0.0
+        self._drawn_text = None
 
     def handle_key(self, event):
         """
@@ -55,6 +71,9 @@ class DialogueManager:
         return None
 
     def close(self):
+        if self._box_rect is not None:
+            self._erase_rect = self._box_rect
+            self._box_rect = None
         self.active = False
         self.text = ""
         self.full_text = ""
@@ -62,6 +81,7 @@ class DialogueManager:
         self.typing = False
         self.char_index = 0
         self.time_accum = 0.0
+        self._drawn_text = None
 
     def update(self, dt: float):
         """타이핑 효과 업데이트 (main.py에서 매 프레임마다 호출 필요)"""
@@ -76,66 +96,43 @@ class DialogueManager:
             self.time_accum -= step
             self.char_index += 1
             self.text = self.full_text[:self.char_index]
+        self.layout.set_text(self.text)
 
         # 다 쳤으면 타이핑 종료
         if self.char_index >= len(self.full_text):
             self.typing = False
 
-    # ─────────────────────────────
-    # 텍스트 강제 줄바꿈 함수 (한글 대응, 글자 단위)
-    # ─────────────────────────────
-    def _wrap_text_chars(self, text: str, font: pygame.font.Font, max_width: int):
-        """
-        공백 기준이 아니라 '글자 단위'로 줄을 나눔.
-        한국어 문장은 띄어쓰기 없어도 자연스럽게 줄바꿈 되도록.
-        """
-        if text == "":
-            return []
-
-        lines = []
-        current = ""
-
-        for ch in text:
-            test = current + ch
-            w, _ = font.size(test)
-            if w <= max_width:
-                current = test
-            else:
-                if current:
-                    lines.append(current)
-                current = ch
-
-        if current:
-            lines.append(current)
-
-        return lines
-
     # ─────────────────────────────
     # 그리기
     # ─────────────────────────────
     def draw(self):
+        """
+        대화창을 그리고, 내용이 바뀌었으면 대화창 영역을 리턴 (안 바뀌었으면 []).
+        닫힌 직후 한 번은 대화창이 있던 영역을 리턴 (그 자리에 그려진 월드로 덮도록)
+        """
         if not self.active:
-            return
+            rect, self._erase_rect = self._erase_rect, None
+            return [rect] if rect is not None else []
 
         screen = self.screen
         box_top = self.SCREEN_H - self.box_h
 
         # 🔹 반투명 배경 박스
-        dialog_surface = pygame.Surface((self.SCREEN_W, self.box_h), pygame.SRCALPHA)
-        dialog_surface.fill((*self.bg_color, 190))
-        screen.blit(dialog_surface, (0, box_top))
+        dialog_surface = panels.get_panel((self.SCREEN_W, self.box_h), self.bg_color, 190)
+        box_rect = screen.blit(dialog_surface, (0, box_top))
+        self._box_rect = box_rect
+        self._erase_rect = None
 
-        margin_x = 40
-        margin_y = 26
-        max_text_width = self.SCREEN_W - margin_x * 2
+        margin_x = self.margin_x
+        margin_y = self.margin_y
 
         # 1) 질문 줄바꿈해서 그리기
-        lines = self._wrap_text_chars(self.text, self.font, max_text_width)
+        lines = self.layout.lines()
 
         y = box_top + margin_y
 
         for line in lines:
-            surf = self.font.render(line, True, self.text_color)
+            surf = render_text(line, self.font_size, self.text_color)
             screen.blit(surf, (margin_x, y))
             y += self.font.get_height() + 8  # 줄 간격
 
@@ -144,13 +141,17 @@ class DialogueManager:
 
         # 2) 질문 "다음 줄"에 선택지 1번
         choice1_text = "1 : 입장하겠습니다."
-        choice1_surf = self.small_font.render(choice1_text, True, (220, 220, 220))
+        choice1_surf = render_text(choice1_text, self.small_font_size, (220, 220, 220))
         choice1_y = last_line_bottom + 10
         screen.blit(choice1_surf, (margin_x, choice1_y))
 
         # 3) 그 아래 줄에 선택지 2번
         choice2_text = "2 : 입장하지 않고 더 살펴보겠습니다."
-        choice2_surf = self.small_font.render(choice2_text, True, (220, 220, 220))
+        choice2_surf = render_text(choice2_text, self.small_font_size, (220, 220, 220))
         choice2_y = choice1_y + self.small_font.get_height() + 6
         screen.blit(choice2_surf, (margin_x, choice2_y))
 
+        if self.text == self._drawn_text:
+            return []
+        self._drawn_text = self.text
+        return [box_rect]
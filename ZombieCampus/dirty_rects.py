@@ -0,0 +1,65 @@
+# dirty_rects.py
+import pygame
+
+
+class DirtyRectCompositor:
+    """
+    바뀐 영역(dirty rect)만 디스플레이로 올려 보내는 합성기.
+    - enabled=False 이면 기존처럼 매 프레임 전체 flip
+    - 각 컴포넌트(World, DialogueManager 등)가 이번 프레임에 바꾼 영역을 mark()로 보고
+    - present()에서 '이번 프레임 + 지난 프레임' 영역만 update
+      (지난 프레임에 그렸던 것이 사라진 자리도 지워져야 하므로)
+    """
+
+    # 바뀐 영역이 화면의 이 비율을 넘으면 그냥 전체 flip이 더 쌈
+    FULL_FLIP_RATIO = 0.6
+
+    def __init__(self, screen, enabled: bool = False):
+        self.screen = screen
+        self.enabled = enabled
+        self.screen_rect = screen.get_rect()
+
+        self._rects = []
+        self._prev_rects = []
+        self._full = True  # 첫 프레임은 무조건 전체
+
+    # ─────────────────────────────
+    # 영역 보고
+    # ─────────────────────────────
+    def mark(self, rects):
+        """Rect / (x, y, w, h) / 그 리스트 / None 모두 받음"""
+        if not rects:
+            return
+        if isinstance(rects, (pygame.Rect, tuple)):
+            rects = [rects]
+
+        for r in rects:
+            r = pygame.Rect(r).clip(self.screen_rect)
+            if r.width > 0 and r.height > 0:
+                self._rects.append(r)
+
+    def invalidate_all(self):
+        """씬 전환 등 화면 전체가 바뀌었을 때"""
+        self._full = True
+
+    # ─────────────────────────────
+    # 디스플레이로 내보내기
+    # ─────────────────────────────
+    def present(self):
+        if not self.enabled or self._full:
+            pygame.display.flip()
+            self._prev_rects = self._rects
+            self._rects = []
+            self._full = False
+            return
+
+        rects = self._prev_rects + self._rects
+        area = sum(r.width * r.height for r in rects)
+
+        if area >= self.screen_rect.width * self.screen_rect.height * self.FULL_FLIP_RATIO:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
+
+        self._prev_rects = self._rects
+        self._rects = []
@@ -0,0 +1,115 @@
+# effects.py
+import alloc_stats
+import panels
+from fonts import render_text
+
+
+class Effect:
+    """
+    시간이 지나면 끝나는 화면 효과.
+    pygame.time.delay로 멈추는 대신 매 step update(dt), 매 프레임 draw(screen)로 돌아감.
+    끝나면 finished=True, on_done이 있으면 한 번 호출.
+    """
+
+    def __init__(self, duration: float, on_done=None):
+        self.duration = duration
+        self.elapsed = 0.0
+        self.finished = False
+        self.on_done = on_done
+
+    @property
+    def progress(self) -> float:
+        """0.0(시작) ~ 1.0(끝)"""
+        if self.duration <= 0:
+            return 1.0
+        return min(self.elapsed / self.duration, 1.0)
+
+    def update(self, dt: float):
+        if self.finished:
+            return
+        self.elapsed += dt
+        if self.elapsed >= self.duration:
+            self.finished = True
+            if self.on_done:
+                self.on_done()
+
+    def draw(self, screen):
+        """그린 영역(Rect 리스트)을 리턴"""
+        return []
+
+
+class FloatingText(Effect):
+    """위로 떠오르면서 사라지는 글자 (예: 피격 시 '-20')"""
+
+    def __init__(self, text: str, pos, size: int = 60, color=(255, 50, 50),
+                 duration: float = 0.6, rise: float = 60):
+        super().__init__(duration)
+        # 알파를 바꿔야 하니 캐시된 Surface를 복사해서 씀 (효과 하나당 한 번)
+        alloc_stats.count("effect")
+        self.surface = render_text(text, size, color).copy()
+        self.x, self.y = pos
+        self.rise = rise
+
+    def draw(self, screen):
+        p = self.progress
+        self.surface.set_alpha(int(255 * (1.0 - p * p)))
+        return [screen.blit(self.surface, (self.x, self.y - self.rise * p))]
+
+
+class Fade(Effect):
+    """화면 전체를 color로 덮는 알파를 start_alpha → end_alpha로 바꿈 (페이드 인/아웃, 피격 플래시)"""
+
+    def __init__(self, duration: float, color=(0, 0, 0), start_alpha: int = 0, end_alpha: int = 255,
+                 on_done=None):
+        super().__init__(duration, on_done)
+        self.color = color
+        self.start_alpha = start_alpha
+        self.end_alpha = end_alpha
+
+    def draw(self, screen):
+        a = self.start_alpha + (self.end_alpha - self.start_alpha) * self.progress
+        overlay = panels.get_solid(screen.get_size(), self.color)
+        overlay.set_alpha(int(a))
+        return [screen.blit(overlay, (0, 0))]
+
+
+class DeathScreen(Effect):
+    """사망 화면: 흰 배경 + 빨간 글자를 duration초 동안 보여줌"""
+
+    def __init__(self, text: str = "당신은 좀비에게 잡혀 사망했습니다!", duration: float = 1.5, on_done=None):
+        super().__init__(duration, on_done)
+        self.text = text
+
+    def draw(self, screen):
+        screen.fill((255, 255, 255))
+        text = render_text(self.text, 60, (200, 0, 0))
+        screen.blit(text, text.get_rect(center=screen.get_rect().center))
+        return [screen.get_rect()]
+
+
+class EffectManager:
+    """진행 중인 효과들을 들고 있다가 한꺼번에 update / draw"""
+
+    def __init__(self):
+        self.effects = []
+
+    def add(self, effect: Effect) -> Effect:
+        self.effects.append(effect)
+        return effect
+
+    def update(self, dt: float):
+        for effect in self.effects:
+            effect.update(dt)
+        self.effects = [e for e in self.effects if not e.finished]
+
+    def draw(self, screen):
+        dirty = []
+        for effect in self.effects:
+            dirty.extend(effect.draw(screen))
+        return dirty
+
+    def clear(self):
+        self.effects = []
+
+    def __bool__(self):
+        return bool(self.effects)
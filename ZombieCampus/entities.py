@@ -0,0 +1,178 @@
+# entities.py
+import numpy as np
+
+# 구역 이름: 캠퍼스 월드 (건물 안은 건물 이름)
+WORLD_ZONE = "campus"
+
+# 주울 수 있는 것 (종류 이름, 맵 파일의 item kind와 같음)
+ITEM = "item"
+KEY = "key"     # 탈출키
+
+# 엔티티 하나의 크기 (구역 좌표 px, 줍기 판정 / 그리기 공용)
+PICKUP_SIZE = 24
+
+
+class EntityStore:
+    """
+    아이템 / 탈출키 같은 엔티티들을 열(column)별 NumPy 배열로 모아 둔 저장소.
+    - 엔티티 = 배열 번호(id). 엔티티마다 파이썬 객체가 없음
+    - 열: alive(bool), kind(종류 번호), zone(구역 번호), pos(x, y 왼쪽 위 기준)
+    - 지운 id는 free 리스트에 넣었다가 create 때 다시 씀 → 만들고 지우기를 반복해도
+      배열이 커지지 않음 (꽉 차면 두 배로 늘림)
+    - 질의(select / in_rect)는 쓰인 범위(:_high)에 대한 배열 연산 한 번
+    종류 / 구역 이름은 처음 볼 때 번호를 붙임 (kind_id / zone_id)
+    월드 씬과 건물 씬이 같은 저장소를 같이 씀 (zone으로 구분). pygame에 의존하지 않음
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.kind = np.zeros(capacity, dtype=np.int16)
+        self.zone = np.zeros(capacity, dtype=np.int16)
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+
+        self._free = []    # 지운 id (스택: 최근에 지운 것부터 재사용)
+        self._high = 0     # 한 번이라도 쓴 id의 끝 (이 뒤는 전부 빈 칸)
+        self._count = 0
+
+        self._kinds = {}   # 이름 -> 번호
+        self._zones = {}
+        self.kind_names = []
+        self.zone_names = []
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def capacity(self) -> int:
+        return len(self.alive)
+
+    # ─────────────────────────────
+    # 종류 / 구역 번호
+    # ─────────────────────────────
+    def kind_id(self, name: str) -> int:
+        i = self._kinds.get(name)
+        if i is None:
+            i = self._kinds[name] = len(self.kind_names)
+            self.kind_names.append(name)
+        return i
+
+    def zone_id(self, name: str) -> int:
+        i = self._zones.get(name)
+        if i is None:
+            i = self._zones[name] = len(self.zone_names)
+            self.zone_names.append(name)
+        return i
+
+    # ─────────────────────────────
+    # 만들기 / 지우기
+    # ─────────────────────────────
+    def _grow(self, needed: int):
+        capacity = self.capacity
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in ("alive", "kind", "zone", "pos"):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def _allocate(self, n: int):
+        """빈 id n개 (free 리스트 먼저, 모자라면 끝에서 새로)"""
+        reused = self._free[-n:] if n else []
+        del self._free[len(self._free) - len(reused):]
+        fresh = n - len(reused)
+        self._grow(self._high + fresh)
+        ids = np.array(reused[::-1], dtype=np.int64)
+        if fresh:
+            ids = np.concatenate((ids, np.arange(self._high, self._high + fresh)))
+            self._high += fresh
+        return ids
+
+    def create(self, kind: str, x: float, y: float, zone: str = WORLD_ZONE) -> int:
+        return int(self.create_many(kind, [(x, y)], zone)[0])
+
+    def create_many(self, kind: str, positions, zone: str = WORLD_ZONE):
+        """같은 종류 / 구역 엔티티 여러 개. positions: (N, 2) → 새 id 배열"""
+        positions = np.asarray(positions, dtype=np.float32).reshape(-1, 2)
+        ids = self._allocate(len(positions))
+        self.alive[ids] = True
+        self.kind[ids] = self.kind_id(kind)
+        self.zone[ids] = self.zone_id(zone)
+        self.pos[ids] = positions
+        self._count += len(ids)
+        return ids
+
+    def destroy(self, entity_id: int):
+        self.destroy_many([entity_id])
+
+    def destroy_many(self, ids):
+        """ids 엔티티들을 지움 (이미 지운 id는 무시)"""
+        ids = np.unique(np.asarray(ids, dtype=np.int64))
+        ids = ids[self.alive[ids]]
+        self.alive[ids] = False
+        self._free.extend(ids.tolist())
+        self._count -= len(ids)
+
+    def clear(self):
+        self.alive[:self._high] = False
+        self._free = []
+        self._high = 0
+        self._count = 0
+
+    # ─────────────────────────────
+    # 질의
+    # ─────────────────────────────
+    def _mask(self, kind: str = None, zone: str = None):
+        n = self._high
+        mask = self.alive[:n].copy()
+        if kind is not None:
+            if kind not in self._kinds:
+                return None
+            mask &= self.kind[:n] == self._kinds[kind]
+        if zone is not None:
+            if zone not in self._zones:
+                return None
+            mask &= self.zone[:n] == self._zones[zone]
+        return mask
+
+    def select(self, kind: str = None, zone: str = None):
+        """살아 있는 엔티티 id 배열 (kind / zone으로 거름)"""
+        mask = self._mask(kind, zone)
+        return _NO_IDS if mask is None else np.flatnonzero(mask)
+
+    def count(self, kind: str = None, zone: str = None) -> int:
+        mask = self._mask(kind, zone)
+        return 0 if mask is None else int(np.count_nonzero(mask))
+
+    def in_rect(self, x: float, y: float, w: float, h: float, size: float = PICKUP_SIZE,
+                kind: str = None, zone: str = None):
+        """
+        size 크기 엔티티 중 (x, y, w, h) 사각형과 겹치는 id 배열
+        (pygame.Rect.colliderect와 같은 판정: 변이 닿기만 하면 겹침 아님)
+        """
+        mask = self._mask(kind, zone)
+        if mask is None:
+            return _NO_IDS
+        pos = self.pos[:self._high]
+        mask &= (pos[:, 0] < x + w) & (x < pos[:, 0] + size)
+        mask &= (pos[:, 1] < y + h) & (y < pos[:, 1] + size)
+        return np.flatnonzero(mask)
+
+    def pick_up(self, x: float, y: float, w: float, h: float, zone: str = WORLD_ZONE):
+        """(x, y, w, h)에 닿은 zone의 엔티티를 지우고 종류 이름 리스트를 리턴 (플레이어가 줍기)"""
+        ids = self.in_rect(x, y, w, h, zone=zone)
+        if len(ids) == 0:
+            return []
+        kinds = self.kinds_of(ids)
+        self.destroy_many(ids)
+        return kinds
+
+    def kinds_of(self, ids):
+        """id 배열 → 종류 이름 리스트"""
+        names = self.kind_names
+        return [names[k] for k in self.kind[np.asarray(ids, dtype=np.int64)].tolist()]
+
+
+_NO_IDS = np.zeros(0, dtype=np.int64)
@@ -1,10 +1,64 @@
 # fonts.py
 import pygame
 import os
+from collections import OrderedDict
+
+import alloc_stats
 
 # 이 파일(fonts.py)와 같은 폴더에 있는 gamefont.ttf 사용
 FONT_PATH = os.path.join(os.path.dirname(__file__), "gamefont.ttf")
 
+# 크기별 폰트 객체 (ttf는 크기당 한 번만 파싱)
+_fonts = {}
+
+# 렌더링된 텍스트 Surface LRU 캐시: (text, size, color, antialias) -> Surface
+TEXT_CACHE_SIZE = 256
+_text_cache = OrderedDict()
+_text_stats = {"hits": 0, "misses": 0}
+
+
 def get_font(size: int) -> pygame.font.Font:
-    """지정한 size의 공통 폰트 객체를 반환"""
-    return pygame.font.Font(FONT_PATH, size)
+    """지정한 size의 공통 폰트 객체를 반환 (크기별로 한 번만 생성)"""
+    font = _fonts.get(size)
+    if font is None:
+        font = pygame.font.Font(FONT_PATH, size)
+        _fonts[size] = font
+    return font
+
+
+def render_text(text: str, size: int, color, antialias: bool = True) -> pygame.Surface:
+    """
+    get_font(size).render(...)와 같지만, 같은 문자열은 캐시된 Surface를 돌려줌.
+    리턴된 Surface는 공유되므로 직접 수정하지 말 것.
+    """
+    key = (text, size, tuple(color), antialias)
+    surf = _text_cache.get(key)
+    if surf is not None:
+        _text_cache.move_to_end(key)
+        _text_stats["hits"] += 1
+        return surf
+
+    _text_stats["misses"] += 1
+    alloc_stats.count("text")
+    surf = get_font(size).render(text, antialias, color)
+    _text_cache[key] = surf
+    if len(_text_cache) > TEXT_CACHE_SIZE:
+        _text_cache.popitem(last=False)  # 가장 오래 안 쓴 문자열 제거
+    return surf
+
+
+def text_cache_stats() -> dict:
+    """텍스트 캐시 hit/miss 카운터와 현재 크기"""
+    return {
+        "hits": _text_stats["hits"],
+        "misses": _text_stats["misses"],
+        "size": len(_text_cache),
+        "fonts": len(_fonts),
+    }
+
+
+def clear_text_cache():
+    """텍스트 캐시와 카운터 초기화 (폰트 객체는 유지)"""
+    _text_cache.clear()
+    _text_stats["hits"] = 0
+    _text_stats["misses"] = 0
@@ -0,0 +1,63 @@
+# game_loop.py
+import pygame
+
+# 시뮬레이션은 항상 이 주기로 (렌더링 FPS와 무관)
+SIM_HZ = 60
+# 렌더링 FPS 상한 (0이면 제한 없음)
+DEFAULT_MAX_FPS = 60
+
+
+class FixedTimestep:
+    """
+    고정 타임스텝 스케줄러.
+    - 실제 경과 시간을 accumulator에 쌓고, step_dt 단위로 잘라 시뮬레이션 횟수(steps)를 돌려줌
+    - 남은 시간 비율(alpha, 0~1)은 렌더링 보간용
+    - 렌더링이 밀리면 한 프레임에 여러 step을 돌려 따라잡음 (그만큼 렌더링은 건너뜀)
+    - 한 프레임에 max_steps 넘게는 안 돌림 → 너무 밀리면 남은 시간은 버림 (무한 따라잡기 방지)
+
+    사용법:
+        steps, alpha = loop.tick()
+        for _ in range(steps):
+            update(loop.step_dt)
+        draw(alpha)
+    """
+
+    def __init__(self, clock=None, sim_hz: int = SIM_HZ, max_fps: int = DEFAULT_MAX_FPS,
+                 max_steps: int = 5):
+        self.clock = clock if clock is not None else pygame.time.Clock()
+        self.step_dt = 1.0 / sim_hz
+        self.max_fps = max_fps
+        self.max_steps = max_steps
+
+        self.accumulator = 0.0
+        self.frame_dt = 0.0        # 이번 프레임의 실제 경과 시간(초)
+        self.skipped_steps = 0     # 너무 밀려서 버린 step 수 (누적, 프로파일러 오버레이에 표시)
+
+    def tick(self):
+        """한 프레임 진행. (이번 프레임에 돌릴 step 수, 보간 alpha) 리턴"""
+        self.frame_dt = self.clock.tick(self.max_fps) / 1000
+        self.accumulator += self.frame_dt
+
+        steps = 0
+        while self.accumulator >= self.step_dt and steps < self.max_steps:
+            self.accumulator -= self.step_dt
+            steps += 1
+
+        if self.accumulator >= self.step_dt:
+            dropped = int(self.accumulator / self.step_dt)
+            self.skipped_steps += dropped
+            self.accumulator -= dropped * self.step_dt
+
+        return steps, self.accumulator / self.step_dt
+
+    def reset(self):
+        """
+        오래 멈췄던 뒤(씬 전환, 블로킹 대기 등) 밀린 시간을 버림.
+        clock.tick()을 한 번 불러서 다음 tick의 경과 시간도 0에서 시작.
+        """
+        self.clock.tick()
+        self.accumulator = 0.0
+
+
+def lerp(a: float, b: float, alpha: float) -> float:
+    return a + (b - a) * alpha
@@ -0,0 +1,54 @@
+# headless.py
+import os
+
+
+def init_headless(size=(1200, 800)):
+    """
+    창 없이 pygame 초기화 (SDL dummy 드라이버).
+    pygame.display가 초기화되기 전에 불러야 함. 화면 Surface를 리턴.
+    """
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    import pygame
+    pygame.init()
+    return pygame.display.set_mode(size)
+
+
+class KeyState:
+    """pygame.key.get_pressed() 결과처럼 keys[pygame.K_LEFT]로 읽을 수 있는 키 상태"""
+
+    __slots__ = ("pressed",)
+
+    def __init__(self, pressed=()):
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+class ScriptedInput:
+    """
+    프레임 번호에 따라 정해진 키를 누르는 가짜 입력.
+    script: [(시작 프레임, 끝 프레임(미포함), {키, ...}), ...]
+    끝까지 가면 처음부터 반복 (loop_frames = 마지막 구간의 끝)
+    World(key_source=...) / BuildingScene(key_source=...)에 get_pressed를 넘겨서 사용.
+    """
+
+    def __init__(self, script):
+        self.script = list(script)
+        self.loop_frames = max((end for _, end, _ in self.script), default=1)
+        self.frame = 0
+        self._idle = KeyState()
+        self._states = [(start, end, KeyState(keys)) for start, end, keys in self.script]
+
+    def advance(self):
+        """다음 프레임으로 (한 시뮬레이션 step마다 호출)"""
+        self.frame += 1
+
+    def get_pressed(self):
+        f = self.frame % self.loop_frames
+        for start, end, state in self._states:
+            if start <= f < end:
+                return state
+        return self._idle
@@ -0,0 +1,134 @@
+# horde.py
+import numpy as np
+
+from spatial import GridIndex
+
+
+class Horde:
+    """
+    좀비 여러 마리를 NumPy 배열로 한꺼번에 시뮬레이션.
+    - pos, vel: (N, 2) float 배열 (좌표는 스프라이트 왼쪽 위 기준, 기존 코드와 동일)
+    - 추적 / 서로 밀어내기는 배열 연산으로 처리
+    - 좀비끼리 밀어내기 / 플레이어 충돌은 격자 인덱스(GridIndex)로 주변 칸만 봄
+      (인덱스 갱신도 배열 연산, 칸이 바뀐 좀비가 없으면 다시 정렬 안 함)
+    - grid(NavGrid)가 있으면 막힌 칸에는 스폰/이동하지 않고, update에 흐름장을 주면 그걸 따라감
+    pygame에 의존하지 않음 (렌더링은 호출하는 쪽에서)
+    """
+
+    def __init__(self, count: int, bounds, size: int, speed: float,
+                 separation_radius: float = None, separation_weight: float = 0.6, rng=None,
+                 grid=None):
+        self.count = count
+        self.grid = grid
+        self.bound_w, self.bound_h = bounds
+        self.size = size
+        self.speed = speed  # px/s
+        self.separation_radius = separation_radius or size * 0.75
+        self.separation_weight = separation_weight
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+        self.pos = np.zeros((count, 2), dtype=np.float64)
+        self.vel = np.zeros((count, 2), dtype=np.float64)
+
+        # 밀어내기용 격자 (칸 크기 = 밀어내기 반경)
+        self.index = GridIndex(self.separation_radius, bounds)
+        self.respawn(np.arange(count))
+
+    # ─────────────────────────────
+    # 스폰
+    # ─────────────────────────────
+    def respawn(self, indices):
+        """indices 좀비들을 화면 안 랜덤 위치로 다시 배치"""
+        indices = np.asarray(indices)
+        n = len(indices)
+        if n == 0:
+            return
+        self.pos[indices, 0] = self.rng.integers(0, self.bound_w - self.size + 1, n)
+        self.pos[indices, 1] = self.rng.integers(0, self.bound_h - self.size + 1, n)
+
+        # 막힌 칸에 떨어진 좀비는 다시 뽑기 (몇 번 해도 안 되면 그 자리 그대로)
+        if self.grid is not None:
+            for _ in range(20):
+                bad = indices[self.grid.blocked_at(self.pos[indices] + self.size / 2)]
+                if len(bad) == 0:
+                    break
+                self.pos[bad, 0] = self.rng.integers(0, self.bound_w - self.size + 1, len(bad))
+                self.pos[bad, 1] = self.rng.integers(0, self.bound_h - self.size + 1, len(bad))
+
+        self.vel[indices] = 0.0
+        self.index.update(self.pos)
+
+    # ─────────────────────────────
+    # 업데이트
+    # ─────────────────────────────
+    def _separation(self):
+        """
+        좀비끼리 겹치지 않도록 밀어내는 방향.
+        인덱스 격자(neighbor_sums)로 주변 3x3 칸에 있는 다른 좀비들의
+        평균 위치를 구하고, 거기서 멀어지는 쪽으로 민다 (O(N + 칸 수), 쌍별 비교 없음.
+        칸 경계 바로 건너편 좀비도 이웃으로 봄)
+        """
+        pos = self.pos
+        sums = self.index.neighbor_sums(np.column_stack((np.ones(len(pos)), pos)))
+        others = sums[:, 0] - 1
+        sum_xy = sums[:, 1:] - pos
+
+        n = np.maximum(others, 1)[:, None]
+        away = pos - sum_xy / n
+        dist = np.linalg.norm(away, axis=1, keepdims=True)
+        crowded = (others > 0)[:, None] & (dist > 1e-6)
+        return np.where(crowded, away / np.maximum(dist, 1e-6), 0.0)
+
+    def update(self, dt: float, target_x: float, target_y: float, flow=None):
+        """
+        모든 좀비를 (target_x, target_y) 쪽으로 dt초만큼 이동.
+        flow(FlowField)가 있으면 좀비 중심이 있는 칸의 흐름 방향을 따라감
+        (목표와 같은 칸 / 도달 불가 칸이면 직선 추적)
+        """
+        if self.count == 0:
+            return
+
+        to_target = np.array((target_x, target_y)) - self.pos
+        dist = np.linalg.norm(to_target, axis=1, keepdims=True)
+        chase = to_target / np.maximum(dist, 1e-6)
+
+        if flow is not None:
+            dirs, valid = flow.directions(self.pos + self.size / 2)
+            chase = np.where(valid[:, None], dirs, chase)
+
+        steer = chase + self._separation() * self.separation_weight
+        steer_len = np.linalg.norm(steer, axis=1, keepdims=True)
+        self.vel = steer / np.maximum(steer_len, 1e-6) * self.speed
+
+        old = self.pos.copy()
+        self.pos += self.vel * dt
+        np.clip(self.pos[:, 0], 0, self.bound_w - self.size, out=self.pos[:, 0])
+        np.clip(self.pos[:, 1], 0, self.bound_h - self.size, out=self.pos[:, 1])
+        if self.grid is not None:
+            self._slide(old)
+        self.index.update(self.pos)
+
+    def _slide(self, old):
+        """막힌 칸으로 들어간 좀비는 x / y 중 막히지 않는 축으로만 이동 (벽을 따라 미끄러짐)"""
+        half = self.size / 2
+        stuck = self.grid.blocked_at(self.pos + half)
+        if not stuck.any():
+            return
+        idx = np.nonzero(stuck)[0]
+        new = self.pos[idx]
+        only_x = np.stack((new[:, 0], old[idx, 1]), axis=1)
+        only_y = np.stack((old[idx, 0], new[:, 1]), axis=1)
+        x_ok = ~self.grid.blocked_at(only_x + half)
+        y_ok = ~self.grid.blocked_at(only_y + half)
+        self.pos[idx] = np.where(x_ok[:, None], only_x, np.where(y_ok[:, None], only_y, old[idx]))
+
+    # ─────────────────────────────
+    # 충돌
+    # ─────────────────────────────
+    def hits(self, player_x: float, player_y: float, player_size: int):
+        """
+        플레이어와 겹친 좀비 인덱스 배열 (기존 abs(dx) < size 판정과 동일, 오름차순).
+        인덱스에서 플레이어 주변 칸의 좀비만 꺼내 봄
+        """
+        return self.index.query_rect(player_x - player_size, player_y - player_size,
+                                     player_x + player_size, player_y + player_size)
@@ -1,6 +1,8 @@
 # intro_typing.py
-import pygame
-from fonts import get_font
+import alloc_stats
+import panels
+from fonts import get_font, render_text
+from text_layout import IncrementalWrapper, LaidOutParagraph
 
 
 class IntroTypingManager:
@@ -9,9 +11,12 @@ class IntroTypingManager:
         self.SCREEN_W, self.SCREEN_H = screen.get_size()
 
         # 폰트
-        self.font_main = get_font(32)      # 첫 줄 & 마지막 줄
-        self.font_warning = get_font(26)   # '주의' 문장 전용
-        self.small_font = get_font(24)     # ENTER 안내
+        self.font_main_size = 32
+        self.font_warning_size = 26
+        self.small_font_size = 24
+        self.font_main = get_font(self.font_main_size)        # 첫 줄 & 마지막 줄
+        self.font_warning = get_font(self.font_warning_size)  # '주의' 문장 전용
+        self.small_font = get_font(self.small_font_size)      # ENTER 안내
 
         # 문장 리스트
         self.lines = lines
@@ -26,37 +31,53 @@ class IntroTypingManager:
 
         self.finished = False
 
-    # -------------------------------------------------------
-    # 줄바꿈(\n) 처리 + 자동 줄바꿈 처리
-    # -------------------------------------------------------
-    def _wrap_text_chars(self, text: str, font: pygame.font.Font, max_width: int):
-        # 강제 줄바꿈 (\n)
-        if "\n" in text:
-            lines = []
-            for raw in text.split("\n"):
-                wrapped = self._wrap_text_chars(raw, font, max_width)
-                lines.extend(wrapped)
-            return lines
-
-        if text == "":
-            return []
-
-        current = ""
-        lines = []
-
-        for ch in text:
-            test = current + ch
-            w, _ = font.size(test)
-            if w <= max_width:
-                current = test
-            else:
-                lines.append(current)
-                current = ch
+        # 줄바꿈 레이아웃 (끝난 문장은 렌더링된 Surface로, 치는 중인 문장은 증분 계산)
+        self.max_width = int(self.SCREEN_W * 0.75)
+        self._paragraphs = {}
+        self._typing_wrapper = None
+        self._typing_idx = None
+        # 치고 있는 마지막 줄: 글자가 늘 때마다 바뀌므로 render_text LRU에 넣지 않고 여기에만 ((텍스트, 폰트, 색), Surface)
+        self._typing_surface = (None, None)
 
-        if current:
-            lines.append(current)
+        # dirty rect 계산용: 마지막으로 그린 상태 / 영역
+        self._drawn_state = None
 
-        return lines
+    # -------------------------------------------------------
+    # 문장별 스타일 / 줄바꿈 레이아웃
+    # -------------------------------------------------------
+    def _style(self, idx):
+        """idx번 문장의 (폰트, 폰트 크기, 색)"""
+        if idx == 1:
+            return self.font_warning, self.font_warning_size, (255, 230, 190)
+        return self.font_main, self.font_main_size, (255, 255, 255)
+
+    def _paragraph(self, idx):
+        """다 쳐진 문장은 한 번만 줄바꿈/렌더링해서 재사용"""
+        para = self._paragraphs.get(idx)
+        if para is None:
+            font, _, color = self._style(idx)
+            para = LaidOutParagraph(self.lines[idx], font, color, self.max_width)
+            self._paragraphs[idx] = para
+        return para
+
+    def _typing_layout(self):
+        """지금 치고 있는 문장의 줄바꿈 (새 글자만큼만 이어서 계산)"""
+        if self._typing_idx != self.current_line:
+            font, _, _ = self._style(self.current_line)
+            self._typing_wrapper = IncrementalWrapper(font, self.max_width)
+            self._typing_idx = self.current_line
+        self._typing_wrapper.set_text(self.display_text)
+        return self._typing_wrapper.lines()
+
+    def _typing_line(self, text, font, color):
+        """치고 있는 마지막 줄 Surface (글자가 바뀔 때만 다시 렌더링)"""
+        key = (text, font, color)
+        drawn, surf = self._typing_surface
+        if drawn != key:
+            alloc_stats.count("text")
+            surf = font.render(text, True, color)
+            self._typing_surface = (key, surf)
+        return surf
 
     # -------------------------------------------------------
     # 타이핑 업데이트
@@ -87,44 +108,24 @@ class IntroTypingManager:
     # 화면 렌더링
     # -------------------------------------------------------
     def draw(self):
+        """인트로 텍스트를 그리고, 바뀐 영역(Rect 리스트)을 리턴"""
         screen = self.screen
 
-        max_width = int(self.SCREEN_W * 0.75)
-        render_lines = []
-
-        # 이미 끝난 문장들
-        for idx in range(self.current_line):
-            base = self.lines[idx]
-            if idx == 1:
-                font = self.font_warning
-                color = (255, 230, 190)
-            else:
-                font = self.font_main
-                color = (255, 255, 255)
+        max_width = self.max_width
 
-            wrapped = self._wrap_text_chars(base, font, max_width)
-            for s in wrapped:
-                render_lines.append((s, font, color))
+        # 이미 끝난 문장들 (미리 렌더링된 문단 Surface)
+        paragraphs = [self._paragraph(idx) for idx in range(self.current_line)]
 
         # 현재 타이핑 중인 문장
-        cur = self.current_line
-        if cur < len(self.lines):
-            if cur == 1:
-                font = self.font_warning
-                color = (255, 230, 190)
-            else:
-                font = self.font_main
-                color = (255, 255, 255)
-
-            wrapped = self._wrap_text_chars(self.display_text, font, max_width)
-            for s in wrapped:
-                render_lines.append((s, font, color))
+        font, size, color = self._style(self.current_line)
+        typing_lines = self._typing_layout()
 
-        if not render_lines:
-            return
+        if not paragraphs and not typing_lines:
+            return []
 
         # 전체 높이 계산
-        total_h = sum(font.get_height() + 10 for (_, font, _) in render_lines)
+        total_h = (sum(p.height for p in paragraphs)
+                   + len(typing_lines) * (font.get_height() + 10))
 
         # 🔹 위치: 화면 중앙보다 위쪽
         box_center_y = int(self.SCREEN_H * 0.30)  # 0.35 → 0.30 더 위
@@ -136,29 +137,41 @@ class IntroTypingManager:
         box_y = start_y - 20
 
         # 반투명 박스
-        bg = pygame.Surface((box_w, box_h), pygame.SRCALPHA)
-        bg.fill((0, 0, 0, 150))
-        screen.blit(bg, (box_x, box_y))
+        bg = panels.get_panel((box_w, box_h), (0, 0, 0), 150)
+        dirty = [screen.blit(bg, (box_x, box_y))]
 
         # 텍스트 렌더링
         x = box_x + 20
         y = start_y
 
-        for text, font, color in render_lines:
-            surf = font.render(text, True, color)
+        for para in paragraphs:
+            screen.blit(para.surface, (x, y))
+            y += para.height
+
+        for i, text in enumerate(typing_lines):
+            if i < len(typing_lines) - 1:
+                surf = render_text(text, size, color)   # 줄바꿈된 앞줄은 더 안 바뀜
+            else:
+                surf = self._typing_line(text, font, color)
             screen.blit(surf, (x, y))
             y += font.get_height() + 10
 
         # ENTER 안내
         if self.finished:
-            hint = self.small_font.render("ENTER를 눌러 게임을 시작합니다.", True, (255, 255, 180))
+            hint = render_text("ENTER를 눌러 게임을 시작합니다.", self.small_font_size, (255, 255, 180))
             hint_rect = hint.get_rect(center=(self.SCREEN_W // 2, self.SCREEN_H - 80))
 
             bg_w = hint_rect.width + 40
             bg_h = hint_rect.height + 20
-            hint_bg = pygame.Surface((bg_w, bg_h), pygame.SRCALPHA)
-            hint_bg.fill((0, 0, 0, 160))
+            hint_bg = panels.get_panel((bg_w, bg_h), (0, 0, 0), 160)
 
-            screen.blit(hint_bg, (hint_rect.centerx - bg_w // 2,
-                                  hint_rect.centery - bg_h // 2))
+            dirty.append(screen.blit(hint_bg, (hint_rect.centerx - bg_w // 2,
+                                               hint_rect.centery - bg_h // 2)))
             screen.blit(hint, hint_rect)
+
+        # 타이핑 상태가 그대로면 화면도 그대로
+        state = (self.current_line, self.char_index, self.finished)
+        if state == self._drawn_state:
+            return []
+        self._drawn_state = state
+        return dirty
@@ -0,0 +1,172 @@
+# map_renderer.py
+import pygame
+from collections import OrderedDict
+
+import alloc_stats
+
+# 타일을 확대할 때 주변 청크에서 더 가져오는 테두리 (단계 px).
+# smoothscale 확대는 이웃 픽셀과 섞으므로 타일만 따로 확대하면 경계에 이음매가 생김
+# (맵 전체를 한 번에 확대했을 때와 샘플 위치가 최대 1px 어긋나므로 필터 1px + 1px)
+TILE_PAD = 2
+# 앞쪽 테두리는 TILE_PAD ~ TILE_PAD + PAD_CHOICES - 1 px 중 샘플 위치가 가장 잘 맞는 것으로
+PAD_CHOICES = 4
+
+
+def _fit(start: int, size: int, limit: int, dst: int, dst_size: int, full_dst: int):
+    """
+    한 축: 단계 이미지 전체(limit px)를 full_dst px로 smoothscale 확대했을 때의
+    [dst, dst + dst_size) 구간을, 단계 [start, start + size) 영역에 테두리를 붙여서
+    따로 확대해 얻는 방법 → (테두리 붙인 시작, 그 크기, 확대 크기, 자를 위치).
+    smoothscale 확대의 샘플 위치는 X * (src - 1) / dst → 같은 기울기가 되는 확대 크기를 고르고
+    타일 가운데에서 샘플 위치를 맞춤. 자를 위치가 정수라 남는 소수 어긋남이
+    가장 작은 앞쪽 테두리를 고름
+    """
+    slope = (limit - 1) / full_dst
+    end = min(limit, start + size + TILE_PAD)
+    middle = dst + dst_size / 2
+    best = None
+    for pad in range(TILE_PAD, TILE_PAD + PAD_CHOICES):
+        padded = max(0, start - pad)
+        padded_size = end - padded
+        scaled = max(1, round((padded_size - 1) / slope))
+        offset = (middle * slope - padded) / (padded_size - 1) * scaled - dst_size / 2
+        error = abs(offset - round(offset))
+        if best is None or error < best[0]:
+            best = (error, padded, padded_size, scaled, round(offset))
+        if padded == 0:
+            break
+    _, padded, padded_size, scaled, offset = best
+    offset = min(max(offset, 0), max(0, scaled - dst_size))
+    return padded, padded_size, max(scaled, offset + dst_size), offset
+
+
+class ZoomedMapRenderer:
+    """
+    줌된 맵을 타일 단위로 미리 확대해 두고, 매 프레임엔 보이는 타일만 blit.
+    - 원본 맵은 ChunkedMap의 청크(chunk_size 픽셀) 단위 = 타일 단위
+    - 줌에 맞는 피라미드 단계(원본의 1/2^k)에서 청크를 가져옴
+      → 어떤 줌이든 타일 하나 확대 비율이 1~2배 사이라서 줌 변경 비용이 일정함
+    - 타일은 처음 화면에 보일 때 한 번만 확대 (lazy, 청크도 그때 로드)
+    - 캐시는 LRU로 max_tiles 개까지만 유지 (큰 맵 대비)
+    - zoom 값이 바뀔 때만 캐시를 비우고 다시 확대
+    - fast=True(줌 애니메이션 중)면 smoothscale 대신 scale로 빠르게, 멈추면 다시 부드럽게
+    - smoothscale 확대 때는 타일에 이웃 청크 몇 px(TILE_PAD~)까지 붙여서 확대한 뒤 가운데만
+      잘라 씀 → 맵 전체를 한 번에 확대한 것과 같은 샘플 위치, 타일 경계에 이음매 없음
+      (축소는 면적 평균이라 타일 안 픽셀만 써서 그대로)
+    """
+
+    def __init__(self, chunks, zoom: float, max_tiles: int = 256):
+        self.chunks = chunks
+        self.MAP_W, self.MAP_H = chunks.size
+        self.chunk_size = chunks.chunk_size
+        self.max_tiles = max_tiles
+
+        self.zoom = None
+        self.fast = False
+        self._tiles = OrderedDict()  # (tx, ty) -> 확대된 Surface
+        self.set_zoom(zoom)
+
+    # ─────────────────────────────
+    # 줌 변경
+    # ─────────────────────────────
+    def set_zoom(self, zoom: float, fast: bool = False):
+        """줌(또는 품질)이 실제로 바뀌었을 때만 타일 캐시를 버림"""
+        if zoom == self.zoom and fast == self.fast:
+            return
+        self.zoom = zoom
+        self.fast = fast
+        self._tiles.clear()
+
+        # 줌에 맞는 피라미드 단계: 타일 하나가 원본 맵 tile_src 픽셀을 덮음
+        self.level = self.chunks.level_for_zoom(zoom)
+        self.tile_src = self.chunk_size << self.level
+        # (단계 크기는 절반씩 내림이라 가장자리 청크가 빠질 수 있음 → 단계 격자로 제한)
+        level_cols, level_rows = self.chunks.grid(self.level)
+        self.cols = min(level_cols, (self.MAP_W + self.tile_src - 1) // self.tile_src)
+        self.rows = min(level_rows, (self.MAP_H + self.tile_src - 1) // self.tile_src)
+
+    def _edge(self, src_px: int) -> int:
+        """원본 좌표 → 확대 좌표 (타일 경계가 딱 맞도록 반올림)"""
+        return int(round(src_px * self.zoom))
+
+    # ─────────────────────────────
+    # 타일 생성 / 캐시
+    # ─────────────────────────────
+    def _build_tile(self, tx: int, ty: int):
+        ts = self.tile_src
+        src = pygame.Rect(tx * ts, ty * ts, ts, ts).clip(
+            pygame.Rect(0, 0, self.MAP_W, self.MAP_H)
+        )
+        dst_w = max(1, self._edge(src.right) - self._edge(src.x))
+        dst_h = max(1, self._edge(src.bottom) - self._edge(src.y))
+
+        chunk = self.chunks.get(self.level, tx, ty)
+        if self.fast or dst_w <= chunk.get_width():
+            scale = pygame.transform.scale if self.fast else pygame.transform.smoothscale
+            alloc_stats.count("map_tile")
+            return scale(chunk, (dst_w, dst_h))
+
+        # 확대: 이 타일의 청크 영역(단계 좌표)에 이웃 청크 테두리를 붙여서 (맵 가장자리에서는 없음)
+        cs = self.chunk_size
+        level_w, level_h = self.chunks.levels[self.level]
+        chunk_w, chunk_h = chunk.get_size()
+        x, w, scaled_w, left = _fit(tx * cs, chunk_w, level_w, self._edge(src.x), dst_w,
+                                    self._edge(self.MAP_W))
+        y, h, scaled_h, top = _fit(ty * cs, chunk_h, level_h, self._edge(src.y), dst_h,
+                                   self._edge(self.MAP_H))
+        alloc_stats.count("map_tile", 2)
+        scaled = pygame.transform.smoothscale(self.chunks.region(self.level, (x, y, w, h)),
+                                              (scaled_w, scaled_h))
+        return scaled.subsurface((left, top, dst_w, dst_h))
+
+    def get_tile(self, tx: int, ty: int):
+        key = (tx, ty)
+        tile = self._tiles.get(key)
+        if tile is not None:
+            self._tiles.move_to_end(key)
+            return tile
+
+        tile = self._build_tile(tx, ty)
+        self._tiles[key] = tile
+        if len(self._tiles) > self.max_tiles:
+            self._tiles.popitem(last=False)  # 가장 오래 안 쓴 타일 제거
+        return tile
+
+    # ─────────────────────────────
+    # 프리페치
+    # ─────────────────────────────
+    def prefetch(self, camera, vx: float = 0.0, vy: float = 0.0, lookahead: float = 0.5):
+        """
+        카메라 주변 + 이동 방향으로 lookahead초 앞의 청크를 백그라운드로 미리 읽음.
+        vx, vy: 카메라 이동 속도 (원본 맵 px/s)
+        """
+        ahead = camera.move(vx * lookahead, vy * lookahead)
+        area = camera.union(ahead).inflate(self.tile_src, self.tile_src)
+        # 원본 좌표 → 현재 단계 좌표
+        shift = self.level
+        self.chunks.prefetch_rect(self.level, pygame.Rect(
+            area.x >> shift, area.y >> shift, (area.w >> shift) + 1, (area.h >> shift) + 1))
+        self.chunks.pump()
+
+    # ─────────────────────────────
+    # 그리기
+    # ─────────────────────────────
+    def draw(self, screen, camera):
+        """camera(원본 맵 좌표 Rect)가 가리키는 영역을 화면 (0, 0)부터 그림"""
+        ts = self.tile_src
+        origin_x = self._edge(camera.x)
+        origin_y = self._edge(camera.y)
+
+        tx0 = max(0, camera.left // ts)
+        ty0 = max(0, camera.top // ts)
+        tx1 = min(self.cols - 1, (camera.right - 1) // ts)
+        ty1 = min(self.rows - 1, (camera.bottom - 1) // ts)
+
+        blits = []
+        for ty in range(ty0, ty1 + 1):
+            y = self._edge(ty * ts) - origin_y
+            for tx in range(tx0, tx1 + 1):
+                x = self._edge(tx * ts) - origin_x
+                blits.append((self.get_tile(tx, ty), (x, y)))
+
+        screen.blits(blits, doreturn=False)
@@ -0,0 +1,181 @@
+# minimap.py
+from collections import OrderedDict
+
+import numpy as np
+import pygame
+
+import alloc_stats
+
+# 점 / 박스 스프라이트 LRU 캐시: (모양, 색, 크기) -> Surface
+# 카메라 박스는 줌할 때마다 크기가 바뀌므로 개수 제한 (오래 안 쓴 것부터 버림)
+SPRITE_CACHE_SIZE = 32
+_sprites = OrderedDict()
+
+
+def _cached_sprite(key, make):
+    surf = _sprites.get(key)
+    if surf is not None:
+        _sprites.move_to_end(key)
+        return surf
+    alloc_stats.count("minimap")
+    surf = _sprites[key] = make()
+    if len(_sprites) > SPRITE_CACHE_SIZE:
+        _sprites.popitem(last=False)
+    return surf
+
+
+def _dot_sprite(color, radius: int):
+    def make():
+        surf = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+        pygame.draw.circle(surf, color, (radius, radius), radius)
+        return surf
+    return _cached_sprite(("dot", tuple(color), radius), make)
+
+
+def _box_sprite(color, size, width: int):
+    def make():
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.rect(surf, color, surf.get_rect(), width)
+        return surf
+    return _cached_sprite(("box", tuple(color), tuple(size), width), make)
+
+
+class _MarkerGroup:
+    """같은 모양/색 마커 묶음 (플레이어 점, 좀비 점들, 카메라 박스 등)"""
+
+    __slots__ = ("sprite", "offset", "coords", "pending", "box")
+
+    def __init__(self, sprite, offset, box=None):
+        self.sprite = sprite
+        self.offset = offset     # 좌표 → 스프라이트 왼쪽 위
+        self.coords = []         # 지금 미니맵에 그려진 위치들 (레이어 좌표)
+        self.pending = None      # 다음 refresh 때 반영할 맵 좌표 (N, 2)
+        self.box = box           # 박스 마커면 (색, 선 두께)
+
+
+class MinimapLayer:
+    """
+    미니맵 레이어.
+    - 테두리 + 축소 맵을 미리 합성한 배경(_base)을 한 번만 만듦
+    - 마커는 그룹별로 위치 배열만 받아 두고(set_positions), refresh 때 한꺼번에 좌표 변환(NumPy)
+    - refresh는 rate(Hz)로만 (메인 화면보다 느리게), 움직인 마커 자리만 배경으로 지우고 다시 그림
+    - 매 프레임 draw()는 합성된 레이어 Surface를 blit 한 번
+    """
+
+    def __init__(self, background, pos, map_size, border: int = 5, rate: float = 10.0):
+        self.map_w, self.map_h = map_size
+        self.width, self.height = background.get_size()
+        self.border = border
+        self.rect = pygame.Rect(pos[0] - border, pos[1] - border,
+                                self.width + border * 2, self.height + border * 2)
+
+        # 배경: 검은 테두리 + 축소 맵
+        alloc_stats.count("minimap", 2)
+        self._base = pygame.Surface(self.rect.size)
+        self._base.fill((0, 0, 0))
+        self._base.blit(background, (border, border))
+        if pygame.display.get_surface():
+            self._base = self._base.convert()
+        self.surface = self._base.copy()
+
+        self.groups = {}   # 이름 -> _MarkerGroup (등록 순서대로 그림)
+        self.interval = 1.0 / rate
+        self._accum = self.interval   # 첫 update에서 바로 refresh
+        self.refreshes = 0
+
+    # ─────────────────────────────
+    # 마커 등록 / 위치
+    # ─────────────────────────────
+    def add_dots(self, name: str, color, radius: int = 4):
+        """점 마커 그룹 (좌표 = 점 중심)"""
+        self.groups[name] = _MarkerGroup(_dot_sprite(color, radius), (radius, radius))
+
+    def add_box(self, name: str, color, width: int = 2):
+        """박스 마커 (카메라 시야 등, set_rect로 위치/크기 지정)"""
+        self.groups[name] = _MarkerGroup(None, (0, 0), box=(tuple(color), width))
+
+    def set_positions(self, name: str, positions):
+        """positions: 맵 좌표 (N, 2) 배열이나 (x, y) 리스트. 실제 반영은 다음 refresh"""
+        self.groups[name].pending = positions
+
+    def set_rect(self, name: str, rect):
+        """박스 마커의 맵 좌표 Rect"""
+        self.groups[name].pending = rect
+
+    # ─────────────────────────────
+    # 갱신
+    # ─────────────────────────────
+    def _to_layer(self, positions):
+        """맵 좌표들 → 레이어 좌표 (정수 (x, y) 리스트)"""
+        pts = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        pts = pts * (self.width / self.map_w, self.height / self.map_h) + self.border
+        return [tuple(p) for p in pts.astype(int).tolist()]
+
+    def _layout(self, group):
+        """pending 위치 → (스프라이트, 레이어 좌표 리스트)"""
+        if group.box is None:
+            return group.sprite, self._to_layer(group.pending)
+
+        rect = group.pending
+        sx, sy = self.width / self.map_w, self.height / self.map_h
+        size = (max(1, int(rect.width * sx)), max(1, int(rect.height * sy)))
+        color, width = group.box
+        return _box_sprite(color, size, width), self._to_layer([rect.topleft])
+
+    def update(self, dt: float):
+        self._accum += dt
+        if self._accum >= self.interval:
+            self._accum %= self.interval
+            self.refresh()
+
+    def refresh(self):
+        """움직인 마커만 지우고 다시 그림. 뭔가 바뀌었으면 True"""
+        erase = []
+        moved = set()
+        for name, group in self.groups.items():
+            if group.pending is None:
+                continue
+            sprite, coords = self._layout(group)
+            group.pending = None
+            if sprite is group.sprite and coords == group.coords:
+                continue
+            erase.extend(self._rects(group))
+            group.sprite, group.coords = sprite, coords
+            moved.add(name)
+
+        if not moved:
+            return False
+        self.refreshes += 1
+
+        # 1) 움직인 마커의 예전 자리를 배경으로 복원 (blits 한 번)
+        surface = self.surface
+        surface.blits([(self._base, r, r) for r in erase], doreturn=False)
+
+        # 2) 움직인 그룹은 전부, 나머지는 지운 자리와 겹치는 마커만 다시 그림 (등록 순서 유지)
+        for name, group in self.groups.items():
+            if group.sprite is None:
+                continue
+            if name in moved:
+                items = group.coords
+            elif erase:
+                rects = self._rects(group)
+                items = [group.coords[i] for i, r in enumerate(rects) if r.collidelist(erase) != -1]
+            else:
+                continue
+            ox, oy = group.offset
+            surface.blits([(group.sprite, (x - ox, y - oy)) for x, y in items], doreturn=False)
+        return True
+
+    def _rects(self, group):
+        if group.sprite is None:
+            return []
+        w, h = group.sprite.get_size()
+        ox, oy = group.offset
+        return [pygame.Rect(x - ox, y - oy, w, h) for x, y in group.coords]
+
+    # ─────────────────────────────
+    # 그리기
+    # ─────────────────────────────
+    def draw(self, screen):
+        """합성된 미니맵을 blit하고 그린 영역을 리턴"""
+        return screen.blit(self.surface, self.rect)
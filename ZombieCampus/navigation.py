@@ -0,0 +1,284 @@
+# navigation.py
+from collections import OrderedDict
+
+import numpy as np
+
+# 8방향 이웃 (dx, dy). 앞 4개는 상하좌우 (BFS 거리 계산용)
+_NEIGHBORS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+_UNREACHABLE = np.iinfo(np.int32).max
+
+
+class NavGrid:
+    """
+    건물 내부 격자 내비메시.
+    - cell_size 픽셀 칸마다 막힘 여부 (blocked[row, col])
+    - 장애물 Rect는 agent_radius만큼 부풀려서 칠함 → 좀비 중심점만으로 벽을 피함
+    - 장애물을 추가/삭제하면 version이 올라가고 바뀐 칸 마스크를 리턴
+    pygame 없이 (x, y, w, h) 튜플만으로 동작 (pygame.Rect도 그대로 넣을 수 있음)
+    """
+
+    def __init__(self, width: int, height: int, cell_size: int = 20, obstacles=(),
+                 agent_radius: float = 0.0):
+        self.width, self.height = width, height
+        self.cell_size = cell_size
+        self.agent_radius = agent_radius
+        self.cols = (width + cell_size - 1) // cell_size
+        self.rows = (height + cell_size - 1) // cell_size
+
+        self.obstacles = [tuple(r) for r in obstacles]
+        self.blocked = self._rasterize(self.obstacles)
+        self.version = 0
+        self._adjacency = None
+
+    def _rasterize(self, obstacles):
+        blocked = np.zeros((self.rows, self.cols), dtype=bool)
+        cs, r = self.cell_size, self.agent_radius
+        for x, y, w, h in obstacles:
+            # 칸 중심이 부풀린 장애물 안에 있으면 막힌 칸
+            c0 = int(np.ceil((x - r) / cs - 0.5))
+            c1 = int(np.floor((x + w + r) / cs - 0.5))
+            r0 = int(np.ceil((y - r) / cs - 0.5))
+            r1 = int(np.floor((y + h + r) / cs - 0.5))
+            blocked[max(0, r0):max(0, r1 + 1), max(0, c0):max(0, c1 + 1)] = True
+        return blocked
+
+    # ─────────────────────────────
+    # 장애물 변경
+    # ─────────────────────────────
+    def set_obstacles(self, obstacles):
+        """장애물 목록 교체. 막힘 상태가 바뀐 칸 마스크를 리턴"""
+        self.obstacles = [tuple(r) for r in obstacles]
+        new = self._rasterize(self.obstacles)
+        changed = new != self.blocked
+        self.blocked = new
+        if changed.any():
+            self.version += 1
+            self._adjacency = None
+        return changed
+
+    def add_obstacle(self, rect):
+        return self.set_obstacles(self.obstacles + [tuple(rect)])
+
+    def remove_obstacle(self, rect):
+        rect = tuple(rect)
+        return self.set_obstacles([r for r in self.obstacles if r != rect])
+
+    # ─────────────────────────────
+    # 좌표 변환 / 질의
+    # ─────────────────────────────
+    def cell_of(self, x: float, y: float):
+        """픽셀 좌표 → (col, row), 격자 밖은 가장자리 칸으로"""
+        cs = self.cell_size
+        return (min(self.cols - 1, max(0, int(x // cs))),
+                min(self.rows - 1, max(0, int(y // cs))))
+
+    def cells_of(self, points):
+        """(N, 2) 픽셀 좌표 → (cols, rows) 정수 배열 두 개"""
+        cells = np.floor(np.asarray(points) / self.cell_size).astype(np.int64)
+        return (np.clip(cells[:, 0], 0, self.cols - 1),
+                np.clip(cells[:, 1], 0, self.rows - 1))
+
+    def blocked_at(self, points):
+        """(N, 2) 픽셀 좌표가 막힌 칸에 있는지 (bool 배열)"""
+        cols, rows = self.cells_of(points)
+        return self.blocked[rows, cols]
+
+    def adjacency(self):
+        """
+        칸 번호(row * cols + col) -> 열린 상하좌우 이웃 칸 번호 리스트.
+        격자가 바뀔 때만 다시 만듦 (BFS마다 경계/막힘 검사를 반복하지 않도록)
+        """
+        if self._adjacency is None:
+            cols, n = self.cols, self.rows * self.cols
+            blocked = self.blocked.ravel().tolist()
+            adjacency = []
+            for i in range(n):
+                col = i % cols
+                adjacency.append([j for j, ok in ((i + 1, col + 1 < cols), (i - 1, col > 0),
+                                                  (i + cols, i + cols < n), (i - cols, i >= cols))
+                                  if ok and not blocked[j]])
+            self._adjacency = adjacency
+        return self._adjacency
+
+    def nearest_open(self, col: int, row: int):
+        """(col, row)가 막혀 있으면 가장 가까운 열린 칸, 열린 칸이 없으면 None"""
+        if not self.blocked[row, col]:
+            return col, row
+        open_rows, open_cols = np.nonzero(~self.blocked)
+        if len(open_rows) == 0:
+            return None
+        i = int(np.argmin((open_cols - col) ** 2 + (open_rows - row) ** 2))
+        return int(open_cols[i]), int(open_rows[i])
+
+
+class FlowField:
+    """
+    목표 칸 하나로 향하는 흐름장.
+    - 목표에서 BFS(상하좌우)로 칸마다 거리 계산
+    - 칸마다 거리가 가장 작은 이웃(8방향, 벽 모서리 가로지르기 금지) 쪽 단위 벡터를 저장
+    → 좀비 수와 상관없이 한 번 계산, 좀비마다는 칸 조회 한 번
+    """
+
+    def __init__(self, grid: NavGrid, target_cell):
+        self.grid = grid
+        self.target_cell = target_cell
+        self.dist = self._distances(grid, target_cell)
+        self.dirs = self._directions(grid, self.dist)
+
+    @staticmethod
+    def _distances(grid, target_cell):
+        rows, cols = grid.rows, grid.cols
+        start = grid.nearest_open(*target_cell)
+        if start is None:
+            return np.full((rows, cols), _UNREACHABLE, dtype=np.int32)
+
+        # 한 겹씩 넓혀 가는 BFS (이웃 목록은 격자에 캐시돼 있음)
+        adjacency = grid.adjacency()
+        d = [-1] * (rows * cols)
+        first = start[1] * cols + start[0]
+        d[first] = 0
+        frontier = [first]
+        step = 0
+        while frontier:
+            step += 1
+            nxt = []
+            for i in frontier:
+                for j in adjacency[i]:
+                    if d[j] < 0:
+                        d[j] = step
+                        nxt.append(j)
+            frontier = nxt
+
+        dist = np.array(d, dtype=np.int32).reshape(rows, cols)
+        dist[dist < 0] = _UNREACHABLE
+        return dist
+
+    @staticmethod
+    def _directions(grid, dist):
+        rows, cols = dist.shape
+        # 가장자리 밖은 도달 불가로 패딩
+        padded = np.full((rows + 2, cols + 2), _UNREACHABLE, dtype=np.int32)
+        padded[1:-1, 1:-1] = dist
+        open_pad = np.zeros((rows + 2, cols + 2), dtype=bool)
+        open_pad[1:-1, 1:-1] = ~grid.blocked
+
+        best = dist.copy()
+        dirs = np.zeros((rows, cols, 2), dtype=np.float64)
+        for dx, dy in _NEIGHBORS:
+            nb = padded[1 + dy:rows + 1 + dy, 1 + dx:cols + 1 + dx]
+            if dx and dy:
+                # 대각선은 양옆 두 칸이 모두 열려 있을 때만 (벽 모서리 통과 금지)
+                side_x = open_pad[1:rows + 1, 1 + dx:cols + 1 + dx]
+                side_y = open_pad[1 + dy:rows + 1 + dy, 1:cols + 1]
+                nb = np.where(side_x & side_y, nb, _UNREACHABLE)
+            better = nb < best
+            best = np.where(better, nb, best)
+            length = (dx * dx + dy * dy) ** 0.5
+            dirs[better] = (dx / length, dy / length)
+        return dirs
+
+    def directions(self, points):
+        """
+        (N, 2) 픽셀 좌표 → (방향 (N, 2), 유효 여부 (N,))
+        목표 칸 자체 / 도달 불가 칸은 유효하지 않음 (호출하는 쪽에서 직선 추적)
+        """
+        cols, rows = self.grid.cells_of(points)
+        dirs = self.dirs[rows, cols]
+        valid = dirs.any(axis=1)
+        return dirs, valid
+
+    def affected_by(self, changed, old_blocked) -> bool:
+        """
+        막힘 상태가 changed 칸들에서 바뀌었을 때 이 흐름장을 다시 계산해야 하는지.
+        - 새로 막힌 칸이 도달 가능했으면 → 경로가 그 칸을 지났을 수 있음
+        - 새로 열린 칸 옆에 도달 가능한 칸이 있으면 → 더 짧은 길이 생겼을 수 있음
+        - 그 밖(도달 못 하던 곳끼리의 변화)은 영향 없음
+        """
+        col, row = self.target_cell
+        if changed[row, col]:
+            return True   # 목표 칸 자체가 막히거나 열림 → 시작 칸이 달라짐
+
+        reachable = self.dist != _UNREACHABLE
+        newly_blocked = changed & ~old_blocked
+        if (newly_blocked & reachable).any():
+            return True
+
+        newly_open = changed & old_blocked
+        if not newly_open.any():
+            return False
+        near = reachable.copy()
+        near[1:, :] |= reachable[:-1, :]
+        near[:-1, :] |= reachable[1:, :]
+        near[:, 1:] |= reachable[:, :-1]
+        near[:, :-1] |= reachable[:, 1:]
+        return bool((newly_open & near).any())
+
+
+class Navigator:
+    """
+    건물 하나의 내비게이션: 격자 + 목표 칸별 흐름장 캐시(LRU).
+    - flow_to(x, y): 플레이어가 있는 칸의 흐름장 (칸이 바뀔 때만 새로 계산, 갔던 칸은 재사용)
+    - 장애물이 바뀌면 영향받는 흐름장만 버림 (나머지는 그대로 재사용)
+    """
+
+    def __init__(self, grid: NavGrid, max_fields: int = 64):
+        self.grid = grid
+        self.max_fields = max_fields
+        self._fields = OrderedDict()   # (col, row) -> FlowField
+        self.stats = {"hits": 0, "builds": 0, "invalidated": 0}
+
+    def flow_to(self, x: float, y: float) -> FlowField:
+        key = self.grid.cell_of(x, y)
+        field = self._fields.get(key)
+        if field is not None:
+            self._fields.move_to_end(key)
+            self.stats["hits"] += 1
+            return field
+
+        field = FlowField(self.grid, key)
+        self.stats["builds"] += 1
+        self._fields[key] = field
+        if len(self._fields) > self.max_fields:
+            self._fields.popitem(last=False)
+        return field
+
+    def _changed(self, old_blocked, changed):
+        """막힘 상태가 바뀐 뒤 영향받는 흐름장만 버림"""
+        if not changed.any():
+            return
+        stale = [key for key, field in self._fields.items()
+                 if field.affected_by(changed, old_blocked)]
+        for key in stale:
+            del self._fields[key]
+        self.stats["invalidated"] += len(stale)
+
+    def add_obstacle(self, rect):
+        old = self.grid.blocked
+        self._changed(old, self.grid.add_obstacle(rect))
+
+    def remove_obstacle(self, rect):
+        old = self.grid.blocked
+        self._changed(old, self.grid.remove_obstacle(rect))
+
+    def set_obstacles(self, obstacles):
+        old = self.grid.blocked
+        self._changed(old, self.grid.set_obstacles(obstacles))
+
+
+# 건물 이름 -> Navigator (씬을 다시 만들어도 흐름장 캐시 유지)
+_navigators = {}
+
+
+def navigator_for(name: str, size, obstacles=(), cell_size: int = 20,
+                  agent_radius: float = 0.0) -> Navigator:
+    """
+    name 건물의 Navigator. 처음이면 만들고, 장애물 목록이 바뀌었으면 그 차이만 반영.
+    """
+    nav = _navigators.get(name)
+    if nav is None or (nav.grid.width, nav.grid.height) != tuple(size) \
+            or nav.grid.cell_size != cell_size or nav.grid.agent_radius != agent_radius:
+        nav = Navigator(NavGrid(size[0], size[1], cell_size, obstacles, agent_radius))
+        _navigators[name] = nav
+    elif nav.grid.obstacles != [tuple(r) for r in obstacles]:
+        nav.set_obstacles(obstacles)
+    return nav
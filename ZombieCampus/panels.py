@@ -0,0 +1,71 @@
+# panels.py
+import pygame
+from collections import OrderedDict
+
+import alloc_stats
+
+# (size, color, alpha) -> 반투명 Surface
+PANEL_CACHE_SIZE = 64
+_panels = OrderedDict()
+
+# (배경 Surface, color, alpha) -> 배경 위에 오버레이를 미리 합성한 Surface
+_composites = {}
+
+
+def get_panel(size, color, alpha: int) -> pygame.Surface:
+    """
+    size 크기, color + alpha로 채운 반투명 Surface.
+    같은 (size, color, alpha)는 한 번만 만들어서 재사용 (매 프레임 SRCALPHA 할당 없음)
+    리턴된 Surface는 공유되므로 직접 수정하지 말 것.
+    """
+    key = (tuple(size), tuple(color[:3]), alpha)
+    surf = _panels.get(key)
+    if surf is not None:
+        _panels.move_to_end(key)
+        return surf
+
+    alloc_stats.count("panel")
+    surf = pygame.Surface(key[0], pygame.SRCALPHA)
+    surf.fill((*key[1], alpha))
+    _panels[key] = surf
+    if len(_panels) > PANEL_CACHE_SIZE:
+        _panels.popitem(last=False)
+    return surf
+
+
+def get_solid(size, color) -> pygame.Surface:
+    """
+    size 크기의 불투명 단색 Surface (페이드용).
+    Surface 전체 알파는 set_alpha()로 매번 정해서 쓰므로 색/크기당 하나만 만듦.
+    """
+    key = (tuple(size), tuple(color[:3]), None)
+    surf = _panels.get(key)
+    if surf is None:
+        alloc_stats.count("panel")
+        surf = pygame.Surface(key[0])
+        surf.fill(key[1])
+        _panels[key] = surf
+        if len(_panels) > PANEL_CACHE_SIZE:
+            _panels.popitem(last=False)
+    return surf
+
+
+def get_composited(background: pygame.Surface, color, alpha: int) -> pygame.Surface:
+    """
+    background 위에 화면 전체 반투명 오버레이를 미리 합성한 불투명 Surface.
+    (예: 인트로 배경 + 어두운 오버레이 → 매 프레임 blit 한 번)
+    """
+    key = (background, tuple(color[:3]), alpha)
+    surf = _composites.get(key)
+    if surf is None:
+        alloc_stats.count("panel")
+        surf = background.copy()
+        surf.blit(get_panel(background.get_size(), color, alpha), (0, 0))
+        surf = surf.convert() if pygame.display.get_surface() else surf
+        _composites[key] = surf
+    return surf
+
+
+def clear():
+    _panels.clear()
+    _composites.clear()
@@ -0,0 +1,149 @@
+# preloader.py
+import queue
+import threading
+import time
+
+import assets
+
+
+class _Job:
+    __slots__ = ("label", "work", "finish", "weight")
+
+    def __init__(self, label, work, finish, weight):
+        self.label = label
+        self.work = work        # 워커 스레드에서: () -> 결과 (파일 읽기 / 디코딩 / 순수 계산)
+        self.finish = finish    # 메인 스레드에서: (결과) -> 최종 값 (convert, Surface 만들기 등)
+        self.weight = weight    # 진행률 비중
+
+
+class Preloader:
+    """
+    인트로가 도는 동안 백그라운드로 미리 로드.
+    - 작업마다 work(워커 스레드)와 finish(메인 스레드)로 나눔
+      → 파일 읽기 / PNG 디코딩 / 계산은 스레드에서, convert() 등 display 관련은 메인 스레드에서만
+    - pump()를 매 프레임 부르면 끝난 작업의 finish를 등록 순서대로 budget초 안에서만 처리
+      (앞 작업이 안 끝났으면 뒤 작업도 기다림 → finish에서 앞 작업 결과를 써도 됨)
+    - progress(0~1) / done으로 인트로가 진행률을 보여주고, 다 안 끝났을 때만 기다림
+    작업에서 난 예외는 pump() / wait()에서 메인 스레드로 다시 던짐
+    """
+
+    def __init__(self):
+        self.jobs = []
+        self.results = {}       # label -> finish까지 끝난 값
+        self._next = 0          # 다음에 finish할 작업 번호
+        self._worked = {}       # 작업 번호 -> (성공 여부, work 결과 / 예외)
+        self._queue = queue.Queue()
+        self._thread = None
+        self._done_weight = 0.0
+
+        self.started_at = None
+        self.elapsed = None     # start()부터 전부 끝날 때까지 걸린 시간(초)
+        self.main_time = 0.0    # 그중 메인 스레드(finish)에서 쓴 시간(초)
+
+    # ─────────────────────────────
+    # 작업 등록
+    # ─────────────────────────────
+    def add(self, label: str, work=None, finish=None, weight: float = 1.0):
+        """work만 있으면 결과를 그대로, finish만 있으면 메인 스레드에서만 도는 작업"""
+        if self._thread is not None:
+            raise RuntimeError("start() 뒤에는 작업을 추가할 수 없음")
+        self.jobs.append(_Job(label, work, finish, weight))
+
+    def add_images(self, specs):
+        """
+        assets 이미지들: 파일마다 디코딩은 스레드에서 한 번, convert / 크기별 scale은 메인 스레드에서.
+        specs: (path, size, alpha) 튜플 리스트 (assets.load_image 인자와 같은 형식)
+        """
+        sizes = {}
+        for path, size, alpha in specs:
+            sizes.setdefault((path, alpha), []).append(size)
+
+        for (path, alpha), wanted in sizes.items():
+            def finish(raw, path=path, alpha=alpha, wanted=wanted):
+                for size in wanted:
+                    assets.install(path, raw, size, alpha)
+            self.add(path, work=lambda path=path: assets.decode(path), finish=finish)
+
+    # ─────────────────────────────
+    # 진행
+    # ─────────────────────────────
+    def start(self):
+        self.started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._worker, name="preloader", daemon=True)
+        self._thread.start()
+        return self
+
+    def _worker(self):
+        for i, job in enumerate(self.jobs):
+            try:
+                result = (True, job.work() if job.work is not None else None)
+            except BaseException as e:   # 메인 스레드에서 다시 던짐
+                result = (False, e)
+            self._queue.put((i, result))
+
+    @property
+    def done(self) -> bool:
+        return self._next >= len(self.jobs)
+
+    @property
+    def progress(self) -> float:
+        total = sum(job.weight for job in self.jobs)
+        return self._done_weight / total if total else 1.0
+
+    @property
+    def current(self):
+        """지금 기다리는 작업 이름 (다 끝났으면 None)"""
+        return None if self.done else self.jobs[self._next].label
+
+    def result(self, label: str):
+        return self.results[label]
+
+    def ready(self, label: str) -> bool:
+        """label 작업이 finish까지 끝났는지"""
+        return label in self.results
+
+    def pump(self, budget: float = 0.004) -> bool:
+        """
+        끝난 작업의 finish를 순서대로 처리 (메인 스레드, 매 프레임).
+        budget초를 넘기면 다음 프레임으로 (최소 한 개는 처리). 다 끝났으면 True
+        """
+        start = time.perf_counter()
+        while not self.done:
+            if not self._collect(block=False):
+                break
+            self._finish_next()
+            if time.perf_counter() - start >= budget:
+                break
+        return self.done
+
+    def wait(self):
+        """남은 작업을 전부 끝낼 때까지 기다림 (녹화/재생처럼 로딩 시점이 결과에 영향을 주면 안 될 때)"""
+        while not self.done:
+            self._collect(block=True)
+            self._finish_next()
+
+    def _collect(self, block: bool) -> bool:
+        """다음에 finish할 작업의 work 결과가 왔으면 True"""
+        while self._next not in self._worked:
+            try:
+                i, result = self._queue.get(block=block)
+            except queue.Empty:
+                return False
+            self._worked[i] = result
+        return True
+
+    def _finish_next(self):
+        i = self._next
+        job = self.jobs[i]
+        ok, value = self._worked.pop(i)
+        if not ok:
+            raise RuntimeError(f"미리 로드 실패: {job.label}") from value
+
+        start = time.perf_counter()
+        self.results[job.label] = job.finish(value) if job.finish is not None else value
+        self.main_time += time.perf_counter() - start
+
+        self._next += 1
+        self._done_weight += job.weight
+        if self.done:
+            self.elapsed = time.perf_counter() - self.started_at
@@ -0,0 +1,217 @@
+# profiler.py
+import contextlib
+import csv
+import json
+import time
+from collections import deque
+
+import pygame
+
+import alloc_stats
+import fonts
+import panels
+
+# 꺼져 있을 때 span()이 돌려주는 빈 컨텍스트 (할당 없음)
+_NULL_SPAN = contextlib.nullcontext()
+
+
+class _Span:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        self.profiler._record(self.name, self.start, end)
+        return False
+
+
+class FrameProfiler:
+    """
+    프레임 단위 계측.
+    - span("world.draw") 같은 이름 붙은 구간 시간 측정 (with 문)
+    - begin_frame() / end_frame()으로 프레임 경계 표시
+    - Surface 할당 수 집계 (Surface를 만드는 곳들이 세는 alloc_stats 카운터의 프레임당 증가분)
+    - F3 오버레이: 프레임 시간 그래프 + 구간별 평균 + 할당 수 + 버린 step 수
+    - dump_csv / dump_chrome_trace로 오프라인 분석용 파일 저장
+    """
+
+    def __init__(self, history: int = 240, max_trace_events: int = 200000):
+        self.enabled = False
+        self.overlay_visible = False
+        self.history = history
+
+        self.frames = deque(maxlen=history)     # [{"frame_ms": .., "allocs": .., span: ms, ...}]
+        self.trace = deque(maxlen=max_trace_events)  # (name, start_us, dur_us, frame_no)
+        self.frame_no = 0
+
+        self._t0 = time.perf_counter()
+        self._frame_start = None
+        self._current = {}
+        self._allocs = 0
+        self._alloc_start = 0
+
+        # 오버레이 글자는 4Hz로만 갱신 (숫자가 매 프레임 바뀌면 텍스트 캐시만 어지럽힘)
+        self._overlay_lines = []
+        self._overlay_refresh = 0.0
+
+    # ─────────────────────────────
+    # 켜기 / 끄기
+    # ─────────────────────────────
+    def enable(self):
+        if self.enabled:
+            return
+        self.enabled = True
+
+    def toggle_overlay(self):
+        self.overlay_visible = not self.overlay_visible
+
+    def handle_event(self, event) -> bool:
+        """F3: 오버레이 토글, F4: 파일로 저장. 처리했으면 True"""
+        if not self.enabled or event.type != pygame.KEYDOWN:
+            return False
+        if event.key == pygame.K_F3:
+            self.toggle_overlay()
+            return True
+        if event.key == pygame.K_F4:
+            print("프로파일 저장:", *self.dump())
+            return True
+        return False
+
+    # ─────────────────────────────
+    # 계측
+    # ─────────────────────────────
+    def span(self, name: str):
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def _record(self, name, start, end):
+        ms = (end - start) * 1000
+        self._current[name] = self._current.get(name, 0.0) + ms
+        self.trace.append((name, (start - self._t0) * 1e6, (end - start) * 1e6, self.frame_no))
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self._frame_start = time.perf_counter()
+        self._current = {}
+        self._allocs = 0
+        self._alloc_start = alloc_stats.total()
+
+    def end_frame(self):
+        if not self.enabled or self._frame_start is None:
+            return
+        end = time.perf_counter()
+        self._allocs += alloc_stats.total() - self._alloc_start
+
+        record = dict(self._current)
+        record["frame_ms"] = (end - self._frame_start) * 1000
+        record["allocs"] = self._allocs
+        self.frames.append(record)
+        self.trace.append(("frame", (self._frame_start - self._t0) * 1e6,
+                           (end - self._frame_start) * 1e6, self.frame_no))
+        self.frame_no += 1
+
+    # ─────────────────────────────
+    # 통계
+    # ─────────────────────────────
+    def averages(self):
+        """구간 이름 -> 최근 history 프레임 평균(ms). frame_ms / allocs 포함"""
+        if not self.frames:
+            return {}
+        totals = {}
+        for record in self.frames:
+            for name, value in record.items():
+                totals[name] = totals.get(name, 0.0) + value
+        n = len(self.frames)
+        return {name: total / n for name, total in totals.items()}
+
+    # ─────────────────────────────
+    # 오버레이
+    # ─────────────────────────────
+    def draw_overlay(self, screen, loop=None):
+        """오버레이를 그리고 그린 영역(Rect 리스트)을 리턴. loop: 버린 step 수를 같이 표시"""
+        if not (self.enabled and self.overlay_visible):
+            return []
+
+        graph_w, graph_h = self.history, 80
+        x, y = 10, screen.get_height() - graph_h - 190
+        dirty = [screen.blit(panels.get_panel((graph_w + 220, graph_h + 180), (0, 0, 0), 170),
+                             (x - 5, y - 5))]
+
+        # 프레임 시간 그래프 (16.7ms 기준선 = 60FPS)
+        budget_y = y + graph_h - int(graph_h * 16.7 / 33.4)
+        pygame.draw.line(screen, (90, 90, 90), (x, budget_y), (x + graph_w, budget_y))
+        if len(self.frames) > 1:
+            points = []
+            for i, record in enumerate(self.frames):
+                h = min(record["frame_ms"] / 33.4, 1.0) * graph_h
+                points.append((x + i, y + graph_h - h))
+            pygame.draw.lines(screen, (80, 255, 120), False, points)
+
+        # 구간별 평균 (4Hz 갱신)
+        now = time.perf_counter()
+        if now - self._overlay_refresh > 0.25:
+            self._overlay_refresh = now
+            avg = self.averages()
+            text = fonts.text_cache_stats()
+            lookups = text["hits"] + text["misses"]
+            skipped = f"  skipped {loop.skipped_steps}" if loop is not None else ""
+            self._overlay_lines = [
+                f"frame {avg.get('frame_ms', 0):5.2f} ms  allocs {avg.get('allocs', 0):5.1f}/f"
+                + skipped,
+                f"text cache {text['size']}/{fonts.TEXT_CACHE_SIZE}"
+                f"  hit {text['hits'] / max(lookups, 1):6.1%}  miss {text['misses']}",
+            ] + [
+                f"{name:<16} {ms:5.2f} ms"
+                for name, ms in sorted(avg.items(), key=lambda kv: -kv[1])
+                if name not in ("frame_ms", "allocs")
+            ][:6]
+
+        ty = y + graph_h + 8
+        for line in self._overlay_lines:
+            screen.blit(fonts.render_text(line, 16, (230, 230, 230)), (x, ty))
+            ty += 20
+        return dirty
+
+    # ─────────────────────────────
+    # 파일로 저장
+    # ─────────────────────────────
+    def dump_csv(self, path: str):
+        """최근 history 프레임: 한 줄에 한 프레임, 열은 구간 이름"""
+        names = sorted({name for record in self.frames for name in record})
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame"] + names)
+            first = self.frame_no - len(self.frames)
+            for i, record in enumerate(self.frames):
+                writer.writerow([first + i] + [f"{record.get(n, 0.0):.4f}" for n in names])
+
+    def dump_chrome_trace(self, path: str):
+        """chrome://tracing 이나 Perfetto에서 열 수 있는 JSON"""
+        events = [
+            {"name": name, "ph": "X", "ts": round(ts, 1), "dur": round(dur, 1),
+             "pid": 1, "tid": 1, "args": {"frame": frame}}
+            for name, ts, dur, frame in self.trace
+        ]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+    def dump(self, prefix: str = None):
+        """CSV + Chrome trace 둘 다 저장하고 경로를 리턴"""
+        prefix = prefix or time.strftime("profile_%Y%m%d_%H%M%S")
+        csv_path, trace_path = prefix + ".csv", prefix + ".trace.json"
+        self.dump_csv(csv_path)
+        self.dump_chrome_trace(trace_path)
+        return csv_path, trace_path
+
+
+# 게임 전체에서 같이 쓰는 프로파일러 (python main.py --profile 로 켬)
+profiler = FrameProfiler()
@@ -0,0 +1,284 @@
+# replay.py
+"""
+입력 / 난수 시드 녹화와 재생 (같은 판을 그대로 다시 돌려서 프로파일링).
+
+    python main.py --record run.zcr [--seed 1234]   # 플레이하면서 녹화
+    python main.py --replay run.zcr [--profile]     # 녹화한 판을 그대로 재생
+
+녹화 파일 (gzip, 리틀 엔디언):
+  헤더(magic, 버전, 시드, step_dt, 추적 키 수) | 추적 키 코드들(i32)
+  | 프레임마다: step 수, 보간 alpha, 눌린 추적 키 비트마스크, 이벤트 수
+    | (이벤트가 있으면) 마우스 위치 + 이벤트들
+→ 프레임당 11바이트 + 이벤트 몇 바이트, gzip으로 대부분 0이라 아주 작음
+마우스 위치는 이벤트를 처리할 때만 읽으므로(측정 모드 P / I 키) 이벤트 있는 프레임만 기록
+
+재생할 때는 시계 대신 녹화된 step 수를 그대로 씀 → 시뮬레이션이 프레임 단위로 똑같이 진행
+"""
+import gzip
+import random
+import struct
+import zlib
+
+import numpy as np
+import pygame
+
+from headless import KeyState
+
+_MAGIC = b"ZCRP"
+_VERSION = 2
+# magic, 버전, 시드, step_dt, 추적 키 수
+_HEADER = struct.Struct("<4sHQdH")
+_KEYCODE = struct.Struct("<i")
+# step 수, alpha, 눌린 키 비트마스크, 이벤트 수
+_FRAME = struct.Struct("<BfIH")
+_MAX_EVENTS = 0xFFFF
+_POS = struct.Struct("<hh")       # 마우스 x, y
+
+# 이벤트 종류 번호 + 내용
+_EV_QUIT, _EV_KEYDOWN, _EV_MOUSEDOWN, _EV_WHEEL = range(4)
+_KEY = struct.Struct("<iHB")      # key, mod, unicode 바이트 수 (뒤에 UTF-8)
+_MOUSE = struct.Struct("<hhB")    # x, y, button
+_WHEEL = struct.Struct("<bb")     # x, y
+
+# 게임이 get_pressed()로 읽는 키 (32개까지, 비트마스크 순서)
+TRACKED_KEYS = (
+    pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN,
+    pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d,
+)
+
+
+def rng_for(seed, name: str):
+    """
+    seed + 이름(건물 등)으로 정해지는 NumPy 난수 생성기.
+    seed가 None이면 매번 다른 난수 (녹화하지 않을 때)
+    이름마다 따로 만들어서 건물에 들어가는 순서와 상관없이 같은 좀비 배치가 나옴
+    """
+    if seed is None:
+        return np.random.default_rng()
+    return np.random.default_rng([seed, zlib.crc32(name.encode("utf-8"))])
+
+
+def new_seed() -> int:
+    return random.getrandbits(32)
+
+
+# ─────────────────────────────
+# 입력 공급자 (SceneManager / World / BuildingScene이 읽는 쪽)
+# ─────────────────────────────
+class LiveInput:
+    """실제 키보드/마우스 (기본값)"""
+
+    seed = None
+    replaying = False   # True면 녹화 재생 중 (파일 저장 같은 부작용은 하지 말 것)
+
+    def events(self):
+        return pygame.event.get()
+
+    def get_pressed(self):
+        return pygame.key.get_pressed()
+
+    def mouse_pos(self):
+        return pygame.mouse.get_pos()
+
+    def close(self):
+        pass
+
+
+def _encode_event(event):
+    """기록할 이벤트면 bytes, 게임이 안 쓰는 이벤트면 None"""
+    if event.type == pygame.QUIT:
+        return bytes((_EV_QUIT,))
+    if event.type == pygame.KEYDOWN:
+        text = event.unicode.encode("utf-8")[:255]
+        return bytes((_EV_KEYDOWN,)) + _KEY.pack(event.key, event.mod & 0xFFFF, len(text)) + text
+    if event.type == pygame.MOUSEBUTTONDOWN:
+        return bytes((_EV_MOUSEDOWN,)) + _MOUSE.pack(event.pos[0], event.pos[1], event.button)
+    if event.type == pygame.MOUSEWHEEL:
+        return bytes((_EV_WHEEL,)) + _WHEEL.pack(event.x, event.y)
+    return None
+
+
+def _decode_events(buf, offset: int, count: int):
+    """(pygame 이벤트 타입, 속성 dict) 리스트와 다음 offset"""
+    events = []
+    for _ in range(count):
+        tag = buf[offset]
+        offset += 1
+        if tag == _EV_QUIT:
+            events.append((pygame.QUIT, {}))
+        elif tag == _EV_KEYDOWN:
+            key, mod, n = _KEY.unpack_from(buf, offset)
+            offset += _KEY.size
+            text = bytes(buf[offset:offset + n]).decode("utf-8", "replace")
+            offset += n
+            events.append((pygame.KEYDOWN, {"key": key, "mod": mod, "unicode": text, "scancode": 0}))
+        elif tag == _EV_MOUSEDOWN:
+            x, y, button = _MOUSE.unpack_from(buf, offset)
+            offset += _MOUSE.size
+            events.append((pygame.MOUSEBUTTONDOWN, {"pos": (x, y), "button": button}))
+        elif tag == _EV_WHEEL:
+            x, y = _WHEEL.unpack_from(buf, offset)
+            offset += _WHEEL.size
+            events.append((pygame.MOUSEWHEEL, {"x": x, "y": y, "flipped": False}))
+        else:
+            raise ValueError(f"알 수 없는 이벤트 번호 {tag}")
+    return events, offset
+
+
+class InputRecorder:
+    """
+    실제 입력을 그대로 넘기면서 프레임마다 기록.
+    고정 타임스텝 루프(loop)도 감싸서 프레임마다 돌린 step 수 / alpha를 같이 저장
+    → SceneManager에 loop와 입력 공급자로 둘 다 이 객체를 넘김
+    게임에 넘기는 키 상태 / 마우스 위치도 기록한 것과 똑같은 값 (녹화/재생 결과가 어긋나지 않게)
+    """
+
+    replaying = False
+
+    def __init__(self, path: str, loop, seed: int = None, keys=TRACKED_KEYS):
+        self.loop = loop
+        self.step_dt = loop.step_dt
+        self.seed = new_seed() if seed is None else seed
+        self.keys = tuple(keys)
+        self.frames = 0
+
+        self._file = gzip.open(path, "wb")
+        self._file.write(_HEADER.pack(_MAGIC, _VERSION, self.seed, self.step_dt, len(self.keys)))
+        self._file.write(b"".join(_KEYCODE.pack(k) for k in self.keys))
+
+        self._steps, self._alpha = 0, 0.0
+        self._pressed = KeyState()
+        self._mouse = (0, 0)
+
+    def tick(self):
+        self._steps, self._alpha = self.loop.tick()
+        return self._steps, self._alpha
+
+    @property
+    def skipped_steps(self) -> int:
+        return self.loop.skipped_steps
+
+    def events(self):
+        events = pygame.event.get()
+        # 이벤트를 다 꺼낸 뒤의 키 상태 = 이번 프레임 step들이 읽는 키 상태
+        pressed = pygame.key.get_pressed()
+        down = [i for i, k in enumerate(self.keys) if pressed[k]]
+        self._pressed = KeyState(self.keys[i] for i in down)
+        mask = sum(1 << i for i in down)
+
+        encoded = [e for e in map(_encode_event, events) if e is not None]
+        if len(encoded) > _MAX_EVENTS:
+            raise ValueError(f"한 프레임 이벤트가 너무 많음 ({len(encoded)}개, 최대 {_MAX_EVENTS})")
+        self._file.write(_FRAME.pack(self._steps, self._alpha, mask, len(encoded)))
+        if encoded:
+            self._mouse = pygame.mouse.get_pos()
+            self._file.write(_POS.pack(*self._mouse))
+            self._file.write(b"".join(encoded))
+        self.frames += 1
+        return events
+
+    def get_pressed(self):
+        return self._pressed
+
+    def mouse_pos(self):
+        return self._mouse
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            print(f"녹화 저장: {self.frames} 프레임, 시드 {self.seed}")
+
+
+def _read_all(path: str) -> bytes:
+    """gzip 전체를 읽음. 게임이 죽어서 끝이 잘린 파일이면 읽힌 데까지만"""
+    chunks = []
+    with gzip.open(path, "rb") as f:
+        try:
+            while True:
+                chunk = f.read(1 << 16)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        except (EOFError, zlib.error):
+            pass
+    return b"".join(chunks)
+
+
+class InputReplayer:
+    """
+    녹화 파일을 프레임마다 그대로 돌려주는 loop + 입력 공급자.
+    - tick(): 녹화된 step 수 / alpha (실제 경과 시간은 무시)
+    - events(): 녹화된 이벤트 (새 pygame 이벤트로 만들어서)
+    - get_pressed() / mouse_pos(): 녹화된 키 상태 / 마우스 위치
+    - 파일은 시작할 때 한 번에 풀어 둠 → 재생 중 프레임 시간에 파싱 비용이 안 섞임
+    - 녹화가 끝나면 QUIT 이벤트를 보내서 게임을 끝냄
+    max_fps > 0이면 그 FPS로 속도를 맞춤 (0이면 최대한 빨리 → 프로파일링용)
+    """
+
+    replaying = True
+    skipped_steps = 0   # 녹화된 step 수를 그대로 돌리므로 버리는 step 없음
+
+    def __init__(self, path: str, max_fps: int = 0, clock=None):
+        buf = memoryview(_read_all(path))
+        magic, version, self.seed, self.step_dt, n_keys = _HEADER.unpack_from(buf, 0)
+        if (magic, version) != (_MAGIC, _VERSION):
+            raise ValueError(f"{path}: 녹화 파일 형식이 아님")
+        offset = _HEADER.size
+        keys = [k for (k,) in _KEYCODE.iter_unpack(buf[offset:offset + n_keys * _KEYCODE.size])]
+        offset += n_keys * _KEYCODE.size
+
+        self.frames = []   # (steps, alpha, KeyState, 마우스 위치, 이벤트 리스트)
+        states = {}        # 비트마스크 -> KeyState (같은 조합은 공유)
+        mouse = (0, 0)     # 이벤트 없는 프레임은 직전 위치 그대로
+        while offset + _FRAME.size <= len(buf):
+            steps, alpha, mask, n_events = _FRAME.unpack_from(buf, offset)
+            try:
+                next_offset = offset + _FRAME.size
+                if n_events:
+                    mouse = _POS.unpack_from(buf, next_offset)
+                    next_offset += _POS.size
+                events, next_offset = _decode_events(buf, next_offset, n_events)
+            except (IndexError, struct.error):
+                break   # 잘린 마지막 프레임
+            offset = next_offset
+            state = states.get(mask)
+            if state is None:
+                state = states[mask] = KeyState(k for i, k in enumerate(keys) if mask >> i & 1)
+            self.frames.append((steps, alpha, state, mouse, events))
+
+        self.max_fps = max_fps
+        self.clock = clock if clock is not None else pygame.time.Clock()
+        self.frame = -1
+        self._pressed = KeyState()
+        self._mouse = (0, 0)
+
+    @property
+    def finished(self) -> bool:
+        return self.frame >= len(self.frames)
+
+    def tick(self):
+        if self.max_fps:
+            self.clock.tick(self.max_fps)
+        self.frame += 1
+        if self.finished:
+            return 0, 0.0
+        steps, alpha, self._pressed, self._mouse, _ = self.frames[self.frame]
+        return steps, alpha
+
+    def events(self):
+        if self.finished:
+            return [pygame.event.Event(pygame.QUIT)]
+        # 실제 입력은 버림 (창 닫기만 받아 줌)
+        if any(e.type == pygame.QUIT for e in pygame.event.get()):
+            return [pygame.event.Event(pygame.QUIT)]
+        return [pygame.event.Event(kind, attrs) for kind, attrs in self.frames[self.frame][4]]
+
+    def get_pressed(self):
+        return self._pressed
+
+    def mouse_pos(self):
+        return self._mouse
+
+    def close(self):
+        pass
@@ -0,0 +1,138 @@
+# scene_manager.py
+import sys
+
+import pygame
+
+from profiler import profiler
+from replay import LiveInput
+
+
+class Scene:
+    """
+    씬 기본 클래스. 스택 맨 위 씬만 입력/업데이트/그리기를 받음.
+    아래에 깔린 씬은 pause 상태로 상태를 그대로 들고 있음 (다시 올라오면 on_resume).
+    """
+
+    name = "scene"   # 프로파일러 구간 이름에 쓰임
+
+    def __init__(self):
+        self.manager = None
+
+    def on_enter(self):
+        """스택에 올라갈 때"""
+
+    def on_exit(self):
+        """스택에서 빠질 때"""
+
+    def on_pause(self):
+        """위에 다른 씬이 올라올 때"""
+
+    def on_resume(self):
+        """위에 있던 씬이 빠져서 다시 맨 위가 될 때"""
+
+    def close(self):
+        """프로그램이 끝날 때 (스택에 남아 있던 씬 모두, 백그라운드 스레드 등 정리)"""
+
+    def handle_event(self, event):
+        pass
+
+    def update(self, dt: float):
+        pass
+
+    def draw(self, alpha: float):
+        pass
+
+
+class SceneManager:
+    """
+    씬 스택 + 하나뿐인 이벤트 펌프 / 시계 / 고정 타임스텝 루프.
+    씬들은 자기 while 루프를 갖지 않고 update(dt) / draw(alpha)만 구현.
+    이벤트는 input_source.events()에서 꺼냄 (기본은 실제 입력, 녹화/재생 때는 replay.py)
+    """
+
+    def __init__(self, screen, loop, compositor, input_source=None):
+        self.screen = screen
+        self.loop = loop
+        self.compositor = compositor
+        self.input = input_source or LiveInput()
+        self.stack = []
+
+    @property
+    def top(self):
+        return self.stack[-1] if self.stack else None
+
+    # ─────────────────────────────
+    # 스택 조작
+    # ─────────────────────────────
+    def push(self, scene: Scene):
+        if self.stack:
+            self.stack[-1].on_pause()
+        scene.manager = self
+        self.stack.append(scene)
+        scene.on_enter()
+        self._switched()
+
+    def pop(self):
+        scene = self.stack.pop()
+        scene.on_exit()
+        if self.stack:
+            self.stack[-1].on_resume()
+        self._switched()
+        return scene
+
+    def replace(self, scene: Scene):
+        old = self.stack.pop()
+        old.on_exit()
+        scene.manager = self
+        self.stack.append(scene)
+        scene.on_enter()
+        self._switched()
+
+    def _switched(self):
+        # 씬이 바뀐 첫 프레임은 화면 전체 갱신
+        self.compositor.invalidate_all()
+
+    # ─────────────────────────────
+    # 메인 루프
+    # ─────────────────────────────
+    def run(self):
+        loop = self.loop
+        compositor = self.compositor
+
+        while self.stack:
+            steps, alpha = loop.tick()
+            profiler.begin_frame()
+
+            with profiler.span("input"):
+                for event in self.input.events():
+                    if event.type == pygame.QUIT:
+                        for scene in reversed(self.stack):
+                            scene.close()
+                        self.input.close()
+                        pygame.quit()
+                        sys.exit()
+                    if profiler.handle_event(event):
+                        continue
+                    if self.stack:
+                        self.stack[-1].handle_event(event)
+
+            # 한 step 안에서 씬이 바뀌면 남은 step은 새 씬이 이어서 받음
+            for _ in range(steps):
+                scene = self.top
+                if scene is None:
+                    break
+                with profiler.span(scene.name + ".update"):
+                    scene.update(loop.step_dt)
+
+            scene = self.top
+            if scene is None:
+                break
+            with profiler.span(scene.name + ".draw"):
+                scene.draw(alpha)
+
+            compositor.mark(profiler.draw_overlay(self.screen, loop))
+            with profiler.span("flip"):
+                compositor.present()
+            profiler.end_frame()
+
+        self.input.close()
@@ -0,0 +1,363 @@
+# scenes.py
+import pygame
+
+import assets
+import panels
+from building import BuildingScene
+from dialogue import DialogueManager
+from effects import EffectManager, Fade
+from entities import EntityStore, ITEM, KEY, PICKUP_SIZE
+from fonts import render_text
+from intro_typing import IntroTypingManager
+from profiler import profiler
+from replay import rng_for
+from scene_manager import Scene
+from world import World
+
+
+# ─────────────────────────────
+# 인트로
+# ─────────────────────────────
+INTRO_IMAGE = "intro.png"
+
+
+class IntroScene(Scene):
+    """
+    인트로: 배경만 잠깐 보여준 뒤 문장 타이핑, 다 치고 ENTER → next_scene으로 교체
+    preloader가 있으면 인트로 동안 매 프레임 pump해서 백그라운드 로딩을 마무리하고,
+    ENTER를 눌렀을 때 아직 안 끝났으면 진행률을 보여주며 끝날 때까지만 기다림.
+    next_scene은 씬이나, 로딩이 끝난 뒤 씬을 만들어 줄 함수
+    """
+
+    name = "intro"
+
+    def __init__(self, screen, lines, next_scene, delay: float = 1.2, preloader=None):
+        super().__init__()
+        self.screen = screen
+        self.next_scene = next_scene
+        self.preloader = preloader
+        self.intro = IntroTypingManager(screen, lines)
+        self.starting = False   # ENTER를 눌렀음 (로딩이 끝나면 바로 넘어감)
+        self._progress_area = None
+
+        # 🔹 인트로 딜레이 (배경만 먼저 보여주는 시간)
+        self.delay = delay   # 1.2초 동안 intro.png만 표시
+        self.delay_timer = 0.0
+
+        # 🔹 인트로 배경 이미지 (preloader가 있으면 그쪽에서 디코딩 → 올 때까지 검은 화면)
+        self.background = None
+        if preloader is None:
+            self._make_background()
+
+    def _make_background(self):
+        # 배경 + 어두운 오버레이(알파 90)를 미리 합성 → 매 프레임 blit 한 번
+        intro_bg = assets.load_image(INTRO_IMAGE, self.screen.get_size(), alpha=False)
+        self.background = panels.get_composited(intro_bg, (0, 0, 0), 90)
+
+    @property
+    def delay_done(self) -> bool:
+        return self.delay_timer >= self.delay
+
+    @property
+    def loading(self) -> bool:
+        return self.preloader is not None and not self.preloader.done
+
+    def handle_event(self, event):
+        # ENTER로 월드 진입
+        if not self.delay_done:
+            return
+        if event.type == pygame.KEYDOWN and self.intro.finished and event.key == pygame.K_RETURN:
+            self.starting = True
+
+    def update(self, dt: float):
+        if self.preloader is not None:
+            self.preloader.pump()
+            if self.background is None:
+                if not self.preloader.ready(INTRO_IMAGE):
+                    return   # 배경이 오기 전에는 딜레이도 시작 안 함
+                self._make_background()
+                self.manager.compositor.invalidate_all()
+
+        if self.starting and not self.loading:
+            scene = self.next_scene
+            if not isinstance(scene, Scene):
+                scene = scene()
+            self.manager.replace(scene)
+            return
+
+        # 1단계: intro.png만 출력되는 구간
+        if not self.delay_done:
+            self.delay_timer += dt
+            return
+        # 2단계: 타이핑
+        self.intro.update(dt)
+
+    def draw(self, alpha: float):
+        if self.background is None:
+            self.manager.compositor.mark(self.screen.fill((0, 0, 0)))
+            return
+        self.screen.blit(self.background, (0, 0))
+        if self.delay_done:
+            self.manager.compositor.mark(self.intro.draw())
+        if self.loading:
+            self._progress_area = self._draw_progress()
+            self.manager.compositor.mark(self._progress_area)
+        elif self._progress_area is not None:
+            # 로딩이 끝난 프레임: 막대 자리를 배경으로 한 번 갱신
+            self.manager.compositor.mark(self._progress_area)
+            self._progress_area = None
+
+    def _draw_progress(self):
+        """화면 아래 로딩 진행 막대 (ENTER를 누른 뒤엔 글자도)"""
+        w, h = self.screen.get_size()
+        bar = pygame.Rect(w // 4, h - 40, w // 2, 6)
+        pygame.draw.rect(self.screen, (60, 60, 60), bar)
+        pygame.draw.rect(self.screen, (200, 200, 200),
+                         (bar.x, bar.y, int(bar.w * self.preloader.progress), bar.h))
+        area = bar.inflate(0, 4)
+        if self.starting:
+            label = render_text(f"불러오는 중... {int(self.preloader.progress * 100)}%", 24,
+                                (220, 220, 220))
+            area = area.union(self.screen.blit(label, label.get_rect(midbottom=(w // 2, bar.y - 8))))
+        return area
+
+
+# ─────────────────────────────
+# 월드
+# ─────────────────────────────
+class WorldScene(Scene):
+    """
+    캠퍼스 월드 + 건물 입장 대화창 + HP 표시.
+    건물에 들어가면 이 씬은 스택에 남아 pause (월드 상태 그대로, update/draw만 안 불림)
+    건물 씬은 건물마다 한 번 만들어 두고 다시 들어갈 때 reset만 해서 재사용
+    seed를 주면 건물마다 시드로 정해지는 난수를 씀 (녹화/재생용, None이면 매번 다름)
+    아이템 / 탈출키는 월드와 건물 씬이 같이 쓰는 EntityStore 하나에 (zone으로 구분),
+    건물마다 처음 들어갈 때 탈출키 하나를 놓음. 주운 것은 inventory(종류 -> 개수)
+    """
+
+    name = "world"
+
+    def __init__(self, screen, clock, key_source=None, player_hp: int = 100, seed: int = None,
+                 campus=None, chunks=None):
+        super().__init__()
+        self.screen = screen
+        self.clock = clock
+        self.key_source = key_source
+        self.seed = seed
+
+        # campus / chunks: 미리 로드해 둔 맵 데이터 / 청크 맵 (없으면 여기서 로드)
+        self.entities = EntityStore()
+        self.inventory = {}
+        self.world = World(screen, key_source=key_source, campus=campus, chunks=chunks,
+                           entities=self.entities)
+        self.dialogue = DialogueManager(screen)
+        self.player_hp = player_hp
+        self.last_cancelled_building = None
+
+        # 화면 전환 효과 (건물 입장 전 페이드 아웃 / 복귀 후 페이드 인)
+        self.effects = EffectManager()
+        self.entering_building = None   # 페이드 아웃이 끝나면 들어갈 건물
+
+        # 건물 이름 -> BuildingScene (한 번 만든 씬은 재사용)
+        self.building_scenes = {}
+        self.current_building = None
+
+        # 🔧 좌표 측정 모드 (M키로 ON/OFF)
+        self.measure_mode = False
+        self.measure_points = []
+
+    # ─────────────────────────────
+    # 건물 출입
+    # ─────────────────────────────
+    def building_scene(self, name: str) -> BuildingScene:
+        scene = self.building_scenes.get(name)
+        if scene is None:
+            scene = BuildingScene(self.screen, self.clock, name, self.player_hp,
+                                  self.manager.compositor, key_source=self.key_source,
+                                  rng=rng_for(self.seed, name), entities=self.entities)
+            self.building_scenes[name] = scene
+            # 탈출키 (좀비 배치와 다른 난수 → 키가 있어도 좀비 스폰은 그대로)
+            x, y = scene.sim.random_spot(rng_for(self.seed, name + "/key"), PICKUP_SIZE)
+            self.entities.create(KEY, x, y, zone=name)
+        else:
+            scene.reset(self.player_hp)
+        return scene
+
+    def _enter_building(self):
+        name = self.entering_building
+        self.entering_building = None
+        self.effects.clear()
+        self.current_building = self.building_scene(name)
+        self.manager.push(self.current_building)
+
+    def on_resume(self):
+        # 건물에서 나옴 → 남은 HP 가져오고 페이드 인
+        if self.current_building is not None:
+            self.player_hp = self.current_building.hp
+            for kind in self.current_building.picked:
+                self._collect(kind)
+            self.current_building = None
+        self.last_cancelled_building = None
+        self.effects.add(Fade(0.3, (0, 0, 0), 255, 0))
+
+    def close(self):
+        # 청크 프리페치 스레드 종료
+        self.world.map_chunks.close()
+
+    # ─────────────────────────────
+    # 입력
+    # ─────────────────────────────
+    def handle_event(self, event):
+        dialogue = self.dialogue
+
+        # ================================
+        # 월드 대화창 입력 처리
+        # ================================
+        if dialogue.active and event.type == pygame.KEYDOWN:
+            result = dialogue.handle_key(event)
+            if result == "enter":
+                # 0.2초 페이드 아웃 뒤 입장 (루프는 계속 돔)
+                self.entering_building = dialogue.building_name
+                dialogue.close()
+                self.effects.add(Fade(0.2, (0, 0, 0), 0, 255, on_done=self._enter_building))
+            elif result == "cancel":
+                self.last_cancelled_building = dialogue.building_name
+                dialogue.close()
+
+        # 마우스 휠 줌
+        if event.type == pygame.MOUSEWHEEL:
+            self.world.zoom_by(event.y)
+            return
+
+        # =========================================================
+        # 🔧 좌표 측정 모드 토글 (M키)
+        # =========================================================
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_m:
+            self.measure_mode = not self.measure_mode
+            self.measure_points = []
+            print("\n=== 좌표 측정 모드: {} ===".format("ON" if self.measure_mode else "OFF"))
+            if self.measure_mode:
+                print("파란 건물의 '왼쪽 위'를 마우스로 클릭하세요.")
+                print("(P: 마우스 위치를 플레이어 스폰으로, I: 마우스 위치에 아이템 추가)")
+            return
+
+        if not self.measure_mode:
+            return
+
+        # =========================================================
+        # 🔧 측정 모드: 스폰 / 아이템 위치 찍기 → 맵 파일에 바로 저장
+        # =========================================================
+        if event.type == pygame.KEYDOWN and event.key in (pygame.K_p, pygame.K_i):
+            # 마우스 위치도 입력 공급자에서 (녹화/재생 때는 녹화된 위치)
+            x, y = self.world.screen_to_world(*self.manager.input.mouse_pos())
+            campus = self.world.campus
+            if event.key == pygame.K_p:
+                campus.set_spawn("player", x, y)
+                print("플레이어 스폰:", (x, y))
+            else:
+                campus.add_item(ITEM, x, y)
+                self.world.add_item(ITEM, x, y)
+                print("아이템 추가:", (x, y))
+            self._save_map()
+
+        # =========================================================
+        # 🔧 좌표 측정 모드일 때 마우스 클릭 → 건물 Rect 자동 계산
+        # =========================================================
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            self._measure_click(*event.pos)
+
+    def _measure_click(self, mx, my):
+        # 화면 좌표 → 월드 좌표로 변환
+        world_x, world_y = self.world.screen_to_world(mx, my)
+        self.measure_points.append((world_x, world_y))
+        print("찍은 점:", (world_x, world_y))
+
+        if len(self.measure_points) == 1:
+            print("이제 같은 건물의 '오른쪽 아래'를 클릭하세요.")
+        elif len(self.measure_points) == 2:
+            (x1, y1), (x2, y2) = self.measure_points
+            left = min(x1, x2)
+            top = min(y1, y2)
+            width = abs(x2 - x1)
+            height = abs(y2 - y1)
+            rect = pygame.Rect(left, top, width, height)
+
+            # 찍은 영역이 기존 건물과 겹치면 그 건물의 덩어리로 추가, 아니면 새 건물
+            campus = self.world.campus
+            name = campus.zone_index.query_rect(rect)
+            if name is None:
+                name = f"새 건물 {len(campus.buildings) + 1}"
+            campus.add_building(name, rect)
+
+            print("\n🎉 완성된 Rect:")
+            print(f"{name}: pygame.Rect({left}, {top}, {width}, {height})")
+            self._save_map()
+
+            self.measure_mode = False
+            self.measure_points = []
+            print("좌표 측정 모드 OFF\n")
+
+    def _save_map(self):
+        """측정 결과를 맵 파일에 저장 (녹화 재생 중이면 메모리에만 반영)"""
+        if self.manager.input.replaying:
+            print("재생 중이라 맵 파일은 저장하지 않음")
+            return
+        print("저장:", self.world.campus.save())
+
+    # ─────────────────────────────
+    # 시뮬레이션
+    # ─────────────────────────────
+    def update(self, dt: float):
+        dialogue = self.dialogue
+        free = not dialogue.active and self.entering_building is None
+
+        self.effects.update(dt)
+        if self.manager.top is not self:
+            return   # 페이드가 끝나서 건물 씬이 올라감
+
+        dialogue.update(dt)
+        self.world.update(dt, allow_move=free)
+
+        if free:
+            for kind in self.world.pick_up():
+                self._collect(kind)
+            hit = self.world.get_colliding_building()
+            if hit is None:
+                self.last_cancelled_building = None
+            elif hit != self.last_cancelled_building:
+                dialogue.open_for_building(hit)
+
+    def _collect(self, kind: str):
+        self.inventory[kind] = self.inventory.get(kind, 0) + 1
+
+    # ─────────────────────────────
+    # 그리기
+    # ─────────────────────────────
+    def draw(self, alpha: float):
+        screen = self.screen
+        compositor = self.manager.compositor
+
+        compositor.mark(self.world.draw(alpha))
+
+        # HP UI
+        with profiler.span("hud.draw"):
+            hp_bar_width = 200
+            hp_ratio = max(0, self.player_hp / 100)
+            hp_fill = int(hp_bar_width * hp_ratio)
+
+            compositor.mark(pygame.draw.rect(screen, (100, 0, 0), (20, 20, hp_bar_width, 20)))
+            pygame.draw.rect(screen, (255, 80, 80), (20, 20, hp_fill, 20))
+
+            hp_label = render_text(f"HP: {self.player_hp}", 26, (255, 255, 255))
+            compositor.mark(screen.blit(hp_label, (20, 45)))
+
+            items, keys = self.inventory.get(ITEM, 0), self.inventory.get(KEY, 0)
+            if items or keys:
+                bag_label = render_text(f"아이템 {items}  탈출키 {keys}", 26, (255, 230, 120))
+                compositor.mark(screen.blit(bag_label, (20, 75)))
+
+        # 닫힌 프레임에도 불러야 대화창이 있던 자리가 화면에 다시 올라감
+        with profiler.span("dialogue.draw"):
+            compositor.mark(self.dialogue.draw())
+
+        compositor.mark(self.effects.draw(screen))
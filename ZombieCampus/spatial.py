@@ -0,0 +1,80 @@
+# spatial.py
+import numpy as np
+
+
+class GridIndex:
+    """
+    NumPy 균일 격자 공간 인덱스 (좌표 배열 전체를 한꺼번에 다룸, 에이전트별 파이썬 루프 없음).
+    - update(pos): 모든 에이전트 칸 번호를 배열 연산으로 계산.
+      칸이 바뀐 에이전트가 없으면 그대로, 있으면 칸 번호 순 정렬(order)과
+      칸별 시작 위치(start) / 개수(counts)를 다시 만듦 (bincount + 안정 정렬)
+    - query_rect: 겹치는 칸들의 에이전트만 후보로 꺼내서 정확히 거름 (플레이어 충돌용)
+    - neighbor_sums: 에이전트마다 주변 3x3 칸 안 에이전트들의 값 합계 (좀비끼리 밀어내기용)
+    bounds 밖 좌표는 가장자리 칸으로. pygame에 의존하지 않음
+    """
+
+    def __init__(self, cell_size: float, bounds):
+        self.cell_size = cell_size
+        self.cols = int(bounds[0] // cell_size) + 1
+        self.rows = int(bounds[1] // cell_size) + 1
+        self.pos = np.zeros((0, 2))
+        self.keys = np.zeros(0, dtype=np.int64)          # 칸 번호 cy * cols + cx
+        self.order = np.zeros(0, dtype=np.int64)         # 칸 번호 순으로 정렬한 에이전트 번호
+        self.counts = np.zeros(self.cols * self.rows, dtype=np.int64)
+        self.start = np.zeros(self.cols * self.rows + 1, dtype=np.int64)
+        self._last = np.array((self.cols - 1, self.rows - 1))   # 가장자리 칸 (cx, cy)
+
+        self._padded = np.zeros(0, dtype=np.int64)   # 테두리 한 칸을 두른 격자에서의 칸 번호
+
+    def __len__(self):
+        return len(self.keys)
+
+    def update(self, pos):
+        """pos: (N, 2) 좌표 배열 (참조만 들고 있음, 질의 때 그대로 읽음)"""
+        self.pos = pos
+        cells = np.clip((pos // self.cell_size).astype(np.int64), 0, self._last)
+        keys = cells[:, 1] * self.cols + cells[:, 0]
+        if len(keys) == len(self.keys) and np.array_equal(keys, self.keys):
+            return   # 칸을 옮긴 에이전트 없음 → 정렬 그대로
+        self.keys = keys
+        self.order = np.argsort(keys, kind="stable")
+        self.counts = np.bincount(keys, minlength=self.cols * self.rows)
+        self.start[1:] = np.cumsum(self.counts)
+        self._padded = (cells[:, 1] + 1) * (self.cols + 2) + cells[:, 0] + 1
+
+    # ─────────────────────────────
+    # 질의
+    # ─────────────────────────────
+    def _candidates(self, left: float, top: float, right: float, bottom: float):
+        """(left, top)~(right, bottom)에 걸친 칸들에 있는 에이전트 번호 (정확한 판정 전)"""
+        cs = self.cell_size
+        cx0, cx1 = max(0, int(left // cs)), min(self.cols - 1, int(right // cs))
+        cy0, cy1 = max(0, int(top // cs)), min(self.rows - 1, int(bottom // cs))
+        if cx0 > cx1 or cy0 > cy1:
+            return np.zeros(0, dtype=np.int64)
+        # 한 줄(cy)의 cx0~cx1 칸들은 정렬된 order에서 연속 구간
+        start, order = self.start, self.order
+        return np.concatenate([
+            order[start[cy * self.cols + cx0]:start[cy * self.cols + cx1 + 1]]
+            for cy in range(cy0, cy1 + 1)
+        ])
+
+    def query_rect(self, left: float, top: float, right: float, bottom: float):
+        """(left, top)~(right, bottom) 안에 있는 에이전트 번호 배열 (오름차순, 경계 위는 제외)"""
+        ids = self._candidates(left, top, right, bottom)
+        p = self.pos[ids]
+        inside = (left < p[:, 0]) & (p[:, 0] < right) & (top < p[:, 1]) & (p[:, 1] < bottom)
+        return np.sort(ids[inside])
+
+    def neighbor_sums(self, weights):
+        """
+        에이전트마다 자기 칸 + 주변 8칸에 있는 에이전트들(자기 포함)의 weights 합.
+        weights: (N, k) → (N, k). 칸별 합을 테두리 두른 격자에 bincount로 모아
+        3x3 합을 칸 단위로 구한 뒤 에이전트 칸에서 꺼냄 (O(N + 칸 수))
+        """
+        rows, cols = self.rows, self.cols
+        size = (rows + 2) * (cols + 2)
+        grid = np.stack([np.bincount(self._padded, weights=w, minlength=size)
+                         for w in weights.T], axis=1).reshape(rows + 2, cols + 2, -1)
+        total = sum(grid[dy:dy + rows, dx:dx + cols] for dy in range(3) for dx in range(3))
+        return total.reshape(rows * cols, -1)[self.keys]
@@ -0,0 +1,82 @@
+# sprites.py
+import pygame
+
+import alloc_stats
+
+
+class SpriteVariantCache:
+    """
+    줌 배율에 맞게 미리 확대해 둔 스프라이트 프레임 캐시.
+    - register(name, frames)로 원본 프레임(1장 또는 애니메이션 여러 장) 등록
+    - set_zoom(zoom)이 실제로 바뀔 때만 모든 프레임을 한 번에 다시 확대
+    - get(name, frame)은 미리 만든 Surface를 그대로 리턴 (프레임마다 할당 없음)
+    """
+
+    def __init__(self, base_size, zoom: float = 1.0):
+        self.base_w, self.base_h = base_size
+        self.zoom = zoom
+        self._frames = {}   # name -> 원본 프레임 리스트
+        self._scaled = {}   # name -> 현재 줌으로 확대된 프레임 리스트
+
+    def scaled_size(self):
+        return (int(self.base_w * self.zoom), int(self.base_h * self.zoom))
+
+    def register(self, name: str, frames):
+        """name에 프레임들을 등록 (Surface 하나만 줘도 됨)"""
+        if isinstance(frames, pygame.Surface):
+            frames = [frames]
+        self._frames[name] = list(frames)
+        self._scaled[name] = self._scale_frames(self._frames[name])
+
+    def set_zoom(self, zoom: float):
+        """줌이 바뀌었을 때만 전체 프레임 재생성"""
+        if zoom == self.zoom:
+            return
+        self.zoom = zoom
+        for name, frames in self._frames.items():
+            self._scaled[name] = self._scale_frames(frames)
+
+    def _scale_frames(self, frames):
+        size = self.scaled_size()
+        alloc_stats.count("sprite", len(frames))
+        return [pygame.transform.smoothscale(f, size) for f in frames]
+
+    def frame_count(self, name: str) -> int:
+        return len(self._frames[name])
+
+    def get(self, name: str, frame: int = 0) -> pygame.Surface:
+        frames = self._scaled[name]
+        return frames[frame % len(frames)]
+
+
+# 줍는 엔티티(entities.py) 모양: 종류 -> 색 (모르는 종류는 기본색)
+PICKUP_COLORS = {
+    "item": (80, 200, 120),
+    "key": (255, 200, 40),
+}
+DEFAULT_PICKUP_COLOR = (200, 200, 200)
+
+# (종류, 크기) -> Surface
+_pickup_sprites = {}
+
+
+def pickup_sprite(kind: str, size: int) -> pygame.Surface:
+    """아이템은 동그라미, 탈출키는 열쇠 모양 (전용 그림이 없어서 도형으로)"""
+    key = (kind, size)
+    surf = _pickup_sprites.get(key)
+    if surf is None:
+        alloc_stats.count("sprite")
+        color = PICKUP_COLORS.get(kind, DEFAULT_PICKUP_COLOR)
+        surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        if kind == "key":
+            r = size // 4
+            pygame.draw.circle(surf, color, (r + 1, size // 2), r, max(2, r // 2))
+            pygame.draw.rect(surf, color, (r * 2, size // 2 - 2, size - r * 2, 4))
+            pygame.draw.rect(surf, color, (size - r, size // 2, 3, r))
+        else:
+            pygame.draw.circle(surf, color, (size // 2, size // 2), size // 2 - 1)
+            pygame.draw.circle(surf, (255, 255, 255), (size // 2, size // 2), size // 2 - 1, 2)
+        if pygame.display.get_surface():
+            surf = surf.convert_alpha()
+        _pickup_sprites[key] = surf
+    return surf
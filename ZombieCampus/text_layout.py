@@ -0,0 +1,111 @@
+# text_layout.py
+import pygame
+
+import alloc_stats
+
+# 폰트 객체 -> {글자: (advance, 글자가 줄 끝일 때 차지하는 폭)}
+_advances = {}
+
+
+def glyph_advance(font: pygame.font.Font, ch: str):
+    """
+    글자 하나의 (advance, extent) (폰트별로 캐시).
+    advance: 다음 글자까지 거리 / extent: 줄 마지막 글자일 때 실제 폭 (오른쪽 bearing 포함)
+    """
+    table = _advances.get(font)
+    if table is None:
+        table = _advances[font] = {}
+
+    adv = table.get(ch)
+    if adv is None:
+        metrics = font.metrics(ch)
+        if metrics and metrics[0] is not None:
+            _, maxx, _, _, advance = metrics[0]
+            adv = (advance, max(advance, maxx))
+        else:
+            w = font.size(ch)[0]  # 폰트에 없는 글자 등
+            adv = (w, w)
+        table[ch] = adv
+    return adv
+
+
+class IncrementalWrapper:
+    """
+    글자 단위 줄바꿈을 글자가 추가될 때마다 이어서 계산.
+    - 공백 기준이 아니라 '글자 단위'로 줄을 나눔 (한국어는 띄어쓰기 없어도 줄바꿈)
+    - '\\n'은 강제 줄바꿈
+    - 글자 폭은 glyph_advance 캐시를 써서 font.size(전체 문자열)를 다시 재지 않음
+    타이핑 효과처럼 텍스트가 뒤로만 늘어나면 새 글자만큼만 일함.
+    """
+
+    def __init__(self, font: pygame.font.Font, max_width: int):
+        self.font = font
+        self.max_width = max_width
+        self.reset()
+
+    def reset(self):
+        self.text = ""
+        self._done = []      # 확정된 줄
+        self._current = ""   # 아직 늘어나는 마지막 줄
+        self._width = 0
+
+    def append(self, chars: str):
+        font = self.font
+        self.text += chars
+        for ch in chars:
+            if ch == "\n":
+                if self._current:
+                    self._done.append(self._current)
+                self._current = ""
+                self._width = 0
+                continue
+
+            adv, extent = glyph_advance(font, ch)
+            if self._width + extent <= self.max_width or not self._current:
+                self._current += ch
+                self._width += adv
+            else:
+                self._done.append(self._current)
+                self._current = ch
+                self._width = adv
+
+    def set_text(self, text: str):
+        """text가 기존 텍스트 뒤에 글자만 붙은 거면 이어서, 아니면 처음부터 다시"""
+        if text == self.text:
+            return
+        if not text.startswith(self.text):
+            self.reset()
+        self.append(text[len(self.text):])
+
+    def lines(self):
+        if self._current:
+            return self._done + [self._current]
+        return list(self._done)
+
+
+def wrap_text_chars(text: str, font: pygame.font.Font, max_width: int):
+    """한 번만 쓰는 글자 단위 줄바꿈 (줄 리스트 리턴)"""
+    wrapper = IncrementalWrapper(font, max_width)
+    wrapper.append(text)
+    return wrapper.lines()
+
+
+class LaidOutParagraph:
+    """
+    다 쳐진 문단: 줄바꿈 + 렌더링을 한 번만 해서 Surface 하나로 들고 있음.
+    height는 줄 간격(line_gap)까지 포함한 높이 (다음 문단 시작 위치 계산용)
+    """
+
+    def __init__(self, text: str, font: pygame.font.Font, color, max_width: int, line_gap: int = 10):
+        self.text = text
+        self.lines = wrap_text_chars(text, font, max_width)
+        self.line_height = font.get_height() + line_gap
+        self.height = self.line_height * len(self.lines)
+
+        width = max((font.size(line)[0] for line in self.lines), default=0)
+        alloc_stats.count("text", len(self.lines) + 1)
+        self.surface = pygame.Surface((max(1, width), max(1, self.height)), pygame.SRCALPHA)
+        y = 0
+        for line in self.lines:
+            self.surface.blit(font.render(line, True, color), (0, y))
+            y += self.line_height
@@ -1,59 +1,99 @@
 # world.py
 import pygame
 
-# 건물 좌표 (네가 측정해 준 값 반영)
-BUILDINGS = {
-    "정의관":     pygame.Rect(295, 398, 46, 61),
-    "청송관":     pygame.Rect(395, 301, 66, 40),
-    "컨버전스홀": pygame.Rect(505, 409, 90, 51),
-    "학생회관":   pygame.Rect(438, 503, 50, 64),
-    "도서관":     pygame.Rect(636, 490, 37, 76),
-    # 미래관은 두 덩어리 → 하나의 큰 Rect로 합침
-    "미래관": pygame.Rect(748, 450, 55, 110),
-    "창조관":     pygame.Rect(623, 289, 90, 53),
-    "백운관":     pygame.Rect(741, 131, 92, 51),
-}
+import alloc_stats
+from animation import Animation, player_clips
+from atlas import get_atlas
+from map_renderer import ZoomedMapRenderer
+from minimap import MinimapLayer
+from sprites import SpriteVariantCache, pickup_sprite, PICKUP_COLORS
+from campus_map import load_map
+from entities import EntityStore, WORLD_ZONE, PICKUP_SIZE
+from chunked_map import open_map
+from game_loop import lerp
+from profiler import profiler
+
+# 마우스 휠 줌 범위 / 속도
+MAX_ZOOM = 4.0
+ZOOM_STEP = 1.15        # 휠 한 칸당 배율
+ZOOM_SMOOTHING = 12.0   # 목표 줌으로 다가가는 속도 (클수록 빠름)
+
+# 미니맵 마커 갱신 주기 (메인 화면보다 느려도 됨)
+MINIMAP_HZ = 10
+
+# 월드 플레이어 크기 (아틀라스의 "player48" 프레임들)
+PLAYER_SIZE = 48
+PLAYER_SHEET = "player48"
 
 
 class World:
-    def __init__(self, screen, map_path="map.png"):
+    def __init__(self, screen, map_path=None, key_source=None, campus=None, chunks=None,
+                 entities=None):
         self.screen = screen
         self.SCREEN_W, self.SCREEN_H = screen.get_size()
 
-        # 맵 이미지 로드
-        self.map_image = pygame.image.load(map_path).convert()
-        self.MAP_W, self.MAP_H = self.map_image.get_width(), self.map_image.get_height()
+        # 키 상태 공급자 (기본은 실제 키보드, 헤드리스/리플레이 때는 스크립트)
+        self.key_source = key_source or pygame.key.get_pressed
+
+        # 캠퍼스 맵 데이터 (건물 구역 / 스폰 / 아이템, campus_map.json)
+        self.campus = campus or load_map()
+
+        # 월드에 놓인 아이템들 (EntityStore, 건물 씬과 공용이면 바깥에서 받음)
+        # 맵 파일의 아이템 위치를 zone=WORLD_ZONE 엔티티로 만들어 둠
+        self.entities = entities if entities is not None else EntityStore()
+        for kind in {kind for kind, _, _ in self.campus.items}:
+            self.entities.create_many(kind, [(x, y) for k, x, y in self.campus.items if k == kind])
+
+        # 맵 이미지: 통째로 올리지 않고 청크 단위로 필요할 때만 로드 (map_chunks/, 없으면 자동 생성)
+        # chunks: 미리 열어 둔 ChunkedMap (preloader에서 백그라운드로)
+        self.map_chunks = chunks if chunks is not None else open_map(map_path or self.campus.image)
+        self.MAP_W, self.MAP_H = self.map_chunks.size
 
         # 플레이어 (월드 좌표 기준 위치/크기)
-        self.player_rect = pygame.Rect(400, 400, 48, 48)
+        spawn_x, spawn_y = self.campus.spawn("player", (400, 400))
+        self.player_rect = pygame.Rect(spawn_x, spawn_y, PLAYER_SIZE, PLAYER_SIZE)
         self.player_speed = 300  # px/s
 
         # ─────────────────────────────
-        #  🔥 플레이어 스프라이트 (서있음/왼/오)
+        #  🔥 플레이어 애니메이션 (프레임은 공용 텍스처 아틀라스에서)
         # ─────────────────────────────
         base_size = (self.player_rect.width, self.player_rect.height)
-
-        self.player_img_stand = pygame.transform.scale(
-            pygame.image.load("player_stand.png").convert_alpha(), base_size
-        )
-        self.player_img_right = pygame.transform.scale(
-            pygame.image.load("player_run_right.png").convert_alpha(), base_size
-        )
-        self.player_img_left = pygame.transform.scale(
-            pygame.image.load("player_run_left.png").convert_alpha(), base_size
-        )
-
-        self.player_img = self.player_img_stand
-        self.last_direction = "right"
+        self.atlas = get_atlas()
+        self.player_anim = Animation(player_clips(PLAYER_SHEET))
 
         # ─────────────────────────────
         #  🔍 줌 있는 카메라
         # ─────────────────────────────
         self.zoom = 2.5  # 1.0이면 줌 없음, 1.5면 1.5배 확대
-        cam_w = int(self.SCREEN_W / self.zoom)
-        cam_h = int(self.SCREEN_H / self.zoom)
-        self.camera = pygame.Rect(0, 0, cam_w, cam_h)
-        self.camera.center = self.player_rect.center
+        self.target_zoom = self.zoom   # 마우스 휠로 바꾸는 목표 줌 (zoom이 부드럽게 따라감)
+        # 화면이 맵 밖을 보이지 않을 만큼만 축소 가능
+        self.min_zoom = max(self.SCREEN_W / self.MAP_W, self.SCREEN_H / self.MAP_H)
+        self.camera = pygame.Rect(0, 0, 0, 0)
+        self._resize_camera()
+
+        # 렌더링 보간용: 직전 시뮬레이션 step의 플레이어/카메라 위치
+        self.prev_player_pos = self.player_rect.topleft
+        self.prev_camera_pos = self.camera.topleft
+
+        # 줌 레벨별로 미리 확대해 둔 타일 캐시 (zoom이 바뀔 때만 다시 확대)
+        self.map_renderer = ZoomedMapRenderer(self.map_chunks, self.zoom)
+
+        # 줌 배율로 미리 확대한 플레이어 스프라이트 (zoom이 바뀔 때만 다시 확대)
+        # (아틀라스 프레임 이름 그대로 등록, 원본은 아틀라스 subsurface라 픽셀 복사 없음)
+        self.player_sprites = SpriteVariantCache(base_size, self.zoom)
+        for name in self.atlas.names(PLAYER_SHEET + "/"):
+            self.player_sprites.register(name, self.atlas.subsurface(name))
+
+        # 아이템 스프라이트도 줌 배율로 미리 확대 (종류별로 하나)
+        self.pickup_sprites = SpriteVariantCache((PICKUP_SIZE, PICKUP_SIZE), self.zoom)
+        for kind in set(PICKUP_COLORS) | set(self.entities.kind_names):
+            self.pickup_sprites.register(kind, pickup_sprite(kind, PICKUP_SIZE))
+
+        # 건물 구역 인덱스 (맵 캐시에 미리 만들어진 격자, 매 프레임 칸만 조회)
+        self.building_index = self.campus.zone_index
+
+        # dirty rect 계산용: 지난 프레임에 그린 카메라 위치/줌
+        self._last_view = None
 
         # ─────────────────────────────
         #  🗺 미니맵 설정
@@ -64,18 +104,68 @@ class World:
         self.minimap_x = self.SCREEN_W - self.minimap_w - 20
         self.minimap_y = 20
 
+        # 원본 대신 미리 줄여 둔 저해상도 단계에서 만듦 (원본 전체를 읽지 않음)
+        level = self.map_chunks.level_for_size(self.minimap_w, self.minimap_h)
+        alloc_stats.count("minimap")
         self.minimap_surface = pygame.transform.smoothscale(
-            self.map_image, (self.minimap_w, self.minimap_h)
+            self.map_chunks.level_image(level), (self.minimap_w, self.minimap_h)
         )
 
+        # 배경은 한 번만 합성, 마커(플레이어 점 / 시야 박스)는 10Hz로 움직인 것만 다시 그림
+        self.minimap = MinimapLayer(self.minimap_surface, (self.minimap_x, self.minimap_y),
+                                    (self.MAP_W, self.MAP_H), rate=MINIMAP_HZ)
+        self.minimap.add_box("camera", (0, 230, 255))   # 현재 화면이 보고 있는 영역 (시안색)
+        self.minimap.add_dots("items", (255, 200, 40), radius=3)
+        self._update_item_markers()
+        self.minimap.add_dots("player", (255, 80, 80), radius=4)
+
+    # ─────────────────────────────
+    #  🔍 줌
+    # ─────────────────────────────
+    def zoom_by(self, steps: float):
+        """마우스 휠: steps > 0 확대, < 0 축소 (목표 줌만 바꾸고 실제 줌은 update에서 따라감)"""
+        self.target_zoom = max(self.min_zoom, min(MAX_ZOOM, self.target_zoom * ZOOM_STEP ** steps))
+
+    @property
+    def zooming(self) -> bool:
+        return self.zoom != self.target_zoom
+
+    def _resize_camera(self):
+        """줌에 맞게 카메라 크기를 바꾸고 플레이어 중심으로 다시 맞춤"""
+        self.camera.size = (int(self.SCREEN_W / self.zoom), int(self.SCREEN_H / self.zoom))
+        self._update_camera()
+
+    def _update_zoom(self, dt):
+        if not self.zooming:
+            return
+        self.zoom += (self.target_zoom - self.zoom) * min(1.0, ZOOM_SMOOTHING * dt)
+        if abs(self.target_zoom - self.zoom) < 0.005:
+            self.zoom = self.target_zoom
+        self._resize_camera()
+        # 크기가 바뀐 step은 보간하지 않음 (이전 위치는 다른 크기 기준)
+        self.prev_camera_pos = self.camera.topleft
+
     def update(self, dt, allow_move=True):
-        """월드 상태 업데이트 (플레이어 이동 + 카메라)"""
+        """월드 상태 업데이트 (플레이어 이동 + 카메라). 고정 타임스텝 dt로 호출"""
+        self.prev_player_pos = self.player_rect.topleft
+        self.prev_camera_pos = self.camera.topleft
         if allow_move:
             self._update_player(dt)
             self._update_camera()
+        self._update_zoom(dt)
+
+        # 미니맵 마커 위치 (실제 다시 그리기는 MinimapLayer가 MINIMAP_HZ로)
+        self.minimap.set_positions("player", [self.player_rect.topleft])
+        self.minimap.set_rect("camera", self.camera)
+        self.minimap.update(dt)
+
+        # 카메라가 움직이는 방향으로 맵 청크 미리 읽기
+        vx = (self.camera.x - self.prev_camera_pos[0]) / dt
+        vy = (self.camera.y - self.prev_camera_pos[1]) / dt
+        self.map_renderer.prefetch(self.camera, vx, vy)
 
     def _update_player(self, dt):
-        keys = pygame.key.get_pressed()
+        keys = self.key_source()
         dx = dy = 0
 
         if keys[pygame.K_w] or keys[pygame.K_UP]:
@@ -93,22 +183,9 @@ class World:
             dx /= length
             dy /= length
 
-        # 스프라이트 방향 결정
-        if dx == 0 and dy == 0:
-            self.player_img = self.player_img_stand
-        else:
-            if dx > 0:
-                self.player_img = self.player_img_right
-                self.last_direction = "right"
-            elif dx < 0:
-                self.player_img = self.player_img_left
-                self.last_direction = "left"
-            else:
-                # 위/아래만 움직일 때는 마지막 방향 유지
-                if self.last_direction == "right":
-                    self.player_img = self.player_img_right
-                else:
-                    self.player_img = self.player_img_left
+        # 이동 방향에 맞는 동작 (위/아래만 움직이면 마지막 좌우 방향 유지)
+        self.player_anim.move(dx, dy)
+        self.player_anim.update(dt)
 
         # 실제 이동
         self.player_rect.x += dx * self.player_speed * dt
@@ -118,6 +195,32 @@ class World:
         self.player_rect.x = max(0, min(self.player_rect.x, self.MAP_W - self.player_rect.width))
         self.player_rect.y = max(0, min(self.player_rect.y, self.MAP_H - self.player_rect.height))
 
+    # ─────────────────────────────
+    #  아이템
+    # ─────────────────────────────
+    def add_item(self, kind: str, x: int, y: int):
+        """월드에 아이템 하나 놓기 (측정 모드에서 찍은 것 등)"""
+        if kind not in self.entities.kind_names:
+            self.pickup_sprites.register(kind, pickup_sprite(kind, PICKUP_SIZE))
+        self.entities.create(kind, x, y, WORLD_ZONE)
+        self._item_changed()
+
+    def pick_up(self):
+        """플레이어가 닿은 월드 아이템을 줍고 종류 이름 리스트를 리턴"""
+        kinds = self.entities.pick_up(*self.player_rect, zone=WORLD_ZONE)
+        if kinds:
+            self._item_changed()
+        return kinds
+
+    def _item_changed(self):
+        self._update_item_markers()
+        self._last_view = None   # 사라진/생긴 아이템 자리도 다시 올라가게 화면 전체
+
+    def _update_item_markers(self):
+        """미니맵 아이템 점 (바뀔 때만, 아이템 중심 기준)"""
+        ids = self.entities.select(zone=WORLD_ZONE)
+        self.minimap.set_positions("items", self.entities.pos[ids] + PICKUP_SIZE / 2)
+
     def _update_camera(self):
         """카메라를 플레이어 중심으로 이동, 맵 밖으로 안 나가게 조정"""
         self.camera.center = self.player_rect.center
@@ -125,65 +228,67 @@ class World:
         self.camera.x = max(0, min(self.camera.x, self.MAP_W - self.camera.width))
         self.camera.y = max(0, min(self.camera.y, self.MAP_H - self.camera.height))
 
+    def screen_to_world(self, sx, sy):
+        """화면 좌표 → 맵(월드) 좌표 (줌 반영)"""
+        return (int(self.camera.x + sx / self.zoom), int(self.camera.y + sy / self.zoom))
+
     def get_colliding_building(self):
         """플레이어가 어떤 건물 위에 있는지 확인, 없으면 None"""
-        for name, rect in BUILDINGS.items():
-            if self.player_rect.colliderect(rect):
-                return name
-        return None
+        return self.building_index.query_rect(self.player_rect)
 
-    def draw(self):
+    def draw(self, alpha: float = 1.0):
+        """
+        월드를 그리고, 이번 프레임에 바뀐 화면 영역(Rect 리스트)을 리턴.
+        alpha: 직전 step(0) ~ 현재 step(1) 사이 보간 비율
+        """
         screen = self.screen
 
+        # 보간된 카메라 / 플레이어 위치
+        camera = self.camera.copy()
+        camera.x = round(lerp(self.prev_camera_pos[0], self.camera.x, alpha))
+        camera.y = round(lerp(self.prev_camera_pos[1], self.camera.y, alpha))
+        player_x = lerp(self.prev_player_pos[0], self.player_rect.x, alpha)
+        player_y = lerp(self.prev_player_pos[1], self.player_rect.y, alpha)
+
         # ─────────────────────────────
         #  메인 화면: 줌된 맵 그리기
         # ─────────────────────────────
-        # 카메라가 가리키는 부분을 잘라서
-        view = self.map_image.subsurface(self.camera)
-        # 화면 크기에 맞게 확대/축소
-        view_scaled = pygame.transform.smoothscale(
-            view, (self.SCREEN_W, self.SCREEN_H)
-        )
-        screen.blit(view_scaled, (0, 0))
+        # 카메라가 가리키는 부분의 미리 확대된 타일만 blit
+        with profiler.span("world.map"):
+            # 줌 애니메이션 중에는 빠른 확대, 멈추면 부드러운 확대로 다시 만듦
+            self.map_renderer.set_zoom(self.zoom, fast=self.zooming)
+            self.map_renderer.draw(screen, camera)
 
         # 플레이어 그리기 (카메라 기준 → 줌 반영)
         scale = self.zoom
-        px = (self.player_rect.x - self.camera.x) * scale
-        py = (self.player_rect.y - self.camera.y) * scale
-        pw = int(self.player_rect.width * scale)
-        ph = int(self.player_rect.height * scale)
+        px = (player_x - camera.x) * scale
+        py = (player_y - camera.y) * scale
 
-        player_scaled = pygame.transform.smoothscale(self.player_img, (pw, ph))
-        screen.blit(player_scaled, (px, py))
+        # 아이템: 카메라 안에 있는 것만 (배열 질의 한 번)
+        entities = self.entities
+        ids = entities.in_rect(camera.x, camera.y, camera.width, camera.height, zone=WORLD_ZONE)
+        if len(ids):
+            self.pickup_sprites.set_zoom(scale)
+            get = self.pickup_sprites.get
+            offset = (camera.x, camera.y)
+            screen_pos = ((entities.pos[ids] - offset) * scale).astype(int).tolist()
+            screen.blits([(get(kind), pos) for kind, pos in zip(entities.kinds_of(ids), screen_pos)],
+                         doreturn=False)
+
+        self.player_sprites.set_zoom(scale)
+        player_scaled = self.player_sprites.get(self.player_anim.frame)
+        player_dirty = screen.blit(player_scaled, (px, py))
 
         # ─────────────────────────────
         #  미니맵
         # ─────────────────────────────
-        # 미니맵 배경
-        pygame.draw.rect(
-            screen,
-            (0, 0, 0),
-            (self.minimap_x - 5, self.minimap_y - 5, self.minimap_w + 10, self.minimap_h + 10),
-        )
-        screen.blit(self.minimap_surface, (self.minimap_x, self.minimap_y))
-
-        # 미니맵 위 플레이어 점
-        mini_player_x = self.minimap_x + (self.player_rect.x / self.MAP_W) * self.minimap_w
-        mini_player_y = self.minimap_y + (self.player_rect.y / self.MAP_H) * self.minimap_h
-        pygame.draw.circle(
-            screen, (255, 80, 80),
-            (int(mini_player_x), int(mini_player_y)), 4
-        )
+        minimap_dirty = self.minimap.draw(screen)
 
-        # 미니맵 위 카메라 시야 박스 (현재 화면이 보고 있는 영역)
-        mini_cam_x = self.minimap_x + (self.camera.x / self.MAP_W) * self.minimap_w
-        mini_cam_y = self.minimap_y + (self.camera.y / self.MAP_H) * self.minimap_h
-        mini_cam_w = (self.camera.width / self.MAP_W) * self.minimap_w
-        mini_cam_h = (self.camera.height / self.MAP_H) * self.minimap_h
-
-        pygame.draw.rect(
-            screen,
-            (0, 230, 255),   # 시안색 박스
-            (mini_cam_x, mini_cam_y, mini_cam_w, mini_cam_h),
-            2
-        )
+        # ─────────────────────────────
+        #  dirty rect: 카메라가 움직였으면 화면 전체, 아니면 플레이어 + 미니맵
+        # ─────────────────────────────
+        view = (camera.x, camera.y, self.zoom)
+        if view != self._last_view:
+            self._last_view = view
+            return [screen.get_rect()]
+        return [player_dirty, minimap_dirty]
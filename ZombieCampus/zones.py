@@ -0,0 +1,108 @@
+# zones.py
+import pygame
+
+
+class ZoneIndex:
+    """
+    건물/문/트리거 구역용 정적 격자 인덱스.
+    - 한 구역(zone)은 Rect 하나 또는 여러 개(ㄱ자, 두 동짜리 건물 등)
+    - 생성할 때 한 번만 격자 칸마다 겹치는 (zone, rect)를 넣어 둠
+    - 질의는 플레이어 Rect가 걸친 칸들만 확인 → 구역이 수백 개여도 거의 상수 시간
+    - 여러 구역이 겹치면 등록 순서가 빠른 구역이 우선 (기존 dict 순회와 같음)
+    """
+
+    def __init__(self, zones: dict, cell_size: int = 64):
+        self.cell_size = cell_size
+        self._order = {}     # name -> 등록 순서
+        self._rects = {}     # name -> [Rect, ...]
+        self._cells = {}     # (cx, cy) -> [(순서, name, Rect), ...]
+
+        for name, shape in zones.items():
+            self.add(name, shape)
+
+    def add(self, name: str, shape):
+        """shape: Rect / (x, y, w, h) / 그 리스트"""
+        if isinstance(shape, (pygame.Rect, tuple)):
+            shape = [shape]
+        rects = [pygame.Rect(r) for r in shape]
+
+        order = self._order.setdefault(name, len(self._order))
+        self._rects.setdefault(name, []).extend(rects)
+
+        cs = self.cell_size
+        touched = set()
+        for rect in rects:
+            for cy in range(rect.top // cs, (rect.bottom - 1) // cs + 1):
+                for cx in range(rect.left // cs, (rect.right - 1) // cs + 1):
+                    self._cells.setdefault((cx, cy), []).append((order, name, rect))
+                    touched.add((cx, cy))
+
+        # 칸 안에서는 등록 순서대로 (기존 이름에 rect를 추가한 경우 대비)
+        for key in touched:
+            self._cells[key].sort(key=lambda e: e[0])
+
+    def rects(self, name: str):
+        return self._rects[name]
+
+    # ─────────────────────────────
+    # 미리 계산된 격자 저장 / 복원 (campus_map 바이너리 캐시용)
+    # ─────────────────────────────
+    def export_cells(self):
+        """
+        (cx, cy) -> [(구역 순서, 구역 안 rect 번호), ...]
+        Rect 대신 번호만 담아서 그대로 직렬화할 수 있게 함
+        """
+        rect_ids = {}
+        for name, rects in self._rects.items():
+            for i, rect in enumerate(rects):
+                rect_ids[id(rect)] = i
+        return {
+            key: [(order, rect_ids[id(rect)]) for order, _, rect in entries]
+            for key, entries in self._cells.items()
+        }
+
+    @classmethod
+    def from_cells(cls, zones: dict, cells: dict, cell_size: int = 64):
+        """
+        export_cells()로 뽑아 둔 격자로 바로 인덱스를 만듦 (rect마다 칸 계산을 다시 안 함).
+        zones는 등록 순서대로 name -> [Rect, ...]
+        """
+        index = cls({}, cell_size)
+        names = list(zones)
+        for order, name in enumerate(names):
+            index._order[name] = order
+            index._rects[name] = list(zones[name])
+        rects = [index._rects[name] for name in names]
+        index._cells = {
+            key: [(order, names[order], rects[order][i]) for order, i in entries]
+            for key, entries in cells.items()
+        }
+        return index
+
+    def names(self):
+        return list(self._rects)
+
+    # ─────────────────────────────
+    # 질의
+    # ─────────────────────────────
+    def query_rect(self, rect):
+        """rect와 겹치는 첫 번째 구역 이름, 없으면 None"""
+        cs = self.cell_size
+        best = None
+        for cy in range(rect.top // cs, (rect.bottom - 1) // cs + 1):
+            for cx in range(rect.left // cs, (rect.right - 1) // cs + 1):
+                for order, name, zone_rect in self._cells.get((cx, cy), ()):
+                    if best is not None and order >= best[0]:
+                        break
+                    if rect.colliderect(zone_rect):
+                        best = (order, name)
+                        break
+        return best[1] if best else None
+
+    def query_point(self, x: int, y: int):
+        """(x, y)를 포함하는 첫 번째 구역 이름, 없으면 None"""
+        cs = self.cell_size
+        for _, name, zone_rect in self._cells.get((x // cs, y // cs), ()):
+            if zone_rect.collidepoint(x, y):
+                return name
+        return None